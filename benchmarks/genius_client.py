@@ -0,0 +1,120 @@
+"""Measure lyrics lookups through the asyncio Genius client.
+
+A local stand-in for the Genius public API and lyrics pages answers the
+search and page requests, so only client-side costs are measured: connection
+reuse, streaming the page through the lyrics parser, and how many client
+threads a burst of concurrent lookups needs (the stand-in's are not counted).
+
+Usage: python -m benchmarks.genius_client [--runs N] [--burst N]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from bot.services.genius_client import GeniusClient
+
+LINES = [f"Line {i} of the benchmark lyrics" for i in range(60)]
+SONG = {
+    "id": 1,
+    "title": "Benchmark Song",
+    "url": "",  # Filled in once the stand-in has a port
+    "lyrics_state": "complete",
+    "primary_artist": {"name": "Benchmark Artist"},
+}
+# Real pages carry a few hundred KB of markup and embedded state around the lyrics
+PAGE = (
+    "<html><head>" + "<script>var filler = 1;</script>" * 2000 + "</head><body>"
+    + '<div data-lyrics-container="true"><div class="LyricsHeader__Container">Header</div>'
+    + "<br>".join(LINES[:30]) + "</div><div>Ad</div>"
+    + '<div data-lyrics-container="true"><br/>' + "<br/>".join(LINES[30:]) + "</div>"
+    + '<div class="LyricsFooter__Container">Footer</div>'
+    + "<script>window.__PRELOADED_STATE__ = '" + "x" * 200_000 + "';</script>"
+    + "</body></html>"
+).encode()  # fmt: skip
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/api/search"):
+            hits = [{"index": "song", "type": "song", "result": SONG}]
+            sections = [{"type": "song", "hits": hits}]
+            body = json.dumps({"response": {"sections": sections}}).encode()
+            kind = "application/json"
+        else:
+            body, kind = PAGE, "text/html; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", kind)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _client_threads() -> int:
+    """Threads alive outside the stand-in server's per-connection handlers."""
+    return sum("process_request" not in thread.name for thread in threading.enumerate())
+
+
+async def _run(runs: int, burst: int, root: str) -> None:
+    client = GeniusClient(None, timeout=10, concurrency=8)
+    client.public_api_root = root + "api/"
+
+    async def lookup() -> None:
+        song = await client.search_song("Benchmark Song", "Benchmark Artist")
+        assert song and song.lyrics == "\n".join(LINES), "lyrics were not parsed"
+
+    await lookup()  # Warm up the connection
+    timings: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await lookup()
+        timings.append(time.perf_counter() - start)
+    print(
+        f"{'sequential':>10}: median {statistics.median(timings) * 1000:7.1f} ms, "
+        f"min {min(timings) * 1000:7.1f} ms over {runs} lookups"
+    )
+
+    threads = _client_threads()
+    peak = threads
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(lookup()) for _ in range(burst)]
+    while not all(task.done() for task in tasks):
+        peak = max(peak, _client_threads())
+        await asyncio.sleep(0.001)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'burst':>10}: {burst} lookups in {elapsed * 1000:7.1f} ms, "
+        f"client threads {threads} -> peak {peak}"
+    )
+    await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--burst", type=int, default=32, help="concurrent lookups")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = f"http://127.0.0.1:{server.server_address[1]}/"
+    SONG["url"] = root + "benchmark-song-lyrics"
+
+    asyncio.run(_run(args.runs, args.burst, root))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
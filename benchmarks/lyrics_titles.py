@@ -0,0 +1,184 @@
+"""Measure how often lyrics lookups for real YouTube titles find the right song.
+
+Each corpus entry is a video title and its channel name, as yt-dlp reports
+them, with the Genius song it should resolve to. Lookups run against an
+in-memory stand-in for Genius search that ranks songs by word overlap, and
+whose index holds the corpus songs plus same-named songs by other artists
+and the translation pages that crowd real searches for decorated titles.
+
+Two pipelines are compared:
+- split: the old behaviour, splitting the title on " - " as "Song - Artist".
+- candidates: `lyrics_candidates` with the channel as artist hint, stopping
+  at the first confident match.
+
+Usage: python -m benchmarks.lyrics_titles [--verbose]
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from bot.services import get_lyrics
+from bot.services.genius_client import GeniusClient
+from bot.services.lyrics_cache import LyricsCache
+from bot.services.search_cache import normalize_query
+
+# (video title, channel, Genius title, Genius artist)
+CORPUS: List[Tuple[str, str, str, str]] = [
+    ("Rick Astley - Never Gonna Give You Up (Official Music Video)", "Rick Astley", "Never Gonna Give You Up", "Rick Astley"),
+    ("Queen – Bohemian Rhapsody (Official Video Remastered)", "Queen Official", "Bohemian Rhapsody", "Queen"),
+    ("Luis Fonsi - Despacito ft. Daddy Yankee", "LuisFonsiVEVO", "Despacito", "Luis Fonsi"),
+    ("Ed Sheeran - Shape of You (Official Music Video)", "Ed Sheeran", "Shape of You", "Ed Sheeran"),
+    ("PSY - GANGNAM STYLE(강남스타일) M/V", "officialpsy", "Gangnam Style (강남스타일)", "PSY"),
+    ("Mark Ronson - Uptown Funk (Official Video) ft. Bruno Mars", "Mark Ronson", "Uptown Funk", "Mark Ronson"),
+    ("Wiz Khalifa - See You Again ft. Charlie Puth [Official Video] Furious 7 Soundtrack", "Wiz Khalifa", "See You Again", "Wiz Khalifa"),
+    ("Imagine Dragons - Believer (Official Music Video)", "ImagineDragonsVEVO", "Believer", "Imagine Dragons"),
+    ("Nirvana - Smells Like Teen Spirit (Official Music Video)", "NirvanaVEVO", "Smells Like Teen Spirit", "Nirvana"),
+    ("a-ha - Take On Me (Official Video) [Remastered in 4K]", "a-ha", "Take On Me", "a-ha"),
+    ("Michael Jackson - Billie Jean (Official Video)", "michaeljacksonVEVO", "Billie Jean", "Michael Jackson"),
+    ("Guns N' Roses - Sweet Child O' Mine (Official Music Video)", "GunsNRosesVEVO", "Sweet Child O' Mine", "Guns N' Roses"),
+    ("Eminem - Lose Yourself [HD]", "EminemVEVO", "Lose Yourself", "Eminem"),
+    ("Adele - Hello (Official Music Video)", "AdeleVEVO", "Hello", "Adele"),
+    ("Coldplay - Viva La Vida (Official Video)", "Coldplay", "Viva La Vida", "Coldplay"),
+    ("The Weeknd - Blinding Lights (Official Video)", "TheWeekndVEVO", "Blinding Lights", "The Weeknd"),
+    ("Billie Eilish - bad guy (Official Music Video)", "BillieEilishVEVO", "​bad guy", "Billie Eilish"),
+    ("Linkin Park - Numb (Official Music Video) [4K UPGRADE] – Linkin Park", "Linkin Park", "Numb", "Linkin Park"),
+    ("Bohemian Rhapsody (Remastered 2011)", "Queen - Topic", "Bohemian Rhapsody", "Queen"),
+    ("Blinding Lights", "The Weeknd - Topic", "Blinding Lights", "The Weeknd"),
+    ("Hotel California (2013 Remaster)", "Eagles - Topic", "Hotel California", "Eagles"),
+    ("Here Comes The Sun (Remastered 2009)", "The Beatles - Topic", "Here Comes the Sun", "The Beatles"),
+    ("Mr. Brightside", "The Killers - Topic", "Mr. Brightside", "The Killers"),
+    ("Africa", "TOTO - Topic", "Africa", "TOTO"),
+    ("Dua Lipa - Levitating Featuring DaBaby (Official Music Video)", "Dua Lipa", "Levitating", "Dua Lipa"),
+    ("Toto - Africa (Official HD Video)", "TotoVEVO", "Africa", "TOTO"),
+    ("Fleetwood Mac - Dreams (Official Music Video)", "Fleetwood Mac", "Dreams", "Fleetwood Mac"),
+    ("Daft Punk - Get Lucky (Official Audio) ft. Pharrell Williams, Nile Rodgers", "Daft Punk", "Get Lucky", "Daft Punk"),
+    ("Kendrick Lamar - HUMBLE.", "KendrickLamarVEVO", "HUMBLE.", "Kendrick Lamar"),
+    ("Lady Gaga, Bradley Cooper - Shallow (from A Star Is Born) (Official Music Video)", "LadyGagaVEVO", "Shallow", "Lady Gaga & Bradley Cooper"),
+    ("Lewis Capaldi - Someone You Loved (Lyrics)", "7clouds", "Someone You Loved", "Lewis Capaldi"),
+    ("Tones And I - Dance Monkey (Lyrics)", "Dan Music", "Dance Monkey", "Tones and I"),
+    ("Eagles - Hotel California (Lyrics)", "Rock Lyrics", "Hotel California", "Eagles"),
+    ("BTS (방탄소년단) 'Dynamite' Official MV", "HYBE LABELS", "Dynamite", "BTS (방탄소년단)"),
+    ("BLACKPINK - '뚜두뚜두 (DDU-DU DDU-DU)' M/V", "BLACKPINK", "DDU-DU DDU-DU (뚜두뚜두)", "BLACKPINK"),
+    ("Oasis - Wonderwall (Official Video)", "oasisinetofficial", "Wonderwall", "Oasis"),
+    ("Pharrell Williams - Happy (Video)", "PharrellWilliamsVEVO", "Happy", "Pharrell Williams"),
+    ("OneRepublic - Counting Stars", "OneRepublicVEVO", "Counting Stars", "OneRepublic"),
+    ("Gotye - Somebody That I Used To Know (feat. Kimbra) [Official Music Video]", "gotyemusic", "Somebody That I Used to Know", "Gotye"),
+    ("Avicii - Wake Me Up (Official Video)", "AviciiOfficialVEVO", "Wake Me Up", "Avicii"),
+    ("Survivor - Eye Of The Tiger (Official HD Video)", "SurvivorVEVO", "Eye of the Tiger", "Survivor"),
+    ("Never Gonna Give You Up", "Rick Astley - Topic", "Never Gonna Give You Up", "Rick Astley"),
+    ("Bruno Mars - The Lazy Song (Official Music Video)", "Bruno Mars", "The Lazy Song", "Bruno Mars"),
+    ("Journey - Don't Stop Believin' (Official Audio)", "JourneyVEVO", "Don't Stop Believin'", "Journey"),
+    ("Harry Styles - As It Was (Official Video)", "HarryStylesVEVO", "As It Was", "Harry Styles"),
+    ("Miley Cyrus - Flowers (Official Video)", "MileyCyrusVEVO", "Flowers", "Miley Cyrus"),
+    ("Sia - Chandelier (Official Video)", "SiaVEVO", "Chandelier", "Sia"),
+    ("Beyoncé - Halo", "beyonceVEVO", "Halo", "Beyoncé"),
+    ("Tame Impala - The Less I Know The Better (Official Video)", "tameimpalaVEVO", "The Less I Know the Better", "Tame Impala"),
+    ("Madonna - Music (Official Video) [HD]", "Madonna", "Music", "Madonna"),
+]  # fmt: skip
+
+# Same-named songs by other artists, live versions and non-song pages
+DISTRACTORS: List[Tuple[str, str]] = [
+    ("Hello", "Lionel Richie"), ("Happy", "MARINA"), ("Dreams", "The Cranberries"),
+    ("Numb", "U2"), ("Halo", "Depeche Mode"), ("Believer", "Ozzy Osbourne"),
+    ("Flowers", "Sweet Female Attitude"), ("Dynamite", "Taio Cruz"), ("Music", "John Miles"),
+    ("Africa", "Karol G"), ("Chandelier", "Will Butler"), ("Wonderwall", "Ryan Adams"),
+    ("Hotel California (Live on MTV, 1994)", "Eagles"), ("Bohemian Rhapsody (Live Aid)", "Queen"),
+    ("Blinding Lights (Remix)", "The Weeknd & ROSALÍA"), ("Levitating (Remix)", "Dua Lipa"),
+    ("Whenever You Need Somebody (Tracklist + Album Art)", "Rick Astley"),
+    ("A Night at the Opera (Liner Notes)", "Queen"), ("Smells Like Teen Spirit", "Tori Amos"),
+    ("Take On Me", "Weezer"), ("Shape of You", "Galantis"), ("Despacito (Remix)", "Luis Fonsi"),
+]  # fmt: skip
+
+TRANSLATED = 15  # Corpus songs that also get a "Genius Traducciones" page
+
+
+def _index() -> List[Dict[str, Any]]:
+    songs = [(title, artist) for _, _, title, artist in CORPUS] + DISTRACTORS
+    songs += [
+        (f"{artist} - {title} (Traducción al Español)", "Genius Traducciones al Español")
+        for _, _, title, artist in CORPUS[:TRANSLATED]
+    ]
+    index = []
+    for number, (title, artist) in enumerate(dict.fromkeys(songs)):
+        index.append({
+            "id": number,
+            "title": title,
+            "url": f"https://genius.com/songs/{number}",
+            "lyrics_state": "complete",
+            "primary_artist": {"name": artist},
+        })  # fmt: skip
+    return index
+
+
+class StandInClient(GeniusClient):
+    """GeniusClient whose requests are answered from an in-memory index."""
+
+    def __init__(self, index: List[Dict[str, Any]]) -> None:
+        super().__init__("benchmark", timeout=10, concurrency=8)
+        self.index = index
+
+    async def _get_json(self, url: str, query: str, authenticated: bool = False) -> Dict[str, Any]:
+        self.requests += 1
+        words = set(normalize_query(query).split())
+        scored = []
+        for song in self.index:
+            document = set(normalize_query(f"{song['title']} {song['primary_artist']['name']}").split())
+            shared = len(words & document)
+            if shared:
+                # Coverage of the song's words, lowered by query words it lacks
+                scored.append((shared / len(document) - 0.05 * len(words - document), song["id"]))
+        scored.sort(reverse=True)
+        return {"hits": [{"type": "song", "result": self.index[i]} for _, i in scored[:10]]}
+
+    async def page_lyrics(self, url: str) -> Optional[str]:
+        self.requests += 1
+        return f"Lyrics of {url}"
+
+
+async def _split(client: StandInClient, title: str, channel: str) -> Optional[Tuple[str, str]]:
+    name, artist = get_lyrics.split_query(title)
+    song = await client.search_song(name, artist)
+    return (song.title, song.artist) if song else None
+
+
+async def _candidates(client: StandInClient, title: str, channel: str) -> Optional[Tuple[str, str]]:
+    entry = await get_lyrics._search(title, channel)
+    return (entry.title, entry.artist) if entry.found else None
+
+
+async def _measure(name: str, lookup, verbose: bool) -> None:
+    client = StandInClient(_index())
+    get_lyrics._genius = client
+    get_lyrics._cache = LyricsCache(Path(tempfile.mkdtemp()) / "lyrics.sqlite3", 3600, 3600)
+
+    right = wrong = 0
+    for title, channel, song, artist in CORPUS:
+        found = await lookup(client, title, channel)
+        expected = (normalize_query(song), normalize_query(artist))
+        if found and (normalize_query(found[0]), normalize_query(found[1])) == expected:
+            right += 1
+        else:
+            wrong += bool(found)
+            if verbose:
+                print(f"  {name}: {title!r} -> {found}")
+    total = len(CORPUS)
+    print(
+        f"{name:>10}: {right}/{total} right ({right / total:.0%}), {wrong} wrong songs, "
+        f"{total - right - wrong} not found, {client.requests / total:.2f} requests per lookup"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--verbose", action="store_true", help="print every failed lookup")
+    args = parser.parse_args()
+
+    asyncio.run(_measure("split", _split, args.verbose))
+    asyncio.run(_measure("candidates", _candidates, args.verbose))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compare the player's old list-backed queue against `TrackQueue` up to the queue limit.
+
+Each workload mirrors a player operation: playing through the queue (head
+pops), loop mode and stream retries (head pushes), and /skip of a middle
+index or range. Building the queue is not timed.
+
+Usage: python -m benchmarks.track_queue [--sizes 50 1000 5000]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from bot.services.track_queue import TrackQueue
+from bot.utils.config import MAX_QUEUE_LENGTH
+from bot.services.yt_source import Track
+
+Workload = Callable[[Any, Sequence[Track]], None]
+
+
+def _tracks(count: int) -> List[Track]:
+    return [
+        Track(
+            title=f"Track {i}",
+            url=f"https://youtu.be/{i:011d}",
+            audio_url="",
+            duration=180 + i % 120,
+        )
+        for i in range(count)
+    ]
+
+
+# ========== LIST ==========
+def _list_drain(queue: List[Track], tracks: Sequence[Track]) -> None:
+    while queue:
+        queue.pop(0)
+
+
+def _list_push_head(queue: List[Track], tracks: Sequence[Track]) -> None:
+    for track in tracks:
+        queue.insert(0, track)
+
+
+def _list_skip_middle(queue: List[Track], tracks: Sequence[Track]) -> None:
+    for _ in range(len(tracks) // 2):
+        del queue[len(queue) // 2]
+
+
+def _list_skip_ranges(queue: List[Track], tracks: Sequence[Track]) -> None:
+    while len(queue) > 10:
+        start = len(queue) // 3
+        del queue[start : start + 10]
+
+
+# ========== TRACK QUEUE ==========
+def _queue_drain(queue: TrackQueue, tracks: Sequence[Track]) -> None:
+    while queue:
+        queue.popleft()
+
+
+def _queue_push_head(queue: TrackQueue, tracks: Sequence[Track]) -> None:
+    for track in tracks:
+        queue.appendleft(track)
+
+
+def _queue_skip_middle(queue: TrackQueue, tracks: Sequence[Track]) -> None:
+    for _ in range(len(tracks) // 2):
+        queue.pop(len(queue) // 2)
+
+
+def _queue_skip_ranges(queue: TrackQueue, tracks: Sequence[Track]) -> None:
+    while len(queue) > 10:
+        start = len(queue) // 3
+        queue.pop_range(start, start + 10)
+
+
+WORKLOADS: Dict[str, Tuple[Workload, Workload]] = {
+    "drain": (_list_drain, _queue_drain),
+    "push head": (_list_push_head, _queue_push_head),
+    "skip middle": (_list_skip_middle, _queue_skip_middle),
+    "skip ranges": (_list_skip_ranges, _queue_skip_ranges),
+}
+
+
+def _time(workload: Workload, queue: Any, tracks: Sequence[Track]) -> float:
+    start = time.perf_counter()
+    workload(queue, tracks)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 1000, MAX_QUEUE_LENGTH])
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'workload':>12} {'list':>10} {'TrackQueue':>11} {'speedup':>8}")
+    for size in args.sizes:
+        tracks = _tracks(size)
+        for name, (baseline, candidate) in WORKLOADS.items():
+            before = _time(baseline, list(tracks), tracks)
+            after = _time(candidate, TrackQueue(tracks), tracks)
+            print(
+                f"{size:>6} {name:>12} {before * 1000:>8.2f}ms {after * 1000:>9.2f}ms "
+                f"{before / after:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
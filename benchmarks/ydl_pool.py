@@ -0,0 +1,60 @@
+"""Compare cold `YoutubeDL` construction per call against the warm per-thread pool.
+
+Usage: python -m benchmarks.ydl_pool [URL] [--runs N]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from yt_dlp import YoutubeDL
+
+from bot.services.ydl_pool import YDLPool
+
+OPTIONS = {
+    "format": "bestaudio/best",
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "noplaylist": True,
+}
+
+
+def _measure(label: str, runs: int, func: Callable[[], None]) -> List[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    print(
+        f"{label:>7}: median {statistics.median(timings) * 1000:8.1f} ms, "
+        f"min {min(timings) * 1000:8.1f} ms over {runs} runs"
+    )
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("url", nargs="?", default="https://www.youtube.com/watch?v=jNQXAC9IVRw")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    def cold() -> None:
+        with YoutubeDL(dict(OPTIONS)) as ydl:
+            ydl.extract_info(args.url, download=False)
+
+    pool = YDLPool({"track": OPTIONS})
+
+    def pooled() -> None:
+        with pool.checkout("track") as ydl:
+            ydl.extract_info(args.url, download=False)
+
+    cold_timings = _measure("cold", args.runs, cold)
+    pooled_timings = _measure("pooled", args.runs, pooled)
+    saved = statistics.median(cold_timings) - statistics.median(pooled_timings)
+    print(f"  saved: {saved * 1000:8.1f} ms per extraction ({pool.snapshot()})")
+
+
+if __name__ == "__main__":
+    main()
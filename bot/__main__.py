@@ -8,7 +8,10 @@ import discord
 from discord.ext import commands
 
 from bot.services.channel_service import ChannelService
+from bot.services.timer_wheel import TimerWheel
+from bot.services.voice_router import VoiceRouter
 from bot.utils.config import DISCORD_TOKEN
+from bot.utils.executors import shutdown_executors
 from bot.utils.logger import setup_logger
 
 
@@ -25,6 +28,8 @@ class MyBot(commands.Bot):
 
         self.logger = setup_logger(name="bot")
         self.channel_service: ChannelService | None = None
+        self.voice_router = VoiceRouter()
+        self.timers = TimerWheel()
 
     async def setup_hook(self) -> None:
         """Initialize bot services and load extensions"""
@@ -77,6 +82,21 @@ class MyBot(commands.Bot):
             self.logger.info(f"Connected to {len(self.guilds)} guilds")
         await self.ensure_channels()
 
+    async def on_voice_state_update(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ) -> None:
+        """Route voice state changes to the cogs watching the channels involved"""
+        await self.voice_router.dispatch(member, before, after)
+
+    async def close(self) -> None:
+        """Shut down the bot, its timers and its blocking-work pools."""
+        await super().close()
+        self.timers.close()
+        shutdown_executors()
+
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         """Clean up resources when bot is removed from a guild"""
         self.logger.info(f"Removed from guild: {guild.name} (ID: {guild.id})")
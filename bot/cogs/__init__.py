@@ -2,7 +2,7 @@
 Core initialization for cogs, providing base classes and utilities.
 """
 
-from typing import TYPE_CHECKING, Dict, Callable, Any
+from typing import TYPE_CHECKING, Callable, Any
 
 import discord
 from discord import app_commands
@@ -87,10 +87,3 @@ def channel_allowed(cog_name: str) -> Callable[[Any], Any]:
         )
 
     return app_commands.check(predicate)
-
-
-# ========== MEDIA SETTINGS ==========
-DISCORD_FFMPEG_OPTIONS: Dict[str, str] = {
-    "before_options": "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5",
-    "options": "-vn",
-}
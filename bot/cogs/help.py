@@ -119,6 +119,7 @@ class HelpCog(BaseCog):
                     "🔁 /music loop - Repeat that amazing track over and over",
                     "🧹 /music clear - Start fresh, clear the entire queue",
                     "📝 /music lyrics [song] - Sing along! Get lyrics for any song",
+                    "📈 /music stats - Peek at how much work the music caches save",
                     "🚪 /music leave - Time to go, leave the voice channel",
                 ],
                 "footer": "🌟 Supports YouTube/SoundCloud URLs, playlists, and any search terms you can think of!",
@@ -177,6 +178,7 @@ class HelpCog(BaseCog):
                 "commands": [
                     "🏓 /ping - Check how fast the bot responds (latency test)",
                     "📊 /server-stats - View detailed statistics about your server",
+                    "🧵 /bot-stats - See how busy the bot's background workers are",
                     "🧹 /clear [amount] - Clean up chat by deleting messages (1-100, requires Manage Messages permission)",
                 ],
                 "footer": "🔐 Some commands require special permissions to prevent misuse",
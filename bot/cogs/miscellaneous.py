@@ -4,6 +4,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from bot.utils.executors import EXECUTORS
+
 from . import BaseCog, channel_allowed
 
 if TYPE_CHECKING:
@@ -101,6 +103,58 @@ class Miscellaneous(BaseCog, commands.Cog):
 
         await interaction.response.send_message(embed=embed)
 
+    # ========== BOT STATS ==========
+    @app_commands.command(name="bot-stats", description="🧵 View bot worker pool load")
+    @channel_allowed(__file__)
+    async def internals(self, interaction: discord.Interaction) -> None:
+        """Display per-pool queue length, active workers and wait times, plus voice event routing and timers"""
+        embed = discord.Embed(title="🧵 Bot Internals", color=discord.Color.blue())
+
+        for name, executor in EXECUTORS.items():
+            stats = executor.snapshot()
+            embed.add_field(
+                name=f"Pool: {name}",
+                value=(
+                    f"Active: {stats['active']}/{stats['workers']}\n"
+                    f"Queued: {stats['queued']}\n"
+                    f"Wait: {stats['avg_wait_ms']}ms avg, {stats['max_wait_ms']}ms max\n"
+                    f"Done: {stats['completed']}, rejected: {stats['rejected']}"
+                ),
+                inline=True,
+            )
+
+        voice = self.bot.voice_router.snapshot()
+        handler_lines = [
+            f"{name}: {stats['calls']} calls, {stats['avg_ms']}ms avg, {stats['max_ms']}ms max"
+            + (f", {stats['errors']} failed" if stats["errors"] else "")
+            for name, stats in voice["handlers"].items()
+        ]
+        embed.add_field(
+            name="Voice Events",
+            value="\n".join(
+                [
+                    f"Rate: {voice['per_second']}/s (last minute)",
+                    f"Routed: {voice['routed']}/{voice['events']}, "
+                    f"watching {voice['watched']} channel(s)",
+                    *handler_lines,
+                ]
+            ),
+            inline=False,
+        )
+
+        timers = self.bot.timers.snapshot()
+        embed.add_field(
+            name="Timers",
+            value=(
+                f"Pending: {timers['pending']}, running: {timers['running']}\n"
+                f"Late: {timers['avg_late_ms']}ms avg, {timers['max_late_ms']}ms max\n"
+                f"Fired: {timers['fired']}, cancelled: {timers['cancelled']}"
+            ),
+            inline=False,
+        )
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(Miscellaneous(bot))
@@ -1,22 +1,96 @@
 import asyncio
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from random import shuffle
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
-
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import aiohttp
 import discord
 from discord import app_commands, ui
 from discord.ext import commands
 
-from bot.services.get_lyrics import get_lyrics
-from bot.services.yt_source import Track, TrackFetcher
+from bot.services.audio_cache import AudioCache
+from bot.services.audio_source import (
+    can_skip_probe,
+    create_audio_source,
+    open_audio_source,
+)
+from bot.services.get_lyrics import (
+    close_lyrics,
+    get_genius,
+    get_lyrics,
+    get_lyrics_cache,
+    prefetch_lyrics,
+    prefetch_stats,
+    split_query,
+)
+from bot.services.now_playing import NowPlayingPanel, PanelStats
+from bot.services.outbox import Outbox
+from bot.services.player_store import PlayerStore
+from bot.services.timer_wheel import Timer
+from bot.services.track_cache import STREAM_EXPIRY_MARGIN
+from bot.services.track_queue import TrackQueue
+from bot.services.yt_source import Track, TrackFetcher, format_duration
 
 if TYPE_CHECKING:
     from . import MyBot
 
-from bot.utils.config import MAX_QUEUE_LENGTH
-
-from . import DISCORD_FFMPEG_OPTIONS, EMBED_COLOR, BaseCog, channel_allowed
+from bot.utils.config import (
+    AUDIO_CACHE_DIR,
+    AUDIO_CACHE_MAX_BYTES,
+    DISCORD_FFMPEG_OPTIONS,
+    MAX_QUEUE_LENGTH,
+    PLAYER_STATE_PATH,
+    PLAYLIST_RESOLVE_CONCURRENCY,
+    PREFETCH_AHEAD,
+)
+
+from . import EMBED_COLOR, BaseCog, channel_allowed
+
+GAP_SAMPLES = 100  # Number of recent inter-track gaps kept per source kind
+SOURCE_TIMEOUT = 30  # seconds allowed for probing a stream
+STREAM_REFRESH_INTERVAL = 60  # seconds between stream URL expiry sweeps
+STREAM_REFRESH_HORIZON = 30 * 60  # only refresh tracks due to start within this window
+STREAM_START_WINDOW = 5  # failures this soon after start are treated as a dead URL
+STREAM_EARLY_END = 10  # seconds short of a track's duration that count as a dead stream
+POSITION_SAVE_INTERVAL = 15  # seconds between persisted playback positions
+RESTORE_CONCURRENCY = 4  # Guilds rejoined at once after a restart
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord limits per message
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+LYRICS_PAGINATE_AFTER = 2  # Messages beyond which lyrics become one paginated message
+PROGRESS_EDIT_INTERVAL = 2  # seconds between in-place progress message edits
+
+
+def pack_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Group embeds into as few messages as Discord's per-message limits allow."""
+    messages: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    size = 0
+    for embed in embeds:
+        length = len(embed)  # Characters Discord counts: title, description, footer...
+        if current and (
+            len(current) >= MAX_EMBEDS_PER_MESSAGE
+            or size + length > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            messages.append(current)
+            current, size = [], 0
+        current.append(embed)
+        size += length
+    if current:
+        messages.append(current)
+    return messages
 
 
 # ========== MUSIC CLASS ==========
@@ -29,23 +103,114 @@ class PlayerState(Enum):
     STOPPED = auto()
 
 
+@dataclass
+class PreparedSource:
+    """Probe results for the next track, ready to build an audio source from."""
+
+    track: Track
+    audio_url: str
+    codec: Optional[str]
+    bitrate: Optional[int]
+
+
+@dataclass
+class GapStats:
+    """Silence between tracks, split by whether the source was prepared ahead."""
+
+    prepared: Deque[float] = field(default_factory=lambda: deque(maxlen=GAP_SAMPLES))
+    probed: Deque[float] = field(default_factory=lambda: deque(maxlen=GAP_SAMPLES))
+
+    def record(self, gap: float, was_prepared: bool) -> None:
+        (self.prepared if was_prepared else self.probed).append(gap)
+
+    @staticmethod
+    def _summary(samples: Deque[float]) -> str:
+        if not samples:
+            return "n/a"
+        return f"{sum(samples) / len(samples) * 1000:.0f}ms avg ({len(samples)})"
+
+    def snapshot(self) -> Dict[str, str]:
+        return {
+            "prepared": self._summary(self.prepared),
+            "probed": self._summary(self.probed),
+        }
+
+
 @dataclass
 class MusicPlayer:
     """Abstract base class for a media player managing playback state and queue."""
 
     voice_client: Optional[discord.VoiceClient] = None
     current_item: Optional[Track] = None
-    queue: List[Track] = field(default_factory=list)
+    queue: TrackQueue = field(default_factory=TrackQueue)
     state: PlayerState = PlayerState.IDLE
     loop: bool = False
+    prefetch_tasks: Dict[int, asyncio.Task] = field(default_factory=dict)
+    resolve_slots: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(PLAYLIST_RESOLVE_CONCURRENCY)
+    )
+    prepared: Optional[PreparedSource] = None
+    prepare_target: Optional[Track] = None
+    prepare_task: Optional[asyncio.Task] = None
+    track_ended_at: Optional[float] = None
+    started_at: Optional[float] = None
+    paused_at: Optional[float] = None
+    stream_retried: Optional[Track] = None
+    stop_requested: bool = False  # The current track was stopped on purpose (skip, leave)
+    text_channel_id: Optional[int] = None
+    resume_at: Optional[float] = None  # Seconds to seek into the next track after restore
+    now_playing: Optional[NowPlayingPanel] = None
 
     @property
     def is_active(self) -> bool:
         """Check if the player is currently playing or paused."""
         return self.state in (PlayerState.PLAYING, PlayerState.PAUSED)
 
+    @property
+    def next_track(self) -> Optional[Track]:
+        """The track that will play once the current one finishes."""
+        if self.loop and self.current_item:
+            return self.current_item
+        return self.queue[0] if self.queue else None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds played of the current track."""
+        if self.started_at is None:
+            return 0.0
+        return (self.paused_at or time.monotonic()) - self.started_at
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left of the current track (0 if unknown)."""
+        track = self.current_item
+        if not track or not track.duration or self.started_at is None:
+            return 0.0
+        return max(0.0, track.duration - self.elapsed)
+
+    def projected_starts(self) -> Iterator[Tuple[Track, float]]:
+        """Yield each queued track with the seconds until it is expected to start."""
+        offset = self.remaining
+        for track in self.queue:
+            yield track, offset
+            offset += track.duration or 0
+
+    def invalidate_prepared(self) -> None:
+        """Drop any prepared or in-flight source for the next track."""
+        if self.prepare_task:
+            self.prepare_task.cancel()
+        self.prepare_task = None
+        self.prepare_target = None
+        self.prepared = None
+
     def clear(self) -> None:
         """Clear the queue and reset state."""
+        for task in self.prefetch_tasks.values():
+            task.cancel()
+        self.prefetch_tasks.clear()
+        self.invalidate_prepared()
+        if self.now_playing:
+            self.now_playing.close()
         self.queue.clear()
         self.current_item = None
         self.state = PlayerState.IDLE
@@ -53,12 +218,17 @@ class MusicPlayer:
 
     def shuffle_queue(self) -> None:
         """Shuffle the current queue."""
-        shuffle(self.queue)
+        self.queue.shuffle()
+
+    def stop_playback(self) -> None:
+        """Stop the current track on purpose, so its early end isn't taken for a dead stream."""
+        self.stop_requested = True
+        self.voice_client.stop()
 
     def skip_current(self) -> Optional[Track]:
         """Skip the currently playing track."""
         if self.voice_client and self.voice_client.is_playing():
-            self.voice_client.stop()
+            self.stop_playback()
         return self.current_item
 
     def skip_index(self, index: int) -> List[Track]:
@@ -68,14 +238,11 @@ class MusicPlayer:
         """
         if index == 0:
             if self.voice_client and self.voice_client.is_playing():
-                self.voice_client.stop()
+                self.stop_playback()
                 return [self.current_item] if self.current_item else []
             return []
         elif 1 <= index <= len(self.queue):
-            idx = index - 1
-            skipped = [self.queue[idx]]
-            del self.queue[idx]
-            return skipped
+            return [self.queue.pop(index - 1)]
         return []
 
     def skip_range(self, start: int, end: int) -> List[Track]:
@@ -91,19 +258,13 @@ class MusicPlayer:
 
         if start == 0:
             if self.voice_client and self.voice_client.is_playing():
-                self.voice_client.stop()
+                self.stop_playback()
                 if self.current_item:
                     skipped.append(self.current_item)
             start = 1
             end = max(end, 1)
 
-        start_idx = start - 1
-        end_idx = min(end - 1, len(self.queue) - 1)
-
-        if start_idx <= end_idx and start_idx < len(self.queue):
-            skipped.extend(self.queue[start_idx : end_idx + 1])
-            del self.queue[start_idx : end_idx + 1]
-
+        skipped.extend(self.queue.pop_range(start - 1, end))
         return skipped
 
 
@@ -242,6 +403,55 @@ class PlaylistSelectionView(ui.View):
         await self.cleanup()
 
 
+class LyricsPaginator(ui.View):
+    """Single message that flips through pages of lyrics embeds."""
+
+    def __init__(self, pages: List[List[discord.Embed]], user_id: int):
+        super().__init__(timeout=300)
+        self.pages = pages
+        self.user_id = user_id
+        self.page = 0
+        self.message: Optional[discord.Message] = None
+        self._update_buttons()
+
+    def _update_buttons(self) -> None:
+        self.previous.disabled = self.page == 0
+        self.next.disabled = self.page == len(self.pages) - 1
+        self.counter.label = f"{self.page + 1}/{len(self.pages)}"
+
+    async def _show(self, interaction: discord.Interaction, page: int) -> None:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                "You didn't initiate this request!", ephemeral=True
+            )
+            return
+        self.page = page
+        self._update_buttons()
+        await interaction.response.edit_message(embeds=self.pages[page], view=self)
+
+    @ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await self._show(interaction, self.page - 1)
+
+    @ui.button(label="1/1", style=discord.ButtonStyle.secondary, disabled=True)
+    async def counter(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        pass
+
+    @ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: ui.Button) -> None:
+        await self._show(interaction, self.page + 1)
+
+    async def on_timeout(self) -> None:
+        """Disable the buttons, leaving the current page in place."""
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+
 # ========== MUSIC COG ==========
 class MusicCog(BaseCog, commands.GroupCog, name="music"):
     """Music commands for playing, managing, and controlling audio playback."""
@@ -253,29 +463,81 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
         self.bot = bot
         self.players: Dict[int, MusicPlayer] = {}
         self.logger = bot.logger.getChild("music")
-        self._idle_tasks: Dict[int, asyncio.Task] = {}
+        self._idle_timers: Dict[int, Timer] = {}
+        self._voice_channels: Dict[int, int] = {}  # guild_id -> channel the bot is in
+        self.gap_stats = GapStats()
+        self.panel_stats = PanelStats()
+        self.outbox = Outbox()
+        self._stream_refresh_task: Optional[asyncio.Task] = None
+        self._stream_session: Optional[aiohttp.ClientSession] = None
+        self.player_store = PlayerStore(PLAYER_STATE_PATH)
+        self._restores: Dict[int, asyncio.Task] = {}
+        self._restoring: Set[int] = set()
+        self._background_tasks: List[asyncio.Task] = []
+        self.audio_cache: Optional[AudioCache] = (
+            AudioCache(AUDIO_CACHE_DIR, AUDIO_CACHE_MAX_BYTES)
+            if AUDIO_CACHE_MAX_BYTES
+            else None
+        )
+
+    # ========== LOADER ==========
+    async def cog_load(self) -> None:
+        """Open caches and state, then restore players and start maintenance in the background."""
+        self.bot.voice_router.add_handler("music", self._on_voice_state)
+        if self.audio_cache:
+            await self.audio_cache.open()
+        await self.player_store.open()
+        self._stream_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+        )
+        self._stream_refresh_task = asyncio.create_task(self._refresh_streams_loop())
+        self._background_tasks = [
+            asyncio.create_task(self._restore_players()),
+            asyncio.create_task(self._save_positions_loop()),
+        ]
 
     # ========== UNLOADER ==========
     async def cog_unload(self) -> None:
-        """Clean up resources when the cog is unloaded."""
-        for task in self._idle_tasks.values():
+        """Save player state, then clean up resources when the cog is unloaded."""
+        if self._stream_refresh_task:
+            self._stream_refresh_task.cancel()
+        for task in [*self._background_tasks, *self._restores.values()]:
             task.cancel()
-        self._idle_tasks.clear()
+        self.outbox.close()
+        self._save_positions()
+        # Closing the store first keeps the disconnects below out of the journal
+        await self.player_store.close()
+        for timer in self._idle_timers.values():
+            timer.cancel()
+        self._idle_timers.clear()
+        self.bot.voice_router.remove_handler("music")
+        self._voice_channels.clear()
         for player in list(self.players.values()):
             if player.voice_client:
                 await player.voice_client.disconnect()
         self.players.clear()
-
-    # ========== LISTENERS ==========
-    @commands.Cog.listener()
-    async def on_voice_state_update(
+        if self._stream_session:
+            await self._stream_session.close()
+        await close_lyrics()
+
+    # ========== VOICE EVENTS ==========
+    def _watch_voice(self, guild_id: int, channel_id: Optional[int]) -> None:
+        """Route voice updates for the bot's current channel in a guild to this cog."""
+        self.bot.voice_router.unwatch("music", self._voice_channels.pop(guild_id, None))
+        if channel_id is not None:
+            self._voice_channels[guild_id] = channel_id
+            self.bot.voice_router.watch("music", channel_id)
+
+    async def _on_voice_state(
         self,
         member: discord.Member,
         before: discord.VoiceState,
         after: discord.VoiceState,
     ) -> None:
-        """Handle voice state changes including auto-disconnect."""
+        """Handle joins and leaves in the bot's channel, including auto-disconnect."""
         if member == self.bot.user:
+            # Moved or disconnected by someone else
+            self._watch_voice(member.guild.id, after.channel.id if after.channel else None)
             return
 
         player = self.players.get(member.guild.id)
@@ -290,30 +552,32 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             )
 
     # ========== HELPERS ==========
-    def _cancel_idle_task(self, guild_id: int) -> None:
-        task = self._idle_tasks.pop(guild_id, None)
-        if task:
-            task.cancel()
+    def _cancel_idle_timer(self, guild_id: int) -> None:
+        timer = self._idle_timers.pop(guild_id, None)
+        if timer:
+            timer.cancel()
 
     def _schedule_idle_disconnect(self, guild: discord.Guild) -> None:
-        self._cancel_idle_task(guild.id)
-
-        async def _disconnect_after_idle() -> None:
-            await asyncio.sleep(self.IDLE_TIMEOUT)
-            self.logger.info(f"Idle timeout reached in {guild.name}, disconnecting")
-            await self._cleanup_player(guild)
+        self._cancel_idle_timer(guild.id)
+        self._idle_timers[guild.id] = self.bot.timers.schedule(
+            self.IDLE_TIMEOUT, self._disconnect_idle, guild
+        )
 
-        self._idle_tasks[guild.id] = asyncio.create_task(_disconnect_after_idle())
+    async def _disconnect_idle(self, guild: discord.Guild) -> None:
+        self._idle_timers.pop(guild.id, None)
+        self.logger.info(f"Idle timeout reached in {guild.name}, disconnecting")
+        await self._cleanup_player(guild)
 
     async def _cleanup_player(self, guild: discord.Guild) -> None:
         """Clean up player resources for a guild with proper error handling."""
-        self._cancel_idle_task(guild.id)
+        self._cancel_idle_timer(guild.id)
+        self._watch_voice(guild.id, None)
         player = self.players.get(guild.id)
         if player:
             try:
                 if player.voice_client:
                     if player.voice_client.is_playing():
-                        player.voice_client.stop()
+                        player.stop_playback()
                     await asyncio.wait_for(
                         player.voice_client.disconnect(), timeout=5.0
                     )
@@ -324,33 +588,146 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             finally:
                 player.clear()
                 del self.players[guild.id]
+                self.player_store.record(guild.id, "remove")
 
     async def _ensure_voice(
         self, interaction: discord.Interaction
     ) -> Optional[MusicPlayer]:
-        """Ensure the bot is in a voice channel with the user."""
+        """Ensure the bot is in a voice channel with the user.
+
+        Defers the interaction first: restoring a saved player and connecting
+        can take longer than Discord waits for a response.
+        """
         if not interaction.user.voice:
             await interaction.response.send_message(
                 "🔊 You must be in a voice channel to use this command.", ephemeral=True
             )
             return None
 
-        if interaction.guild.id not in self.players:
-            self.players[interaction.guild.id] = MusicPlayer()
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        guild_id = interaction.guild.id
+        await self._restore_now(guild_id)
+        if guild_id not in self.players:
+            self.players[guild_id] = self._new_player(guild_id)
 
-        player = self.players[interaction.guild.id]
+        player = self.players[guild_id]
+        channel = interaction.user.voice.channel
 
         if not player.voice_client:
-            player.voice_client = await interaction.user.voice.channel.connect()
+            player.voice_client = await channel.connect()
             self.logger.info(
-                f"Joined voice channel {interaction.user.voice.channel.name} "
-                f"in guild {interaction.guild.name}"
+                f"Joined voice channel {channel.name} in guild {interaction.guild.name}"
             )
-        elif player.voice_client.channel != interaction.user.voice.channel:
-            await player.voice_client.move_to(interaction.user.voice.channel)
+        elif player.voice_client.channel != channel:
+            await player.voice_client.move_to(channel)
+        self._watch_voice(guild_id, channel.id)
+
+        if player.text_channel_id is None:
+            player.text_channel_id = interaction.channel_id
+        self.player_store.record(guild_id, "voice", channel.id, player.text_channel_id)
+        return player
 
+    # ========== PERSISTENCE ==========
+    def _new_player(self, guild_id: int, tracks: List[Track] = ()) -> MusicPlayer:
+        """Create a player whose queue changes (after `tracks`) are journaled."""
+        player = MusicPlayer(queue=TrackQueue(tracks))
+        player.queue.listener = lambda op, *args: self.player_store.record(
+            guild_id, op, *args
+        )
         return player
 
+    def _save_positions(self) -> None:
+        for guild_id, player in self.players.items():
+            if player.is_active:
+                self.player_store.record(guild_id, "position", round(player.elapsed, 1))
+
+    async def _save_positions_loop(self) -> None:
+        """Periodically persist how far into its track each player is."""
+        while True:
+            await asyncio.sleep(POSITION_SAVE_INTERVAL)
+            self._save_positions()
+
+    async def _restore_players(self) -> None:
+        """Restore saved players guild by guild once the bot is connected."""
+        await self.bot.wait_until_ready()
+        guild_ids = await self.player_store.guild_ids()
+        if not guild_ids:
+            return
+
+        self.logger.info(f"Restoring saved players for {len(guild_ids)} guild(s)")
+        slots = asyncio.Semaphore(RESTORE_CONCURRENCY)
+
+        async def _restore(guild_id: int) -> None:
+            async with slots:
+                self._restoring.add(guild_id)
+                try:
+                    await self._restore_player(guild_id)
+                finally:
+                    self._restoring.discard(guild_id)
+
+        for guild_id in guild_ids:
+            if guild_id not in self.players:
+                task = asyncio.create_task(_restore(guild_id))
+                self._restores[guild_id] = task
+                task.add_done_callback(
+                    lambda _, guild_id=guild_id: self._restores.pop(guild_id, None)
+                )
+
+    async def _restore_now(self, guild_id: int) -> None:
+        """Restore a guild ahead of its turn when someone uses the player."""
+        task = self._restores.get(guild_id)
+        if not task:
+            return
+        if guild_id in self._restoring:
+            await asyncio.shield(task)
+        else:
+            task.cancel()  # Still waiting for a slot, nothing to undo
+            await self._restore_player(guild_id)
+
+    async def _restore_player(self, guild_id: int) -> None:
+        """Rebuild one guild's player from its saved state and resume playback."""
+        guild = self.bot.get_guild(guild_id)
+        saved = await self.player_store.load(guild_id)
+        if not guild or not saved or (not saved.queue and not saved.current):
+            self.player_store.record(guild_id, "remove")
+            return
+        if guild_id in self.players:
+            return  # Someone started a new session while we were loading
+
+        current = saved.current_track
+        tracks = [current, *saved.tracks] if current else saved.tracks
+        player = self._new_player(guild_id, tracks)
+        if current:
+            # The interrupted track now heads the queue; journal it there too, or
+            # the pop that starts it would drop the first track queued behind it
+            self.player_store.record(guild_id, "current", None)
+            self.player_store.record(guild_id, "replace", tracks)
+            self.player_store.record(guild_id, "position", saved.position)
+        player.text_channel_id = saved.text_channel_id
+        player.resume_at = saved.position or None
+        player.loop = saved.loop
+        self.players[guild_id] = player
+
+        channel = guild.get_channel(saved.channel_id) if saved.channel_id else None
+        listeners = [m for m in getattr(channel, "members", []) if not m.bot]
+        if not isinstance(channel, discord.VoiceChannel) or not listeners:
+            self.logger.info(f"Restored queue for {guild.name} without rejoining voice")
+            return
+
+        try:
+            player.voice_client = await channel.connect()
+        except Exception as e:
+            self.logger.warning(f"Could not rejoin voice in {guild.name}: {e}")
+            return
+        self._watch_voice(guild_id, channel.id)
+
+        self.logger.info(
+            f"Restored player in {guild.name}: {len(player.queue)} track(s), "
+            f"resuming at {player.resume_at or 0:.0f}s"
+        )
+        await self._play_next(guild_id, player.text_channel_id)
+
     # ========== JOIN ==========
     @app_commands.command(name="join", description="➕ Joins your voice channel.")
     @channel_allowed(__file__)
@@ -359,7 +736,7 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
         self.logger.debug(f"User @{interaction.user.name} invoked /join")
         player = await self._ensure_voice(interaction)
         if player:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"✅ Joined {player.voice_client.channel.name}"
             )
 
@@ -411,8 +788,6 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
         if not player:
             return
 
-        await interaction.response.defer()
-
         if len(player.queue) >= MAX_QUEUE_LENGTH:
             self.logger.warning("Queue is full")
             await interaction.followup.send(
@@ -464,15 +839,33 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
 
         return indices
 
+    def _create_playlist_embed(self, track_count: int, loading: bool) -> discord.Embed:
+        """Build the playlist selection embed with the number of tracks found so far."""
+        found = (
+            f"Found {track_count} tracks so far, still loading..."
+            if loading
+            else f"Found {track_count} tracks in playlist."
+        )
+        embed = discord.Embed(
+            title="📜 Playlist Selection",
+            description=f"{found}\n\nSelect which tracks to add:",
+            color=EMBED_COLOR,
+        )
+        embed.add_field(
+            name="Options",
+            value="• **Add All** - Add all tracks\n• **Custom Selection** - Choose specific tracks or ranges",
+            inline=False,
+        )
+        embed.set_footer(text="Selection will timeout in 60 seconds")
+        return embed
+
     async def _handle_playlist(
         self, interaction: discord.Interaction, player: MusicPlayer, playlist_url: str
     ) -> None:
-        """Handle playlist URL with track selection."""
-        # Collect all track URLs first
-        track_urls = []
+        """Handle playlist URL with track selection while the playlist keeps loading."""
+        chunks = TrackFetcher.fetch_playlist(playlist_url)
         try:
-            async for track_url in TrackFetcher.fetch_playlist(playlist_url):
-                track_urls.append(track_url)
+            stubs: List[Track] = await anext(chunks, [])
         except Exception as e:
             self.logger.error(f"Failed to fetch playlist: {e}", exc_info=True)
             await interaction.followup.send(
@@ -480,82 +873,141 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             )
             return
 
-        if not track_urls:
+        if not stubs:
             await interaction.followup.send(
                 "ℹ️ Playlist is empty or unavailable.", ephemeral=True
             )
             return
 
-        # Show selection view
-        embed = discord.Embed(
-            title="📜 Playlist Selection",
-            description=f"Found {len(track_urls)} tracks in playlist.\n\nSelect which tracks to add:",
-            color=EMBED_COLOR,
+        # Show selection view right away and keep its track count live
+        view = PlaylistSelectionView(self, interaction.user.id, len(stubs))
+        message = await interaction.followup.send(
+            embed=self._create_playlist_embed(len(stubs), loading=True),
+            view=view,
+            ephemeral=True,
+            wait=True,
         )
-        embed.add_field(
-            name="Options",
-            value="• **Add All** - Add all tracks\n• **Custom Selection** - Choose specific tracks or ranges",
-            inline=False,
-        )
-        embed.set_footer(text="Selection will timeout in 60 seconds")
 
-        view = PlaylistSelectionView(self, interaction.user.id, len(track_urls))
-        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
-        await view.wait()
+        selection_task = asyncio.create_task(view.wait())
+        next_chunk: Optional[asyncio.Future] = asyncio.ensure_future(anext(chunks, None))
+        while not selection_task.done() and next_chunk:
+            await asyncio.wait(
+                {selection_task, next_chunk}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not next_chunk.done():
+                break
+
+            chunk = next_chunk.result()
+            if chunk:
+                stubs.extend(chunk)
+                next_chunk = asyncio.ensure_future(anext(chunks, None))
+            else:
+                next_chunk = None
+            view.track_count = len(stubs)
+            try:
+                await message.edit(
+                    embed=self._create_playlist_embed(len(stubs), loading=bool(next_chunk))
+                )
+            except discord.HTTPException:
+                pass  # Selection message already removed
+        await selection_task
+
+        async def _remaining() -> AsyncIterator[List[Track]]:
+            """Chunks that were not loaded before the selection was made."""
+            if next_chunk is None:
+                return
+            chunk = await next_chunk
+            while chunk:
+                yield chunk
+                chunk = await anext(chunks, None)
 
         if not view.selection or view.selection == "cancel":
+            if next_chunk:
+                next_chunk.cancel()
             return
 
-        # Determine which tracks to add
+        # Add All starts playback with what is loaded and appends the rest as it arrives
         if view.selection == "all":
-            indices_to_add = set(range(1, len(track_urls) + 1))
-        else:
-            indices_to_add = self._parse_selection(view.selection, len(track_urls))
-            if not indices_to_add:
-                await interaction.followup.send(
-                    "❌ Invalid selection format.", ephemeral=True
-                )
-                return
-
-        # Add selected tracks
-        track_count = 0
-        first_track = True
-        failed_tracks = 0
+            await self._add_playlist_tracks(interaction, player, stubs, _remaining())
+            return
 
-        for idx in sorted(indices_to_add):
-            if len(player.queue) >= MAX_QUEUE_LENGTH:
-                self.logger.warning("Queue is full")
-                await interaction.followup.send(
-                    f"⚠️ Queue full! Added {track_count} tracks, skipped {len(indices_to_add) - track_count}."
-                )
-                return
+        # Custom selections need the full track count to validate indices
+        async for chunk in _remaining():
+            stubs.extend(chunk)
+        indices_to_add = self._parse_selection(view.selection, len(stubs))
+        if not indices_to_add:
+            await interaction.followup.send(
+                "❌ Invalid selection format.", ephemeral=True
+            )
+            return
 
-            try:
-                track_url = track_urls[idx - 1]  # Convert to 0-based
-                success = await self._add_track_to_queue(
-                    interaction, player, track_url, notify=False
-                )
-                if success:
-                    track_count += 1
-                    if first_track and not player.is_active:
-                        first_track = False
-                        await self._play_next(interaction.guild_id, interaction.channel_id)
-                else:
-                    failed_tracks += 1
-            except Exception as e:
-                self.logger.error(f"Error adding track {idx}: {e}")
-                failed_tracks += 1
-                continue
+        await self._add_playlist_tracks(
+            interaction, player, [stubs[idx - 1] for idx in sorted(indices_to_add)]
+        )
 
-        if track_count > 0:
-            status_msg = f"✅ Added {track_count} track(s) from playlist"
-            if failed_tracks > 0:
-                status_msg += f" ({failed_tracks} failed)"
-            await interaction.followup.send(status_msg)
-        else:
+    async def _add_playlist_tracks(
+        self,
+        interaction: discord.Interaction,
+        player: MusicPlayer,
+        stubs: List[Track],
+        more: Optional[AsyncIterator[List[Track]]] = None,
+    ) -> None:
+        """Queue unresolved playlist stubs in order, starting playback with the first batch."""
+        if len(player.queue) >= MAX_QUEUE_LENGTH:
+            self.logger.warning("Queue is full")
             await interaction.followup.send(
-                "❌ No tracks could be added from playlist.", ephemeral=True
+                f"📛 Queue is full! Limit {MAX_QUEUE_LENGTH}.", ephemeral=True
             )
+            return
+
+        added = skipped = 0
+        progress = await interaction.followup.send(
+            f"⏳ Adding playlist: 0/{len(stubs)}{'+' if more else ''}", wait=True
+        )
+        loop = asyncio.get_running_loop()
+        last_edit = loop.time()
+
+        async def _queue_batch(batch: List[Track], total: int) -> bool:
+            """Queue a batch and report progress, returning False once the queue is full."""
+            nonlocal added, skipped, last_edit
+            space = max(0, MAX_QUEUE_LENGTH - len(player.queue))
+            player.queue.extend(batch[:space])
+            added += min(space, len(batch))
+            skipped += max(0, len(batch) - space)
+
+            if space and not player.is_active:
+                await self._play_next(interaction.guild_id, interaction.channel_id)
+            elif space:
+                self._prefetch_ahead(player)
+                self._prepare_next(player)
+                self._refresh_now_playing(player)
+
+            if loop.time() - last_edit >= PROGRESS_EDIT_INTERVAL:
+                last_edit = loop.time()
+                await self._edit_progress(
+                    progress, f"⏳ Adding playlist: {added}/{total}{'+' if more else ''}"
+                )
+            return len(batch) <= space
+
+        total = len(stubs)
+        if await _queue_batch(stubs, total) and more:
+            async for chunk in more:
+                total += len(chunk)
+                if not await _queue_batch(chunk, total):
+                    break
+        self.logger.info(f"Added {added} playlist track(s) to queue")
+
+        status_msg = f"✅ Added {added} track(s) from playlist"
+        if skipped:
+            status_msg += f" ⚠️ Queue full! Skipped {skipped}."
+        await self._edit_progress(progress, status_msg)
+
+    async def _edit_progress(self, message: discord.WebhookMessage, content: str) -> None:
+        """Edit a progress message, ignoring failures (e.g. it was deleted)."""
+        try:
+            await message.edit(content=content)
+        except discord.HTTPException as e:
+            self.logger.warning(f"Failed to update progress message: {e}")
 
     async def _handle_search(
         self, interaction: discord.Interaction, player: MusicPlayer, search_query: str
@@ -598,9 +1050,13 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
         notify: bool = True,
     ) -> bool:
         """Add a track to the queue"""
-        track = await TrackFetcher.fetch_track_by_url(track_url)
+        track = self._cached_track(track_url) or await TrackFetcher.fetch_track_by_url(
+            track_url
+        )
         if track:
             player.queue.append(track)
+            self._prepare_next(player)
+            self._refresh_now_playing(player)
             self.logger.info(f"Added track to queue: {track.title}")
             if notify:
                 await interaction.followup.send(f"➕ Added to queue: {track.title}")
@@ -624,52 +1080,218 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
 
         if player.loop and player.current_item:
             self.logger.debug("Looping the current track")
-            player.queue.insert(0, player.current_item)
+            player.queue.appendleft(player.current_item)
 
         if not player.queue:
             self.logger.debug("No tracks in the queue, idling")
             player.state = PlayerState.IDLE
             player.current_item = None
+            self.player_store.record(guild_id, "current", None)
+            if channel and player.now_playing:
+                player.now_playing.update(
+                    channel,
+                    discord.Embed(title="⏹️ Queue finished", color=EMBED_COLOR),
+                )
             self._schedule_idle_disconnect(guild)
             return
 
-        self._cancel_idle_task(guild_id)
-        player.current_item = player.queue.pop(0)
+        self._cancel_idle_timer(guild_id)
+        player.current_item = player.queue.popleft()
+        self.player_store.record(guild_id, "current", player.current_item)
+        resume_at, player.resume_at = player.resume_at or 0.0, None
+        if player.current_item is not player.stream_retried:
+            player.stream_retried = None
+
+        local_source = (
+            await self.audio_cache.open_source(player.current_item)
+            if self.audio_cache and not resume_at
+            else None
+        )
+        if local_source is None and not await self._resolve_track(
+            player, player.current_item
+        ):
+            self.logger.error(f"Failed to resolve track: {player.current_item.url}")
+            if channel:
+                self.outbox.post(
+                    channel, f"⏭️ Could not load {player.current_item.title}, skipping."
+                )
+            asyncio.create_task(self._play_next(guild_id, channel_id))
+            return
+
+        expires_at = player.current_item.stream_expires_at
+        if local_source is None and expires_at and expires_at <= time.time():
+            self.logger.info(f"Stream URL expired for {player.current_item.title}")
+            await TrackFetcher.refresh_stream(player.current_item)
 
         try:
-            async with asyncio.timeout(30):
-                source = await discord.FFmpegOpusAudio.from_probe(
-                    player.current_item.audio_url,
-                    **DISCORD_FFMPEG_OPTIONS,
+            if local_source:
+                source, was_prepared = local_source, True
+            elif resume_at:
+                source, was_prepared = (
+                    create_audio_source(player.current_item, start=resume_at),
+                    False,
                 )
+            else:
+                async with asyncio.timeout(SOURCE_TIMEOUT):
+                    source, was_prepared = await self._create_source(
+                        player, player.current_item
+                    )
 
+            if self.audio_cache and local_source is None and not resume_at:
+                source = self.audio_cache.tee(player.current_item, source)
+            player.stop_requested = False
             player.voice_client.play(
                 source,
                 after=lambda e: self._handle_playback_complete(guild_id, channel_id, e),
             )
             player.state = PlayerState.PLAYING
+            player.started_at = time.monotonic() - resume_at
+            player.paused_at = None
             self.logger.debug(
                 f"Started streaming the track {player.current_item.title}"
             )
-
+            if player.track_ended_at is not None:
+                self.gap_stats.record(
+                    time.monotonic() - player.track_ended_at, was_prepared
+                )
+                player.track_ended_at = None
+            self._prefetch_ahead(player)
+            self._prepare_next(player)
+            prefetch_lyrics(player.current_item.title, player.current_item.author)
+            self.logger.debug(f"Now playing {player.current_item.title}")
             if channel:
-                embed = self._create_now_playing_embed(player)
-                await channel.send(embed=embed)
+                self._refresh_now_playing(player, channel)
 
         except asyncio.TimeoutError:
             self.logger.error(
                 f"Timeout creating audio source for {player.current_item.title}"
             )
             if channel:
-                await channel.send("⏭️ Stream creation timeout, skipping track.")
+                self.outbox.post(
+                    channel,
+                    f"⏭️ Stream creation timeout for {player.current_item.title}, skipping.",
+                )
             asyncio.create_task(self._play_next(guild_id, channel_id))
 
         except Exception as e:
             self.logger.error(f"Playback error: {e}", exc_info=True)
             if channel:
-                await channel.send("❌ Error occurred while playing the track.")
+                self.outbox.post(
+                    channel, f"❌ Error occurred while playing {player.current_item.title}."
+                )
             asyncio.create_task(self._play_next(guild_id, channel_id))
 
+    def _cached_track(self, url: str) -> Optional[Track]:
+        """Return a track that can play from the audio cache without extraction."""
+        return self.audio_cache.get_track(url) if self.audio_cache else None
+
+    def _is_cached(self, track: Track) -> bool:
+        return bool(self.audio_cache and self.audio_cache.contains(track))
+
+    async def _resolve_track(self, player: MusicPlayer, track: Track) -> bool:
+        """Resolve a track just in time, joining its prefetch if one is running."""
+        if track.is_resolved:
+            return True
+        task = player.prefetch_tasks.get(id(track))
+        try:
+            if task:
+                # Shielded: cancelling a background probe must not kill the shared prefetch
+                await asyncio.shield(task)
+            else:
+                await TrackFetcher.resolve_track(track)
+                player.queue.refresh_duration(track, within=PREFETCH_AHEAD + 1)
+        except Exception as e:
+            self.logger.error(f"Error resolving {track.url}: {e}")
+        return track.is_resolved
+
+    def _prefetch_ahead(self, player: MusicPlayer) -> None:
+        """Resolve the next PREFETCH_AHEAD queued stubs and warm the next track's lyrics."""
+        if player.queue:
+            prefetch_lyrics(player.queue[0].title, player.queue[0].author)
+        for track in player.queue[:PREFETCH_AHEAD]:
+            key = id(track)
+            if track.is_resolved or key in player.prefetch_tasks or self._is_cached(track):
+                continue
+
+            task = asyncio.create_task(self._prefetch_track(player, track))
+            player.prefetch_tasks[key] = task
+            task.add_done_callback(
+                lambda t, key=key, track=track: self._on_prefetched(player, key, track)
+            )
+
+    @staticmethod
+    async def _prefetch_track(player: MusicPlayer, track: Track) -> None:
+        async with player.resolve_slots:  # Bounds the guild's resolution fan-out
+            await TrackFetcher.resolve_track(track)
+
+    @staticmethod
+    def _on_prefetched(player: MusicPlayer, key: int, track: Track) -> None:
+        player.prefetch_tasks.pop(key, None)
+        player.queue.refresh_duration(track, within=PREFETCH_AHEAD + 1)
+
+    async def _create_source(
+        self, player: MusicPlayer, track: Track
+    ) -> Tuple[discord.AudioSource, bool]:
+        """Build the audio source from known format info or background probe results."""
+        if can_skip_probe(track):
+            player.invalidate_prepared()
+            self.logger.debug(f"Using yt-dlp format info for {track.title}")
+            return await open_audio_source(track, self._stream_session), True
+
+        task = player.prepare_task
+        if task and player.prepare_target is track and not task.done():
+            # Waited on, not awaited: a queue change may cancel the probe meanwhile,
+            # and that must only mean probing here instead
+            await asyncio.wait({task})
+            if not task.cancelled() and task.exception():
+                self.logger.warning(
+                    f"Background probe failed for {track.title}: {task.exception()}"
+                )
+
+        prepared = player.prepared
+        player.invalidate_prepared()
+        if prepared and prepared.track is track and prepared.audio_url == track.audio_url:
+            self.logger.debug(f"Using prepared source for {track.title}")
+            source = create_audio_source(
+                track, codec=prepared.codec, bitrate=prepared.bitrate
+            )
+            return source, True
+
+        source = await discord.FFmpegOpusAudio.from_probe(
+            track.audio_url, **DISCORD_FFMPEG_OPTIONS
+        )
+        return source, False
+
+    def _prepare_next(self, player: MusicPlayer) -> None:
+        """Probe the next track in the background so it can start without a gap."""
+        target = player.next_track
+        if target is not None and player.prepare_target is target:
+            return
+
+        player.invalidate_prepared()
+        if target is None:
+            return
+
+        player.prepare_target = target
+        player.prepare_task = asyncio.create_task(self._probe_ahead(player, target))
+
+    async def _probe_ahead(self, player: MusicPlayer, track: Track) -> None:
+        """Resolve and, if its format is unknown, probe a track ahead of playback."""
+        if self._is_cached(track):
+            return
+        if not await self._resolve_track(player, track) or can_skip_probe(track):
+            return
+        audio_url = track.audio_url
+        try:
+            async with asyncio.timeout(SOURCE_TIMEOUT):
+                codec, bitrate = await discord.FFmpegOpusAudio.probe(audio_url)
+        except Exception as e:
+            self.logger.warning(f"Failed to probe next track {track.title}: {e}")
+            return
+        if player.prepare_target is track:
+            player.prepared = PreparedSource(track, audio_url, codec, bitrate)
+            self.logger.debug(f"Prepared next source: {track.title} ({codec}, {bitrate}kbps)")
+
     def _handle_playback_complete(
         self,
         guild_id: int,
@@ -680,9 +1302,76 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
         if error:
             self.logger.error(f"Playback error in guild {guild_id}: {error}")
 
-        asyncio.run_coroutine_threadsafe(
-            self._play_next(guild_id, channel_id), self.bot.loop
-        )
+        player = self.players.get(guild_id)
+        if player:
+            player.track_ended_at = time.monotonic()
+
+        if player and self._stream_died(player, error):
+            coro = self._restart_current(guild_id, channel_id)
+        else:
+            coro = self._play_next(guild_id, channel_id)
+        asyncio.run_coroutine_threadsafe(coro, self.bot.loop)
+
+    # ========== STREAM URL LIFETIME ==========
+    def _stream_died(self, player: MusicPlayer, error: Optional[Exception]) -> bool:
+        """Whether playback ended early because the stream URL was dead or refused.
+
+        FFmpeg usually exits cleanly on an HTTP 403, so an unrequested stop
+        right after start, or well short of the track's duration, counts
+        even without an error.
+        """
+        track = player.current_item
+        if not track or player.started_at is None or player.stream_retried is track:
+            return False
+        if player.stop_requested:
+            return False
+        position = player.elapsed
+        ended_early = bool(track.duration) and position < track.duration - STREAM_EARLY_END
+        return error is not None or position <= STREAM_START_WINDOW or ended_early
+
+    async def _restart_current(self, guild_id: int, channel_id: int) -> None:
+        """Re-resolve the current track's stream once and play it again."""
+        player = self.players.get(guild_id)
+        if not player or not player.current_item:
+            return
+
+        track = player.current_item
+        player.stream_retried = track
+        position = player.elapsed
+        self.logger.info(f"Stream died at {position:.0f}s, re-resolving: {track.title}")
+        if await TrackFetcher.refresh_stream(track):
+            if position > STREAM_START_WINDOW:
+                player.resume_at = position  # Pick up where the stream died
+            if not player.loop:
+                player.queue.appendleft(track)
+        await self._play_next(guild_id, channel_id)
+
+    def _streams_to_refresh(self, player: MusicPlayer) -> List[Track]:
+        """Queued tracks whose stream URL will expire before they are played."""
+        now = time.time()
+        due = []
+        for track, starts_in in player.projected_starts():
+            if starts_in > STREAM_REFRESH_HORIZON:
+                break
+            if self._is_cached(track):
+                continue
+            expires_at = track.stream_expires_at
+            if expires_at and expires_at < now + starts_in + STREAM_EXPIRY_MARGIN:
+                due.append(track)
+        return due
+
+    async def _refresh_streams_loop(self) -> None:
+        """Periodically re-resolve stream URLs that would expire before playback."""
+        while True:
+            await asyncio.sleep(STREAM_REFRESH_INTERVAL)
+            for guild_id, player in list(self.players.items()):
+                for track in self._streams_to_refresh(player):
+                    try:
+                        await TrackFetcher.refresh_stream(track)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Stream refresh failed in guild {guild_id}: {e}"
+                        )
 
     # ========== SKIP ==========
     @app_commands.command(name="skip", description="⏭️ Skip tracks by index or range.")
@@ -750,6 +1439,9 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             )
             return
 
+        self._prefetch_ahead(player)
+        self._prepare_next(player)
+        self._refresh_now_playing(player)
         skipped_titles = [track.title for track in skipped_tracks if track]
         await interaction.response.send_message(
             f"⏭ Skipped {len(skipped_tracks)} track(s)"
@@ -768,12 +1460,17 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             return
 
         queue_list = "\n".join(
-            f"**{i + 1}.** [{track.title[:50]}]({track.url})"
-            for i, track in enumerate(player.queue[:10])  # Show first 10 tracks
+            f"**{i + 1}.** [{track.title[:50]}]({track.url}) · in {format_duration(starts_in)}"
+            for i, (track, starts_in) in enumerate(
+                islice(player.projected_starts(), 10)  # Show first 10 tracks
+            )
         )
 
         embed = discord.Embed(
-            title=f"📜 Queue ({len(player.queue)} tracks)",
+            title=(
+                f"📜 Queue ({len(player.queue)} tracks, "
+                f"{format_duration(player.queue.total_duration)})"
+            ),
             description=queue_list,
             color=EMBED_COLOR,
         )
@@ -790,10 +1487,24 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
 
         await interaction.response.send_message(embed=embed)
 
+    def _refresh_now_playing(
+        self, player: MusicPlayer, channel: Optional[discord.abc.Messageable] = None
+    ) -> None:
+        """Update the guild's now playing panel, creating it on first use."""
+        channel = channel or (
+            self.bot.get_channel(player.text_channel_id)
+            if player.text_channel_id
+            else None
+        )
+        if not channel or not player.current_item:
+            return
+        if player.now_playing is None:
+            player.now_playing = NowPlayingPanel(self.panel_stats)
+        player.now_playing.update(channel, self._create_now_playing_embed(player))
+
     def _create_now_playing_embed(self, player: MusicPlayer) -> discord.Embed:
         track = player.current_item
         queue = player.queue
-        self.logger.debug(f"Now playing {track.title}")
         embed = discord.Embed(
             title="🎶 Now Playing",
             description=f"[{track.title}]({track.url})",
@@ -860,6 +1571,10 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
 
         if player.voice_client.is_playing():
             player.voice_client.pause()
+            player.paused_at = time.monotonic()
+            self.player_store.record(
+                interaction.guild.id, "position", round(player.elapsed, 1)
+            )
             self.logger.info("Change state to PAUSED")
             player.state = PlayerState.PAUSED
             await interaction.response.send_message("⏸️ Playback paused.")
@@ -885,6 +1600,9 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
 
         if player.voice_client.is_paused():
             player.voice_client.resume()
+            if player.paused_at is not None and player.started_at is not None:
+                player.started_at += time.monotonic() - player.paused_at
+            player.paused_at = None
             self.logger.debug("Change state to PLAYING")
             player.state = PlayerState.PLAYING
             await interaction.response.send_message("▶️ Playback resumed.")
@@ -911,6 +1629,8 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             return
 
         player.loop = not player.loop
+        self.player_store.record(interaction.guild.id, "loop", player.loop)
+        self._prepare_next(player)
         self.logger.info(f"Looping {player.loop}")
         status = "enabled" if player.loop else "disabled"
         await interaction.response.send_message(f"🔁 Loop {status}.")
@@ -929,6 +1649,9 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             return
 
         player.shuffle_queue()
+        self._prefetch_ahead(player)
+        self._prepare_next(player)
+        self._refresh_now_playing(player)
         self.logger.info("Queue is shuffled")
         await interaction.response.send_message("🔀 Queue is shuffled.")
 
@@ -946,17 +1669,142 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
             return
 
         player.queue.clear()
+        self._prepare_next(player)
+        self._refresh_now_playing(player)
         self.logger.info("Queue cleared")
         await interaction.response.send_message("🗑️ Queue cleared.")
 
+    # ========== STATS ==========
+    @app_commands.command(name="stats", description="📈 Show music cache statistics.")
+    @channel_allowed(__file__)
+    async def stats(self, interaction: discord.Interaction) -> None:
+        """Display how much extraction work the caches are saving."""
+        self.logger.debug(f"User @{interaction.user.name} invoked /stats (music)")
+        embed = discord.Embed(title="📈 Music Stats", color=EMBED_COLOR)
+
+        cache_stats = TrackFetcher.get_cache().snapshot()
+        embed.add_field(
+            name="Track Cache",
+            value=(
+                f"Hits: {cache_stats['hits']}\n"
+                f"Stream refreshes: {cache_stats['refreshes']}\n"
+                f"Misses: {cache_stats['misses']}\n"
+                f"Hit rate: {cache_stats['hit_rate']:.0%}"
+            ),
+            inline=True,
+        )
+
+        search_stats = TrackFetcher.get_search_cache().snapshot()
+        embed.add_field(
+            name="Search Cache",
+            value=(
+                f"Hits: {search_stats['hits']}\n"
+                f"Misses: {search_stats['misses']}\n"
+                f"Entries: {search_stats['size']}"
+            ),
+            inline=True,
+        )
+
+        lyrics_stats = get_lyrics_cache().snapshot()
+        lyrics_prefetch = prefetch_stats()
+        embed.add_field(
+            name="Lyrics Cache",
+            value=(
+                f"Hits: {lyrics_stats['hits']}\n"
+                f"Cached misses: {lyrics_stats['negative_hits']}\n"
+                f"Misses: {lyrics_stats['misses']}\n"
+                f"Prefetched: {lyrics_prefetch['started']} "
+                f"({lyrics_prefetch['dropped']} dropped)\n"
+                f"Genius requests: {get_genius().requests}"
+            ),
+            inline=True,
+        )
+
+        coalescing = TrackFetcher.coalescing_stats()
+        embed.add_field(
+            name="Lookup Coalescing",
+            value=(
+                f"Lookups: {coalescing['calls']}\n"
+                f"Joined in-flight: {coalescing['coalesced']}"
+            ),
+            inline=True,
+        )
+
+        outbox = self.outbox.snapshot()
+        embed.add_field(
+            name="Notice Batching",
+            value=(
+                f"Notices: {outbox['notices']}\n"
+                f"Messages sent: {outbox['messages']}\n"
+                f"API calls saved: {outbox['saved']}\n"
+                f"Failed notices: {outbox['failed']}"
+            ),
+            inline=True,
+        )
+
+        panel = self.panel_stats.snapshot()
+        embed.add_field(
+            name="Now Playing Panel",
+            value=(
+                f"Updates: {panel['requested']}\n"
+                f"Edits: {panel['edits']}\n"
+                f"Posts: {panel['posts']}"
+            ),
+            inline=True,
+        )
+
+        gaps = self.gap_stats.snapshot()
+        embed.add_field(
+            name="Gaps Between Tracks",
+            value=f"Prepared: {gaps['prepared']}\nProbed: {gaps['probed']}",
+            inline=True,
+        )
+
+        pool_stats = TrackFetcher.pool_stats()
+        embed.add_field(
+            name="yt-dlp Pool",
+            value=f"Created: {pool_stats['created']}\nReused: {pool_stats['reused']}",
+            inline=True,
+        )
+
+        store_stats = self.player_store.snapshot()
+        embed.add_field(
+            name="Player State",
+            value=(
+                f"Journal rows: {store_stats['journal_rows']}\n"
+                f"Written: {store_stats['written']}\n"
+                f"Compactions: {store_stats['compactions']}"
+            ),
+            inline=True,
+        )
+
+        if self.audio_cache:
+            audio_stats = self.audio_cache.snapshot()
+            embed.add_field(
+                name="Audio Cache",
+                value=(
+                    f"Tracks: {audio_stats['tracks']}\n"
+                    f"Size: {audio_stats['used_mb']}/{audio_stats['max_mb']} MB\n"
+                    f"Local plays: {audio_stats['hits']}\n"
+                    f"Evictions: {audio_stats['evictions']}"
+                ),
+                inline=True,
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     # ========== GET LYRICS ==========
     @app_commands.command(name="lyrics", description="📝 Get lyrics for a song.")
     @app_commands.describe(
-        query="Song name to search lyrics for (default: current track)"
+        query="Song name to search lyrics for (default: current track)",
+        paginate="Show the lyrics as one message with page buttons "
+        "(default: only for very long lyrics)",
     )
     @channel_allowed(__file__)
     async def lyrics(
-        self, interaction: discord.Interaction, query: Optional[str] = None
+        self,
+        interaction: discord.Interaction,
+        query: Optional[str] = None,
+        paginate: Optional[bool] = None,
     ) -> None:
         """Fetch and display lyrics."""
         self.logger.debug(
@@ -964,10 +1812,13 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
         )
         await interaction.response.defer()
 
-        if not query:
+        if query:
+            name, artist = split_query(query)
+        else:
             player = self.players.get(interaction.guild.id)
             if player and player.current_item:
-                query = player.current_item.title
+                # The channel name is the artist hint, as in the prefetch
+                name, artist = player.current_item.title, player.current_item.author
                 self.logger.debug("Set the current track as a query")
             else:
                 self.logger.warning("No track is playing")
@@ -977,21 +1828,27 @@ class MusicCog(BaseCog, commands.GroupCog, name="music"):
                 return
 
         try:
-            parts = query.split(" - ", 1)
-            name = parts[0]
-            if len(parts) > 1:
-                artist = parts[1]
-            else:
-                artist = None
             response = await get_lyrics(track_name=name, artist_name=artist)
-
-            for i, chunk in enumerate(response.text):
-                embed = discord.Embed(
+            embeds = [
+                discord.Embed(
                     title=f"🎵 {response.title}" if i == 0 else None,
                     description=chunk,
                     color=EMBED_COLOR,
                 )
-                await interaction.followup.send(embed=embed)
+                for i, chunk in enumerate(response.text)
+            ]
+            messages = pack_embeds(embeds)
+            if paginate is None:
+                paginate = len(messages) > LYRICS_PAGINATE_AFTER
+
+            if paginate and len(messages) > 1:
+                view = LyricsPaginator(messages, interaction.user.id)
+                view.message = await interaction.followup.send(
+                    embeds=messages[0], view=view
+                )
+            else:
+                for message_embeds in messages:
+                    await interaction.followup.send(embeds=message_embeds)
         except Exception as e:
             self.logger.error(f"Failed to fetch lyrics: {e}", exc_info=True)
             await interaction.followup.send("❌ Failed to fetch lyrics", ephemeral=True)
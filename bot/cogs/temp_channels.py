@@ -1,14 +1,18 @@
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Set
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from bot.services.timer_wheel import Timer
+
 from . import BaseCog, channel_allowed
 
 if TYPE_CHECKING:
     from . import MyBot
 
+DELETE_GRACE = 30  # seconds an empty temp channel is kept so its members can rejoin
+
 
 # ========= TEMP CHANNEL COG ==========
 class TempChannels(BaseCog, commands.GroupCog, name="temp_channels"):
@@ -19,6 +23,8 @@ class TempChannels(BaseCog, commands.GroupCog, name="temp_channels"):
         self.temp_channels: Dict[
             int, Dict[str, int]
         ] = {}  # {channel_id: {"owner": user_id, "guild_id": guild_id}}
+        self.hub_channels: Set[int] = set()
+        self._pending_deletes: Dict[int, Timer] = {}  # {channel_id: grace timer}
         self.logger = bot.logger.getChild("temp_channels")
 
     # ========== HELPERS ==========
@@ -60,10 +66,83 @@ class TempChannels(BaseCog, commands.GroupCog, name="temp_channels"):
             )
             return False
 
+    def _is_hub(self, channel: discord.abc.GuildChannel) -> bool:
+        return isinstance(channel, discord.VoiceChannel) and (
+            channel.name in self.channel_service.get_channel_name("voice_hub")
+        )
+
+    def _index_hub(self, channel: discord.abc.GuildChannel) -> None:
+        """Watch a channel if it is a hub, or stop watching it if it no longer is"""
+        if self._is_hub(channel):
+            self.hub_channels.add(channel.id)
+            self.bot.voice_router.watch("temp_hub", channel.id)
+        elif channel.id in self.hub_channels:
+            self._forget_hub(channel.id)
+
+    def _forget_hub(self, channel_id: int) -> None:
+        self.hub_channels.discard(channel_id)
+        self.bot.voice_router.unwatch("temp_hub", channel_id)
+
+    def _index_guild(self, guild: discord.Guild) -> None:
+        for channel in guild.voice_channels:
+            self._index_hub(channel)
+
+    def _track(self, channel: discord.VoiceChannel, owner: discord.Member) -> None:
+        self.temp_channels[channel.id] = {"owner": owner.id, "guild_id": owner.guild.id}
+        self.bot.voice_router.watch("temp_channel", channel.id)
+
+    def _untrack(self, channel_id: int) -> None:
+        self.temp_channels.pop(channel_id, None)
+        self.bot.voice_router.unwatch("temp_channel", channel_id)
+        self._cancel_delete(channel_id)
+
+    def _schedule_delete(self, channel_id: int) -> None:
+        """Delete a temp channel after the grace period unless someone joins it"""
+        self._cancel_delete(channel_id)
+        self._pending_deletes[channel_id] = self.bot.timers.schedule(
+            DELETE_GRACE, self._delete_if_empty, channel_id
+        )
+
+    def _cancel_delete(self, channel_id: int) -> None:
+        timer = self._pending_deletes.pop(channel_id, None)
+        if timer:
+            timer.cancel()
+
+    async def _delete_if_empty(self, channel_id: int) -> None:
+        self._pending_deletes.pop(channel_id, None)
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            self._untrack(channel_id)
+            return
+        if channel.members:
+            return
+        try:
+            await channel.delete()
+            self.logger.info(f"Deleted empty temp channel {channel.name}")
+        except Exception as e:
+            self.logger.error(f"Failed to delete temp channel: {e}")
+        finally:
+            self._untrack(channel_id)
+
+    # ========== LOADER ==========
+    async def cog_load(self) -> None:
+        """Register voice handlers; hubs are indexed now if connected, else on ready."""
+        self.bot.voice_router.add_handler("temp_hub", self._on_hub_join)
+        self.bot.voice_router.add_handler("temp_channel", self._on_temp_voice)
+        if self.bot.is_ready():
+            for guild in self.bot.guilds:
+                self._index_guild(guild)
+
     # ========== UNLOADER ==========
     async def cog_unload(self) -> None:
         """Delete tracked temp channels on unload."""
         self.logger.debug("Temp Channels unloader triggered")
+        self.bot.voice_router.remove_handler("temp_hub")
+        self.bot.voice_router.remove_handler("temp_channel")
+        self.hub_channels.clear()
+        for timer in self._pending_deletes.values():
+            timer.cancel()
+        self._pending_deletes.clear()
         for channel_id, meta in list(self.temp_channels.items()):
             try:
                 channel = self.bot.get_channel(channel_id)
@@ -77,21 +156,15 @@ class TempChannels(BaseCog, commands.GroupCog, name="temp_channels"):
             finally:
                 self.temp_channels.pop(channel_id, None)
 
-    # ========== LISTENERS ==========
-    @commands.Cog.listener()
-    async def on_voice_state_update(
+    # ========== VOICE EVENTS ==========
+    async def _on_hub_join(
         self,
         member: discord.Member,
         before: discord.VoiceState,
         after: discord.VoiceState,
     ) -> None:
-        """Handle channel creation/deletion"""
-        # Create new temp channel
-        if (
-            after.channel
-            and after.channel.name
-            in self.bot.channel_service.get_channel_name("voice_hub")
-        ):
+        """Create a temp channel for a member joining a hub"""
+        if after.channel and after.channel.id in self.hub_channels:
             if not await self._ensure_temp_infrastructure(member.guild):
                 return
 
@@ -106,34 +179,59 @@ class TempChannels(BaseCog, commands.GroupCog, name="temp_channels"):
                 temp_channel = await category.create_voice_channel(
                     name=f"{member.display_name}'s Room", user_limit=4
                 )
+                # Tracked and timed before the move: the owner's arrival cancels
+                # the deletion, and a failed move doesn't leave the room behind
+                self._track(temp_channel, member)
+                self._schedule_delete(temp_channel.id)
                 await member.move_to(temp_channel)
-                self.temp_channels[temp_channel.id] = {
-                    "owner": member.id,
-                    "guild_id": member.guild.id,
-                }
                 self.logger.info(f"Created temp channel for @{member.name}")
             except Exception as e:
                 self.logger.error(f"Failed to create temp channel: {e}")
 
-        # Cleanup empty channels
+    async def _on_temp_voice(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ) -> None:
+        """Start the grace period when a temp channel empties, stop it when someone joins"""
+        if after.channel and after.channel.id in self.temp_channels:
+            self._cancel_delete(after.channel.id)
         if before.channel and before.channel.id in self.temp_channels:
             if len(before.channel.members) == 0:
-                try:
-                    await before.channel.delete()
-                    self.logger.info(
-                        f"Deleted empty temp channel {before.channel.name}"
-                    )
-                except Exception as e:
-                    self.logger.error(f"Failed to delete temp channel: {e}")
-                finally:
-                    self.temp_channels.pop(before.channel.id, None)
+                self._schedule_delete(before.channel.id)
+
+    # ========== LISTENERS ==========
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """Index hub channels once guilds are available"""
+        for guild in self.bot.guilds:
+            self._index_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        self._index_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        self._index_hub(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        """Keep the hub index in step with renames"""
+        if before.name != after.name:
+            self._index_hub(after)
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
         """Cleanup tracking if channel is deleted"""
+        if channel.id in self.hub_channels:
+            self._forget_hub(channel.id)
         if channel.id in self.temp_channels:
             self.logger.warning(f"Voice chat #{channel.name} deleted manually")
-            self.temp_channels.pop(channel.id)
+            self._untrack(channel.id)
 
     # ========== LOCK ==========
     @app_commands.command(name="lock", description="🔒 Lock your temporary channel")
@@ -4,5 +4,18 @@ Services package for handling various bot functionalities.
 This package contains:
 - ChannelService: Manages Discord channels and categories.
 - TrackFetcher: Handles YouTube audio fetching.
+- TrackCache: Persists resolved tracks between extractions.
+- SearchCache: Caches search results by normalized query.
+- TrackQueue: Per-guild play queue with a running total duration.
+- PlayerStore: Journals player state so queues survive restarts.
+- NowPlayingPanel: Keeps one rate-limited now playing message per guild.
+- Outbox: Batches short channel notices into fewer messages.
+- AudioCache: Keeps local Opus copies of frequently played tracks.
+- WebMOpusSource: Streams WebM/Opus to voice without FFmpeg.
+- LyricsCache: Persists lyrics lookups, including misses.
+- GeniusClient: Searches Genius and scrapes lyrics pages over aiohttp.
+- lyrics_candidates: Turns video titles into ranked lyrics queries.
 - get_lyrics: Fetches song lyrics.
+- VoiceRouter: Routes voice state updates to the cogs watching each channel.
+- TimerWheel: Shared scheduler for idle disconnects and other timeouts.
 """
@@ -0,0 +1,313 @@
+import asyncio
+import json
+import math
+import sqlite3
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import discord
+
+from bot.services.track_cache import STATIC_FIELDS, extract_video_id
+from bot.services.webm_opus import opus_packet_samples
+from bot.services.yt_source import Track
+from bot.utils.executors import ExecutorRejected, run_blocking
+from bot.utils.logger import setup_logger
+
+MAX_CACHED_DURATION = 20 * 60  # seconds, longer tracks (and live streams) are skipped
+COMPLETE_MARGIN = 5  # seconds a kept copy may fall short of the track's duration
+PLAY_WEIGHT = 24 * 60 * 60  # Each doubling of play count is worth a day of recency
+OGG_PAGE_SEGMENTS = 255  # Lacing values per Ogg page, the format's maximum
+OGG_SERIAL = 0x4F505553  # Bitstream serial; files hold a single stream
+
+logger = setup_logger(name="audio_cache", log_file="yt-dlp.log")
+
+
+# ========== OGG ==========
+def _crc_table() -> List[int]:
+    table = []
+    for byte in range(256):
+        crc = byte << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7 if crc & 0x80000000 else crc << 1) & 0xFFFFFFFF
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = _crc_table()
+
+
+def _ogg_crc(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ _CRC_TABLE[(crc >> 24) ^ byte]
+    return crc
+
+
+def _ogg_page(packets: List[bytes], granule: int, sequence: int, flags: int = 0) -> bytes:
+    lacing = bytearray()
+    for packet in packets:
+        lacing += b"\xff" * (len(packet) // 255) + bytes([len(packet) % 255])
+    header = struct.pack(
+        "<4sBBqIIIB", b"OggS", 0, flags, granule, OGG_SERIAL, sequence, 0, len(lacing)
+    )
+    page = bytearray(header + lacing + b"".join(packets))
+    page[22:26] = struct.pack("<I", _ogg_crc(page))
+    return bytes(page)
+
+
+def write_ogg_opus(path: Path, packets: List[bytes]) -> None:
+    """Write 48kHz stereo Opus packets to an Ogg/Opus file, unchanged."""
+    head = struct.pack("<8sBBHIhB", b"OpusHead", 1, 2, 0, 48000, 0, 0)
+    vendor = b"discord-bot"
+    tags = b"OpusTags" + struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", 0)
+
+    with open(path, "wb") as file:
+        file.write(_ogg_page([head], 0, 0, flags=0x02))
+        file.write(_ogg_page([tags], 0, 1))
+        sequence, granule, page, segments = 2, 0, [], 0
+        for index, packet in enumerate(packets):
+            needed = len(packet) // 255 + 1
+            if segments + needed > OGG_PAGE_SEGMENTS:
+                file.write(_ogg_page(page, granule, sequence))
+                sequence, page, segments = sequence + 1, [], 0
+            page.append(packet)
+            segments += needed
+            granule += opus_packet_samples(packet)
+        file.write(_ogg_page(page, granule, sequence, flags=0x04))
+
+
+_DoneCallback = Callable[[Optional[List[bytes]]], None]
+
+
+class _TeeSource(discord.AudioSource):
+    """Opus source that keeps a copy of every packet it passes to the voice client.
+
+    `on_done` is called on the event loop with the packets if the inner source
+    ran to its end, or with None if playback was stopped or failed first.
+    """
+
+    def __init__(self, inner: discord.AudioSource, on_done: _DoneCallback) -> None:
+        self._inner = inner
+        self._on_done: Optional[_DoneCallback] = on_done
+        self._loop = asyncio.get_running_loop()
+        self._packets: List[bytes] = []
+        self._ended = False
+
+    def read(self) -> bytes:
+        packet = self._inner.read()
+        if packet:
+            self._packets.append(packet)
+        else:
+            self._ended = True
+        return packet
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self._inner.cleanup()
+        if self._on_done is None:
+            return  # Already handed off; AudioSource.__del__ cleans up again
+        packets = self._packets if self._ended else None
+        self._loop.call_soon_threadsafe(self._on_done, packets)
+        self._on_done, self._packets = None, []
+
+
+@dataclass
+class _Entry:
+    size: int
+    plays: int
+    last_played: float
+    fields: Dict[str, Any]
+
+    @property
+    def score(self) -> float:
+        """Eviction priority, lowest goes first."""
+        return self.last_played + PLAY_WEIGHT * math.log2(self.plays + 1)
+
+
+class AudioCache:
+    """Byte-budgeted directory of Ogg/Opus copies of played tracks.
+
+    The first time a track plays, the Opus packets sent to Discord are kept
+    and, once it has played to the end, written out as an Ogg file; later
+    plays read that file without yt-dlp or the network. When over budget,
+    entries are evicted least-recently-played first, with frequently played
+    tracks kept longer.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: Dict[str, _Entry] = {}
+        self._filling: Set[str] = set()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.fills = 0
+        self.evictions = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(entry.size for entry in self._entries.values())
+
+    def _path(self, video_id: str) -> Path:
+        return self.directory / f"{video_id}.ogg"
+
+    # ========== SYNC API ==========
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for partial in self.directory.glob("*.part"):
+            partial.unlink(missing_ok=True)
+
+        self._conn = sqlite3.connect(self.directory / "index.sqlite3", check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (video_id TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, plays INTEGER NOT NULL, "
+                "last_played REAL NOT NULL, fields TEXT NOT NULL)"
+            )
+            rows = self._conn.execute("SELECT * FROM entries").fetchall()
+
+        missing = []
+        for video_id, size, plays, last_played, fields in rows:
+            if self._path(video_id).is_file():
+                self._entries[video_id] = _Entry(size, plays, last_played, json.loads(fields))
+            else:
+                missing.append(video_id)
+        self._delete(missing)
+        logger.info(
+            f"Audio cache opened at {self.directory}: {len(self._entries)} tracks, "
+            f"{self.used_bytes / 1024 / 1024:.0f}/{self.max_bytes / 1024 / 1024:.0f} MB"
+        )
+
+    def _store(self, video_id: str, entry: _Entry) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (video_id, entry.size, entry.plays, entry.last_played, json.dumps(entry.fields)),
+            )
+
+    def _delete(self, video_ids: List[str]) -> None:
+        for video_id in video_ids:
+            self._path(video_id).unlink(missing_ok=True)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM entries WHERE video_id = ?", [(v,) for v in video_ids]
+            )
+
+    # ========== ASYNC API ==========
+    async def open(self) -> None:
+        """Create the cache directory and load the index."""
+        await run_blocking("storage", self._open)
+
+    def get_track(self, url: str) -> Optional[Track]:
+        """Return an unresolved track for a cached URL, so no extraction is needed."""
+        video_id = extract_video_id(url)
+        entry = self._entries.get(video_id) if video_id else None
+        return Track(audio_url="", **entry.fields) if entry else None
+
+    def contains(self, track: Track) -> bool:
+        """Whether the track can be played from a local file."""
+        video_id = extract_video_id(track.url)
+        return bool(video_id) and video_id in self._entries
+
+    async def open_source(self, track: Track) -> Optional[discord.FFmpegOpusAudio]:
+        """Return a source reading the track's local file and count the play."""
+        video_id = extract_video_id(track.url)
+        entry = self._entries.get(video_id) if video_id else None
+        if entry is None:
+            return None
+
+        path = self._path(video_id)
+        if not path.is_file():
+            logger.warning(f"Cached file vanished for {track.title}")
+            del self._entries[video_id]
+            await run_blocking("storage", self._delete, [video_id])
+            return None
+
+        entry.plays += 1
+        entry.last_played = time.time()
+        self.hits += 1
+        await run_blocking("storage", self._store, video_id, entry)
+        logger.debug(f"Playing {track.title} from {path} ({entry.plays} plays)")
+        return discord.FFmpegOpusAudio(str(path), codec="copy", options="-vn")
+
+    def tee(self, track: Track, source: discord.AudioSource) -> discord.AudioSource:
+        """Wrap a source about to play so the track is cached if it plays to the end."""
+        video_id = extract_video_id(track.url)
+        if (
+            not video_id
+            or not source.is_opus()
+            or not track.duration
+            or track.duration > MAX_CACHED_DURATION
+            or video_id in self._entries
+            or video_id in self._filling
+        ):
+            return source
+
+        self._filling.add(video_id)
+        return _TeeSource(source, lambda packets: self._on_played(video_id, track, packets))
+
+    def _on_played(self, video_id: str, track: Track, packets: Optional[List[bytes]]) -> None:
+        seconds = sum(map(opus_packet_samples, packets)) / 48000 if packets else 0.0
+        if seconds < track.duration - COMPLETE_MARGIN:
+            self._filling.discard(video_id)  # Skipped or cut short, try again next time
+            return
+        task = asyncio.create_task(self._fill(video_id, track, packets))
+        task.add_done_callback(lambda _: self._filling.discard(video_id))
+
+    async def _fill(self, video_id: str, track: Track, packets: List[bytes]) -> None:
+        path = self._path(video_id)
+        partial = path.with_suffix(".part")
+        try:
+            await run_blocking("storage", write_ogg_opus, partial, packets)
+            await run_blocking("storage", partial.replace, path)
+        except ExecutorRejected:
+            logger.warning(f"Storage pool saturated, not caching audio for {track.title}")
+            return
+        except OSError as e:
+            partial.unlink(missing_ok=True)
+            logger.error(f"Could not write cached audio for {track.title}: {e}")
+            return
+
+        fields = {name: value for name, value in asdict(track).items() if name in STATIC_FIELDS}
+        entry = _Entry(path.stat().st_size, 1, time.time(), fields)
+        self._entries[video_id] = entry
+        self.fills += 1
+        await run_blocking("storage", self._store, video_id, entry)
+        logger.info(f"Cached audio for {track.title} ({entry.size / 1024 / 1024:.1f} MB)")
+        await self._evict()
+
+    async def _evict(self) -> None:
+        """Drop the lowest-scoring entries until the cache fits its budget."""
+        overflow = self.used_bytes - self.max_bytes
+        if overflow <= 0:
+            return
+
+        evicted = []
+        for video_id, entry in sorted(self._entries.items(), key=lambda item: item[1].score):
+            if overflow <= 0:
+                break
+            overflow -= entry.size
+            evicted.append(video_id)
+            del self._entries[video_id]
+
+        self.evictions += len(evicted)
+        await run_blocking("storage", self._delete, evicted)
+        logger.debug(f"Evicted {len(evicted)} tracks from the audio cache")
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current counters for diagnostics."""
+        return {
+            "tracks": len(self._entries),
+            "used_mb": round(self.used_bytes / 1024 / 1024, 1),
+            "max_mb": round(self.max_bytes / 1024 / 1024, 1),
+            "hits": self.hits,
+            "fills": self.fills,
+            "evictions": self.evictions,
+        }
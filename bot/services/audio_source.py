@@ -0,0 +1,70 @@
+import asyncio
+from typing import Optional
+
+import aiohttp
+import discord
+
+from bot.services.webm_opus import DemuxError, WebMOpusSource
+from bot.services.yt_source import Track
+from bot.utils.config import DISCORD_FFMPEG_OPTIONS, WEBM_PASSTHROUGH
+from bot.utils.logger import setup_logger
+
+OPUS_CONTAINERS = {"webm", "ogg", "opus"}  # Containers whose Opus audio can be copied
+DEFAULT_BITRATE = 128  # kbps, used when the source bitrate is unknown
+MAX_BITRATE = 512  # kbps, Discord's ceiling for Opus encoding
+
+logger = setup_logger(name="audio_source")
+
+
+def can_skip_probe(track: Track) -> bool:
+    """Whether the track's format is already known from yt-dlp."""
+    return track.acodec is not None
+
+
+def create_audio_source(
+    track: Track,
+    codec: Optional[str] = None,
+    bitrate: Optional[int] = None,
+    start: float = 0.0,
+) -> discord.FFmpegOpusAudio:
+    """Build an Opus source from known format info, without running ffprobe.
+
+    Opus in WebM/Ogg is stream-copied; everything else is encoded to Opus at
+    the source bitrate. Explicit `codec`/`bitrate` (e.g. from a probe) win.
+    `start` seeks that many seconds into the track.
+    """
+    if codec is None and track.acodec == "opus" and track.container in OPUS_CONTAINERS:
+        codec = "copy"
+    if bitrate is None and track.abr:
+        bitrate = min(int(track.abr), MAX_BITRATE)
+
+    logger.debug(
+        f"Creating source for {track.title}: {track.acodec}/{track.container} -> "
+        f"{'copy' if codec in ('copy', 'opus') else 'libopus'} @ {bitrate or DEFAULT_BITRATE}kbps"
+    )
+    options = dict(DISCORD_FFMPEG_OPTIONS)
+    if start:
+        options["before_options"] = f"{options['before_options']} -ss {start:.1f}"
+    return discord.FFmpegOpusAudio(
+        track.audio_url,
+        codec=codec,
+        bitrate=bitrate or DEFAULT_BITRATE,
+        **options,
+    )
+
+
+async def open_audio_source(
+    track: Track, session: Optional[aiohttp.ClientSession] = None
+) -> discord.AudioSource:
+    """Demux WebM/Opus in-process when possible, otherwise build an FFmpeg source."""
+    if (
+        WEBM_PASSTHROUGH
+        and session is not None
+        and track.acodec == "opus"
+        and track.container == "webm"
+    ):
+        try:
+            return await WebMOpusSource.open(track.audio_url, session)
+        except (DemuxError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"WebM passthrough unavailable for {track.title}, using FFmpeg: {e}")
+    return create_audio_source(track)
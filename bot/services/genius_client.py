@@ -0,0 +1,244 @@
+import codecs
+import platform
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from bot.services.lyrics_query import is_confident
+from bot.services.search_cache import normalize_query
+from bot.utils.logger import setup_logger
+
+API_ROOT = "https://api.genius.com/"  # Authenticated API
+PUBLIC_API_ROOT = "https://genius.com/api/"  # What the website uses
+READ_CHUNK = 16 * 1024  # Bytes of a lyrics page parsed at a time
+
+# Titles of Genius "songs" that are really track lists, credits and the like
+EXCLUDED_TERMS = (
+    "tracklist", "track list", "album art", "album artwork", "liner notes",
+    "booklet", "credits", "interview", "skit", "setlist",
+)  # fmt: skip
+USER_AGENT = f"{platform.system()} {platform.release()}; Python {platform.python_version()}"
+_EXCLUDED_RE = re.compile("|".join(map(re.escape, EXCLUDED_TERMS)), re.IGNORECASE)
+_VOID_TAGS = frozenset(
+    ("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+     "source", "track", "wbr")
+)  # fmt: skip
+
+logger = setup_logger(name="genius_client", log_file="lyrics.log")
+
+
+@dataclass
+class GeniusSong:
+    """A Genius song with its scraped lyrics."""
+
+    title: str
+    artist: str
+    url: str
+    lyrics: str
+
+
+class LyricsPageParser(HTMLParser):
+    """Incremental parser that keeps only the text of a page's lyrics containers.
+
+    Everything outside `<div data-lyrics-container="true">` is skipped, as
+    are section headers and elements marked `data-exclude-from-selection`.
+    `done` is set once the lyrics footer is reached, so the rest of the page
+    need not be parsed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._parts: List[str] = []
+        self._open: List[Tuple[str, bool]] = []  # (tag, excluded) inside a container
+        self.containers = 0
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts).strip("\n")
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        css_class = attributes.get("class") or ""
+        if not self._open:
+            if tag == "div" and attributes.get("data-lyrics-container") == "true":
+                self._open.append((tag, False))
+                self.containers += 1
+            elif tag == "div" and self.containers and "LyricsFooter" in css_class:
+                self.done = True
+            return
+
+        excluded = self._open[-1][1]
+        if tag in _VOID_TAGS:
+            if tag == "br" and not excluded:
+                self._parts.append("\n")
+            return
+        excluded = (
+            excluded
+            or attributes.get("data-exclude-from-selection") == "true"
+            or (tag == "div" and "LyricsHeader" in css_class)
+        )
+        self._open.append((tag, excluded))
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS and self._open and self._open[-1][0] == tag:
+            self._open.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        # Pop up to the matching tag, tolerating unclosed children
+        for depth in range(len(self._open) - 1, -1, -1):
+            if self._open[depth][0] == tag:
+                del self._open[depth:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self._open and not self._open[-1][1]:
+            self._parts.append(data)
+
+
+def _is_lyrics(song: Dict[str, Any]) -> bool:
+    """False for instrumentals, unfinished transcriptions and non-song pages."""
+    if song.get("lyrics_state") != "complete" or song.get("instrumental"):
+        return False
+    return not _EXCLUDED_RE.search(song.get("title", ""))
+
+
+def _artist_name(song: Dict[str, Any]) -> str:
+    return (song.get("primary_artist") or {}).get("name", "")
+
+
+def _song_hits(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Song results of a search, top hits first."""
+    if "sections" in response:
+        hits = [hit for section in response["sections"] for hit in section["hits"]]
+    else:
+        hits = response.get("hits", [])
+    return [hit["result"] for hit in hits if hit.get("type", "song") == "song"]
+
+
+def pick_song(
+    songs: List[Dict[str, Any]], title: str, artist: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Choose the search result that best matches a title and artist.
+
+    An exact (normalized) match wins; otherwise the first result with lyrics
+    by the requested artist, or simply the first result if no artist was given.
+    """
+    wanted_title = normalize_query(title)
+    wanted_artist = normalize_query(artist) if artist else None
+    for song in songs:
+        if normalize_query(song.get("title", "")) == wanted_title and (
+            wanted_artist is None or normalize_query(_artist_name(song)) == wanted_artist
+        ):
+            return song
+
+    for song in songs:
+        if wanted_artist and normalize_query(_artist_name(song)) != wanted_artist:
+            continue
+        if _is_lyrics(song):
+            return song
+
+    if artist or not songs:
+        return None
+    return songs[0]
+
+
+class GeniusClient:
+    """Asyncio Genius client: song search plus a streamed scrape of the lyrics page.
+
+    One aiohttp session (and its keep-alive connector) is shared by every
+    lookup; `concurrency` caps open connections per host, so a burst of
+    lookups queues for a connection instead of occupying threads.
+    """
+
+    def __init__(self, token: Optional[str], timeout: float, concurrency: int) -> None:
+        self.token = token
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.api_root = API_ROOT
+        self.public_api_root = PUBLIC_API_ROOT
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.requests = 0  # HTTP requests made, for diagnostics
+
+    def _http(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.concurrency, ttl_dns_cache=300
+                ),
+                # Per socket operation, so waiting for a pooled connection doesn't count
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=self.timeout, sock_read=self.timeout
+                ),
+                headers={"User-Agent": USER_AGENT},
+            )
+        return self._session
+
+    async def _get_json(self, url: str, query: str, authenticated: bool = False) -> Dict[str, Any]:
+        headers = {"Authorization": f"Bearer {self.token}"} if authenticated else None
+        self.requests += 1
+        async with self._http().get(url, params={"q": query}, headers=headers) as response:
+            response.raise_for_status()
+            return (await response.json(content_type=None))["response"]
+
+    async def search(self, title: str, artist: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Find the song result for a title, falling back to the authenticated API."""
+        query = f"{title} {artist or ''}".strip()
+        response = await self._get_json(self.public_api_root + "search/multi", query)
+        song = pick_song(_song_hits(response), title, artist)
+        if song is None and self.token:
+            logger.debug("Trying the authenticated search")
+            response = await self._get_json(self.api_root + "search", query, authenticated=True)
+            song = pick_song(_song_hits(response), title, artist)
+        return song
+
+    async def page_lyrics(self, url: str) -> Optional[str]:
+        """Stream a song page through the parser and return its lyrics text."""
+        parser = LyricsPageParser()
+        self.requests += 1
+        async with self._http().get(url) as response:
+            response.raise_for_status()
+            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")("replace")
+            async for chunk in response.content.iter_chunked(READ_CHUNK):
+                if not parser.done:
+                    parser.feed(decoder.decode(chunk))
+                # Past the lyrics the body is only drained, keeping the connection reusable
+
+        if not parser.containers:
+            logger.warning(f"Couldn't find the lyrics section of {url}")
+            return None
+        return parser.text
+
+    async def search_song(
+        self, title: str, artist: Optional[str] = None, strict: bool = False
+    ) -> Optional[GeniusSong]:
+        """Search for a song and scrape its lyrics; None if there is no usable match.
+
+        With `strict`, a result that is not confidently the requested song is
+        rejected before its page is fetched.
+        """
+        song = await self.search(title, artist)
+        if song is None or not _is_lyrics(song):
+            return None
+        if strict and not is_confident(song.get("title", ""), _artist_name(song), title, artist):
+            logger.debug(f"Rejected {song.get('title')} as a match for {title}")
+            return None
+
+        lyrics = await self.page_lyrics(song["url"])
+        if not lyrics:
+            return None
+        return GeniusSong(
+            title=song.get("title", title),
+            artist=_artist_name(song),
+            url=song["url"],
+            lyrics=lyrics,
+        )
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
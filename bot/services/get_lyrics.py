@@ -1,14 +1,35 @@
 import asyncio
 from dataclasses import dataclass
-from typing import List, Optional
-
-import lyricsgenius
-
-from bot.utils.config import GENIUS_API_KEY
+from typing import Dict, List, Optional, Tuple
+
+from bot.services.genius_client import GeniusClient
+from bot.services.lyrics_cache import CachedLyrics, LyricsCache, lyrics_key
+from bot.services.lyrics_query import lyrics_candidates
+from bot.utils.config import (
+    GENIUS_API_KEY,
+    LYRICS_CACHE_PATH,
+    LYRICS_CACHE_TTL,
+    LYRICS_MISS_TTL,
+)
 from bot.utils.logger import setup_logger
+from bot.utils.single_flight import SingleFlight
+
+LYRICS_TIMEOUT = 10  # seconds per Genius socket connect or read
+LYRICS_DEADLINE = 3 * LYRICS_TIMEOUT  # seconds per lookup (searches and page)
+LYRICS_CHUNK_SIZE = 2850  # Characters per embed; two fit in one 6000-character message
+LYRICS_CONCURRENCY = 8  # Open connections per Genius host
+PREFETCH_CONCURRENCY = 2  # Background lookups in flight at once
+PREFETCH_BACKLOG = 16  # Background lookups waiting beyond which new ones are dropped
 
 logger = setup_logger(name="get_lyrics", log_file="lyrics.log")
 
+_genius: Optional[GeniusClient] = None
+_cache: Optional[LyricsCache] = None
+_inflight = SingleFlight()  # A request for a song being prefetched joins the prefetch
+_prefetch_slots = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+_prefetches: Dict[str, asyncio.Task] = {}
+_prefetch_counts = {"started": 0, "dropped": 0}
+
 
 class LyricsError(Exception):
     """Raised when lyrics fetching or parsing fails."""
@@ -24,34 +45,131 @@ class Lyrics:
     url: Optional[str] = None
 
 
-def _split_lyrics_into_chunks(text: str, max_chunk_size: int = 4000) -> List[str]:
-    """Split lyrics into Discord-safe chunks."""
+def _split_lyrics_into_chunks(
+    text: str, max_chunk_size: int = LYRICS_CHUNK_SIZE
+) -> List[str]:
+    """Split lyrics into Discord-safe chunks in one pass over the lines.
+
+    Lines are collected in a list and joined once per chunk; a single line
+    longer than `max_chunk_size` is cut into pieces.
+    """
     if max_chunk_size <= 0:
         raise ValueError("max_chunk_size must be > 0")
 
-    lines = text.split("\n")
-    chunks, current_chunk, current_size = [], "", 0
+    chunks: List[str] = []
+    lines: List[str] = []
+    size = 0
+
+    def flush() -> None:
+        chunk = "\n".join(lines).strip()
+        if chunk:
+            chunks.append(chunk)
+
+    for line in text.split("\n"):
+        while len(line) > max_chunk_size:
+            flush()
+            lines, size = [], 0
+            chunks.append(line[:max_chunk_size])
+            line = line[max_chunk_size:]
+
+        line_length = len(line) + 1  # Counting the newline that joins it
+        if size + line_length > max_chunk_size:
+            flush()
+            lines, size = [], 0
+        lines.append(line)
+        size += line_length
+
+    flush()
+    return chunks
 
-    for line in lines:
-        line_length = len(line) + 1
 
-        if current_size + line_length <= max_chunk_size:
-            current_chunk += line + "\n"
-            current_size += line_length
-        else:
-            if current_chunk.strip():
-                chunks.append(current_chunk.strip())
-            current_chunk = line + "\n"
-            current_size = line_length
+def split_query(query: str) -> Tuple[str, Optional[str]]:
+    """Split a "Song - Artist" query into the song name and optional artist."""
+    name, _, artist = query.partition(" - ")
+    return name, artist or None
+
+
+def get_genius() -> GeniusClient:
+    """Return the shared Genius client, whose connector keeps connections alive."""
+    global _genius
+    if _genius is None:
+        _genius = GeniusClient(GENIUS_API_KEY, LYRICS_TIMEOUT, LYRICS_CONCURRENCY)
+    return _genius
+
+
+def get_lyrics_cache() -> LyricsCache:
+    """Return the shared lyrics cache, opening it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = LyricsCache(LYRICS_CACHE_PATH, LYRICS_CACHE_TTL, LYRICS_MISS_TTL)
+    return _cache
+
+
+def _to_lyrics(entry: CachedLyrics) -> Lyrics:
+    """Build the chunked result from stored raw lyrics."""
+    final_text = f"{entry.text}\n\n🔗 Lyrics page: {entry.url}"
+    return Lyrics(
+        title=f"{entry.artist} - {entry.title}",
+        artists=entry.artist,
+        text=_split_lyrics_into_chunks(final_text),
+        url=entry.url,
+    )
+
+
+def _candidate_key(name: str, artist: Optional[str], strict: bool) -> str:
+    """Cache key of one candidate search, apart from the keys of whole lookups.
+
+    A strict search rejects loose matches, so its misses must not answer
+    a loose search, or a user query, for the same song and artist.
+    """
+    return f"{'strict' if strict else 'loose'}\x1f{lyrics_key(name, artist)}"
+
+
+async def _search_candidate(name: str, artist: Optional[str], strict: bool) -> CachedLyrics:
+    """Look one candidate query up, through its own cache entry."""
+    cache = get_lyrics_cache()
+    key = _candidate_key(name, artist, strict)
+    entry = await cache.peek(key)
+    if entry is None:
+        logger.debug(f"Searching for: {name} by {artist or 'any artist'}")
+        song = await get_genius().search_song(name, artist, strict=strict)
+        entry = (
+            CachedLyrics(title=song.title, artist=song.artist, text=song.lyrics, url=song.url)
+            if song
+            else CachedLyrics()
+        )
+        await cache.put(key, entry)
+    return entry
 
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
 
-    return chunks
+async def _search(track_name: str, artist_hint: Optional[str]) -> CachedLyrics:
+    """Try the ranked candidate queries for a title, stopping at the first match.
+
+    Every candidate but the last must match confidently, so a loose result
+    for an early guess doesn't shadow the right song further down.
+    """
+    candidates = lyrics_candidates(track_name, artist_hint)
+    async with asyncio.timeout(LYRICS_DEADLINE):
+        for rank, (name, artist) in enumerate(candidates):
+            entry = await _search_candidate(name, artist, strict=rank < len(candidates) - 1)
+            if entry.found:
+                logger.debug(f"Found song: {entry.title} by {entry.artist}")
+                return entry
+    return CachedLyrics()
+
+
+async def _lookup(key: str, track_name: str, artist_name: Optional[str]) -> CachedLyrics:
+    """Search Genius and store the outcome, found or not."""
+    entry = await _search(track_name, artist_name)
+    await get_lyrics_cache().put(key, entry)
+    return entry
 
 
 async def get_lyrics(track_name: str, artist_name: Optional[str] = None) -> Lyrics:
-    """Fetch lyrics for a song, optionally by a specific artist."""
+    """Fetch lyrics for a song or video title, optionally with an artist hint.
+
+    The hint may be a channel name such as "Artist - Topic" or "ArtistVEVO".
+    """
     logger.debug(f"Fetching lyrics for: {track_name} by {artist_name or 'any artist'}")
 
     if not GENIUS_API_KEY:
@@ -59,40 +177,66 @@ async def get_lyrics(track_name: str, artist_name: Optional[str] = None) -> Lyri
         raise LyricsError("GENIUS_API_KEY is missing")
 
     try:
-        genius = lyricsgenius.Genius(
-            GENIUS_API_KEY,
-            verbose=False,
-            remove_section_headers=False,
-            skip_non_songs=True,
-            timeout=15,
-        )
-
-        if artist_name:
-            logger.debug(f"Searching for {track_name} by {artist_name}")
-            song = await asyncio.to_thread(genius.search_song, track_name, artist_name)
+        cache = get_lyrics_cache()
+        key = lyrics_key(track_name, artist_name)
+        entry = await cache.get(key)
+        if entry is None:
+            entry = await _inflight.do(
+                key, lambda: _lookup(key, track_name, artist_name)
+            )
         else:
-            logger.debug(f"Searching for: {track_name}")
-            song = await asyncio.to_thread(genius.search_song, track_name)
+            logger.debug(f"Lyrics cache hit for: {track_name}")
 
-        if not song:
+        if not entry.found:
             logger.error(f"No results found for: {track_name}")
             raise LyricsError("Track not found in Genius search results")
 
-        logger.debug(f"Found song: {song.title} by {song.artist}")
-
-        raw_lyrics = song.lyrics or ""
-        final_text = f"{raw_lyrics}\n\n🔗 Lyrics page: {song.url}"
-        chunks = _split_lyrics_into_chunks(final_text)
-
-        lyrics_obj = Lyrics(
-            title=f"{song.artist} - {song.title}",
-            artists=song.artist,
-            text=chunks,
-            url=song.url,
-        )
-
-        return lyrics_obj
+        return _to_lyrics(entry)
 
     except Exception as e:
         logger.exception(f"Error in advanced lyrics fetch: {e}")
         raise LyricsError(f"Failed to fetch lyrics: {e}") from e
+
+
+# ========== PREFETCH ==========
+async def _prefetch(key: str, track_name: str, artist_name: Optional[str]) -> None:
+    try:
+        async with _prefetch_slots:
+            if await get_lyrics_cache().peek(key) is None:
+                await _inflight.do(key, lambda: _lookup(key, track_name, artist_name))
+    except Exception as e:
+        logger.debug(f"Lyrics prefetch failed for {track_name}: {e}")
+
+
+def prefetch_lyrics(track_name: str, artist_name: Optional[str] = None) -> None:
+    """Warm the cache for a song in the background, at most PREFETCH_CONCURRENCY at a time.
+
+    Prefetches never hold up user lookups, which skip the slots and join a
+    running prefetch of the same song instead of searching again.
+    """
+    if not GENIUS_API_KEY:
+        return
+    key = lyrics_key(track_name, artist_name)
+    if key in _prefetches:
+        return
+    if len(_prefetches) >= PREFETCH_CONCURRENCY + PREFETCH_BACKLOG:
+        _prefetch_counts["dropped"] += 1
+        return
+
+    _prefetch_counts["started"] += 1
+    task = asyncio.create_task(_prefetch(key, track_name, artist_name))
+    _prefetches[key] = task
+    task.add_done_callback(lambda _: _prefetches.pop(key, None))
+
+
+def prefetch_stats() -> Dict[str, int]:
+    """Current prefetch counters for diagnostics."""
+    return {**_prefetch_counts, "pending": len(_prefetches)}
+
+
+async def close_lyrics() -> None:
+    """Cancel background prefetches and close the Genius client."""
+    for task in list(_prefetches.values()):
+        task.cancel()
+    if _genius is not None:
+        await _genius.close()
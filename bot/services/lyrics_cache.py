@@ -0,0 +1,122 @@
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from bot.services.search_cache import normalize_query
+from bot.utils.executors import ExecutorRejected, run_blocking
+from bot.utils.logger import setup_logger
+
+logger = setup_logger(name="lyrics_cache", log_file="lyrics.log")
+
+
+def lyrics_key(title: str, artist: Optional[str] = None) -> str:
+    """Cache key for a lyrics lookup, shared by equivalent spellings."""
+    return f"{normalize_query(title)}\x1f{normalize_query(artist or '')}"
+
+
+@dataclass
+class CachedLyrics:
+    """A stored lookup; `text` is None when Genius had no match."""
+
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    text: Optional[str] = None
+    url: Optional[str] = None
+
+    @property
+    def found(self) -> bool:
+        return self.text is not None
+
+
+class LyricsCache:
+    """SQLite-backed store of raw lyrics keyed by normalized (title, artist).
+
+    Found lyrics are kept for `ttl` seconds; misses are remembered for the
+    shorter `miss_ttl` so songs Genius lacks are not searched every time,
+    yet get another chance once it may have them.
+    """
+
+    def __init__(self, path: Path, ttl: int, miss_ttl: int) -> None:
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS lyrics (key TEXT PRIMARY KEY, stored_at REAL NOT NULL, "
+                "title TEXT, artist TEXT, text TEXT, url TEXT)"
+            )
+            now = time.time()
+            self._conn.execute(
+                "DELETE FROM lyrics WHERE stored_at < ? OR (text IS NULL AND stored_at < ?)",
+                (now - ttl, now - miss_ttl),
+            )
+        logger.debug(f"Lyrics cache opened at {path}")
+
+    # ========== SYNC API ==========
+    def _get(self, key: str) -> Optional[CachedLyrics]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, title, artist, text, url FROM lyrics WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+
+        stored_at, *fields = row
+        entry = CachedLyrics(*fields)
+        if time.time() - stored_at > (self.ttl if entry.found else self.miss_ttl):
+            return None
+        return entry
+
+    def _put(self, key: str, entry: CachedLyrics) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lyrics VALUES (?, ?, ?, ?, ?, ?)",
+                (key, time.time(), entry.title, entry.artist, entry.text, entry.url),
+            )
+
+    # ========== ASYNC API ==========
+    async def _read(self, key: str) -> Optional[CachedLyrics]:
+        try:
+            return await run_blocking("storage", self._get, key)
+        except ExecutorRejected:
+            logger.warning("Storage pool saturated, treating lyrics lookup as a miss")
+            return None
+
+    async def get(self, key: str) -> Optional[CachedLyrics]:
+        """Return the stored lookup for a key, found or not, unless it has expired."""
+        entry = await self._read(key)
+        if entry is None:
+            self.misses += 1
+        elif entry.found:
+            self.hits += 1
+        else:
+            self.negative_hits += 1
+        return entry
+
+    async def peek(self, key: str) -> Optional[CachedLyrics]:
+        """Like `get`, without counting towards the hit/miss statistics."""
+        return await self._read(key)
+
+    async def put(self, key: str, entry: CachedLyrics) -> None:
+        """Store a lookup result; pass an entry without text to record a miss."""
+        try:
+            await run_blocking("storage", self._put, key, entry)
+        except ExecutorRejected:
+            logger.warning("Storage pool saturated, lyrics lookup not cached")
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current counters for diagnostics."""
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,134 @@
+import re
+import unicodedata
+from typing import List, Optional, Set, Tuple
+
+from bot.services.lyrics_cache import lyrics_key
+from bot.services.search_cache import normalize_query
+
+MAX_CANDIDATES = 3  # Genius searches tried per lookup at most
+
+# Words that only describe the upload, never the song
+_DECORATION_RE = re.compile(
+    r"\b(?:official|video|audio|lyrics?|visuali[sz]er|hd|hq|4k|8k|\d{3,4}p|remaster(?:ed)?"
+    r"|re-?mastered|mv|m/v|music|clip|explicit|clean|color coded|upgrade|live|version"
+    r"|radio edit|mono|stereo|soundtrack|ost|full|performance|from\s.+|prod\.?\s.+"
+    r"|feat\.?\s.+|ft\.?\s.+|featuring\s.+|in|with|and|the|\d{4})\b",
+    re.IGNORECASE,
+)
+# A part or bracket is only dropped if it has one of these, so a song called "Music" survives
+_STRONG_DECORATION_RE = re.compile(
+    r"\b(?:official|video|audio|lyrics?|visuali[sz]er|hd|hq|4k|8k|\d{3,4}p|remaster(?:ed)?"
+    r"|re-?mastered|mv|m/v|live|version|edit|soundtrack|ost|feat\.?|ft\.?|featuring|with|from"
+    r"|prod\.?)(?:\b|$)",
+    re.IGNORECASE,
+)
+_BRACKETS_RE = re.compile(r"[(\[{【]([^)\]}】]*)[)\]}】]")
+_FEATURING_RE = re.compile(r"\s+(?:feat\.?|ft\.?|featuring)\s.*$", re.IGNORECASE)
+_QUOTED_RE = re.compile(r"(?:^|(?<=\s))['\"“‘「](.+?)['\"”’」](?=\s|$)")
+_SEPARATOR_RE = re.compile(r"\s+[-–—|~]\s+")
+_TOPIC_RE = re.compile(r"\s+-\s+Topic$")
+_CHANNEL_SUFFIX_RE = re.compile(r"(?:VEVO|\s*Official|\s*Music|\s+TV)$", re.IGNORECASE)
+_CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+_STOPWORDS = frozenset(("the", "a", "an", "and", "&", "x"))
+
+
+def tokens(text: str) -> Set[str]:
+    """Normalized words of a title or artist, minus filler words."""
+    # Genius titles sometimes carry invisible format characters ("\u200bbad guy")
+    text = "".join(char for char in text if unicodedata.category(char) != "Cf")
+    return set(normalize_query(text).split()) - _STOPWORDS
+
+
+def _is_decoration(text: str) -> bool:
+    """True if text is made only of upload decorations like "Official Video [4K]"."""
+    return bool(_STRONG_DECORATION_RE.search(text)) and not normalize_query(
+        _DECORATION_RE.sub(" ", text)
+    )
+
+
+def clean_part(text: str) -> str:
+    """Strip decorated brackets, featured artists and stray quotes from a title part."""
+    quoted = _QUOTED_RE.search(text)
+    if quoted and _is_decoration(text[: quoted.start()] + text[quoted.end() :]):
+        text = quoted.group(1)  # "'Song' M/V"
+    text = _BRACKETS_RE.sub(
+        lambda match: " " if _is_decoration(match.group(1)) else match.group(0), text
+    )
+    text = _FEATURING_RE.sub("", text)
+    text = " ".join(text.split()).strip(" '\"“”‘’「」")
+    return text
+
+
+def clean_artist(author: Optional[str]) -> Optional[str]:
+    """Turn a channel name ("Artist - Topic", "ArtistVEVO") into an artist hint."""
+    if not author:
+        return None
+    name = _TOPIC_RE.sub("", author.strip())
+    while (stripped := _CHANNEL_SUFFIX_RE.sub("", name)) and stripped != name:
+        name = stripped
+    if " " not in name:
+        name = _CAMEL_RE.sub(" ", name)  # "ImagineDragons" -> "Imagine Dragons"
+    return name.strip() or None
+
+
+def _related(a: str, b: str) -> bool:
+    return bool(tokens(a) & tokens(b))
+
+
+def lyrics_candidates(
+    title: str, artist_hint: Optional[str] = None
+) -> List[Tuple[str, Optional[str]]]:
+    """Ranked (song, artist) queries for a video title, most likely first.
+
+    "Artist - Song" titles are split on their separator, with the channel
+    name deciding which side is the artist. Parts that are only decorations
+    ("Official Video", "2011 Remaster") are dropped, as are featured artists.
+    """
+    hint = clean_artist(artist_hint)
+    parts = [clean_part(part) for part in _SEPARATOR_RE.split(title)]
+    parts = [part for part in parts if part and not _is_decoration(part)]
+
+    candidates: List[Tuple[str, Optional[str]]] = []
+    if len(parts) >= 2:
+        left, right = parts[0], parts[1]
+        if hint and _related(hint, right) and not _related(hint, left):
+            candidates += [(left, right), (right, left)]
+        else:
+            candidates += [(right, left), (left, right)]
+    elif parts:
+        song = parts[0]
+        quoted = _QUOTED_RE.search(song)
+        if quoted:  # 'Artist "Song" MV'
+            artist = clean_part(song[: quoted.start()]) or hint
+            song = clean_part(quoted.group(1))
+            candidates.append((song, artist))
+        if hint:
+            candidates.append((song, hint))
+        candidates.append((song, None))
+    else:
+        candidates.append((title, hint))
+
+    unique: List[Tuple[str, Optional[str]]] = []
+    seen: Set[str] = set()
+    for song, artist in candidates:
+        key = lyrics_key(song, artist)
+        if song and key not in seen:
+            seen.add(key)
+            unique.append((song, artist))
+    return unique[:MAX_CANDIDATES]
+
+
+def is_confident(
+    song_title: str, song_artist: str, title: str, artist: Optional[str]
+) -> bool:
+    """Whether a search result plausibly is the song asked for.
+
+    Title words must match one way or the other (Genius titles may add or
+    drop a subtitle), and the artist, if given, must share a word.
+    """
+    wanted, found = tokens(title), tokens(song_title)
+    if not wanted or not found:
+        return False
+    if not (wanted <= found or (found <= wanted and 2 * len(found) >= len(wanted))):
+        return False
+    return artist is None or _related(artist, song_artist)
@@ -7,11 +7,28 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 import discord
 
 from bot.cogs import EMBED_COLOR
+from bot.services.timer_wheel import Timer
 
 if TYPE_CHECKING:
     from bot.cogs.minigames import MinigamesCog
 
 
+class GameView(discord.ui.View):
+    """Base view for game boards.
+
+    The view itself never times out; every interaction re-arms the game's
+    inactivity timer on the bot's shared timer wheel instead.
+    """
+
+    def __init__(self, game: "Game") -> None:
+        super().__init__(timeout=None)
+        self.game = game
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        self.game.touch()
+        return True
+
+
 class Game(ABC):
     """
     Abstract base class for implementing multiplayer games in Discord.
@@ -42,6 +59,7 @@ class Game(ABC):
         self.config: Dict[str, Any] = game_config
         self.lock: asyncio.Lock = asyncio.Lock()
         self.game_over: bool = False
+        self._timeout_timer: Optional[Timer] = None
 
     @property
     def current_player(self) -> discord.Member:
@@ -86,6 +104,7 @@ class Game(ABC):
             await thread.add_user(player)
         self.thread = thread
         self.cog.active_games[interaction.channel_id] = self
+        self.touch()
         await interaction.response.send_message(
             f"Game started at {thread.mention} for {', '.join([player.mention for player in self.players])}"
         )
@@ -126,6 +145,15 @@ class Game(ABC):
             return False
         return True
 
+    def touch(self) -> None:
+        """Restart the inactivity timeout."""
+        if self._timeout_timer:
+            self._timeout_timer.cancel()
+        if not self.game_over:
+            self._timeout_timer = self.cog.bot.timers.schedule(
+                self.timeout, self.handle_timeout
+            )
+
     async def end_game(self) -> None:
         """Clean up game resources and declare results."""
         if self.game_over:
@@ -133,6 +161,8 @@ class Game(ABC):
 
         try:
             self.game_over = True
+            if self._timeout_timer:
+                self._timeout_timer.cancel()
 
             if self.view and not self.view.is_finished():
                 self.view.stop()
@@ -1,4 +1,3 @@
-import asyncio
 from io import BytesIO
 from typing import TYPE_CHECKING, Dict, List, Optional
 
@@ -8,8 +7,9 @@ import chess.svg
 import discord
 
 from bot.cogs import EMBED_COLOR
+from bot.utils.executors import ExecutorRejected, run_blocking
 
-from . import Game
+from . import Game, GameView
 
 if TYPE_CHECKING:
     from bot.cogs.minigames import MinigamesCog
@@ -39,12 +39,11 @@ class ChessMoveModal(discord.ui.Modal, title="Make Your Chess Move"):
         await self.view.game.make_move(interaction, self.move_input.value)
 
 
-class ChessView(discord.ui.View):
+class ChessView(GameView):
     """View for the Chess game interactions."""
 
     def __init__(self, game: "Chess") -> None:
-        super().__init__(timeout=game.timeout)
-        self.game = game
+        super().__init__(game)
 
     async def validate_interaction(self, interaction: discord.Interaction) -> bool:
         """Validate if the interaction is from a valid player and it's their turn."""
@@ -76,10 +75,6 @@ class ChessView(discord.ui.View):
         if await self.game.check_membership(interaction):
             await self.game.handle_draw_offer(interaction)
 
-    async def on_timeout(self) -> None:
-        """Handle view timeout."""
-        await self.game.handle_timeout()
-
 
 class Chess(Game):
     """A robust Discord chess game implementation."""
@@ -127,9 +122,8 @@ class Chess(Game):
         await super().start(interaction)
         self.view = ChessView(self)
         embed = self._create_status_embed()
-        file = await self._render_board()
-        embed.set_image(url=f"attachment://{BOARD_FILENAME}")
-        self.message = await self.thread.send(embed=embed, view=self.view, file=file)
+        files = await self._attach_board(embed)
+        self.message = await self.thread.send(embed=embed, view=self.view, files=files)
 
     async def make_move(self, interaction: discord.Interaction, move_str: str) -> None:
         """Process a player's move and update game state."""
@@ -153,10 +147,7 @@ class Chess(Game):
             if self.is_game_over():
                 await self.handle_game_end()
             else:
-                embed = self._create_status_embed()
-                file = await self._render_board()
-                embed.set_image(url=f"attachment://{BOARD_FILENAME}")
-                await self.message.edit(embed=embed, attachments=[file])
+                await self._update_board_state()
 
     def get_winner(self) -> Optional[discord.Member]:
         """Determine the winner of the game."""
@@ -180,8 +171,11 @@ class Chess(Game):
                 continue
         return None
 
-    async def _render_board(self) -> discord.File:
-        """Render the chess board as a PNG file (runs SVG conversion in thread pool)."""
+    async def _render_board(self) -> Optional[discord.File]:
+        """Render the chess board as a PNG file (runs SVG conversion in the render pool).
+
+        Returns None if the render pool is saturated.
+        """
         orientation = self.colors[self.current_player]
         svg = chess.svg.board(
             board=self.board,
@@ -189,10 +183,27 @@ class Chess(Game):
             lastmove=self.board.peek() if self.board.move_stack else None,
             check=self.board.king(self.board.turn) if self.board.is_check() else None,
         )
-        # Run blocking cairosvg operation in thread pool
-        png = await asyncio.to_thread(cairosvg.svg2png, bytestring=svg.encode("utf-8"))
+        # Run blocking cairosvg operation in the render pool
+        try:
+            png = await run_blocking(
+                "render", cairosvg.svg2png, bytestring=svg.encode("utf-8")
+            )
+        except ExecutorRejected:
+            self.cog.logger.warning("Render pool saturated, sending the board as text")
+            return None
         return discord.File(BytesIO(png), filename=BOARD_FILENAME)
 
+    async def _attach_board(self, embed: discord.Embed) -> List[discord.File]:
+        """Show the board in an embed: as an image, or as text if it couldn't be rendered."""
+        file = await self._render_board()
+        if file is None:
+            embed.add_field(
+                name="Board", value=f"```{self.board.unicode(empty_square='·')}```", inline=False
+            )
+            return []
+        embed.set_image(url=f"attachment://{BOARD_FILENAME}")
+        return [file]
+
     def _create_status_embed(self) -> discord.Embed:
         """Create an embed showing the current game status."""
         player0, player1 = list(self.colors.keys())
@@ -247,18 +258,18 @@ class Chess(Game):
 
     async def handle_game_end(self) -> None:
         """Handle the end of the game, sending results and cleaning up."""
-        embed = self._create_result_embed()
-        file = await self._render_board()
-        embed.set_image(url=f"attachment://{BOARD_FILENAME}")
-        await self.interaction.channel.send(embed=embed, file=file)
-        await self.end_game()
+        try:
+            embed = self._create_result_embed()
+            files = await self._attach_board(embed)
+            await self.interaction.channel.send(embed=embed, files=files)
+        finally:
+            await self.end_game()
 
     async def _update_board_state(self) -> None:
         """Update the board message with current state."""
         embed = self._create_status_embed()
-        file = await self._render_board()
-        embed.set_image(url=f"attachment://{BOARD_FILENAME}")
-        await self.message.edit(embed=embed, attachments=[file])
+        files = await self._attach_board(embed)
+        await self.message.edit(embed=embed, attachments=files)
 
     def _get_move_log(self) -> str:
         """Get a string representation of the move log."""
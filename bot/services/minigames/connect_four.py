@@ -5,7 +5,7 @@ import discord
 if TYPE_CHECKING:
     from bot.cogs.minigames import MinigamesCog
 
-from . import EMBED_COLOR, Game
+from . import EMBED_COLOR, Game, GameView
 
 EMPTY_CELL = "⚫"
 SYMBOLS = ("🔴", "🟡")
@@ -29,12 +29,11 @@ class Connect4Button(discord.ui.Button["Connect4View"]):
         await self.view.game.make_move(interaction, self.col)
 
 
-class Connect4View(discord.ui.View):
+class Connect4View(GameView):
     """The interactive view for the Connect 4 board."""
 
     def __init__(self, game: "Connect4") -> None:
-        super().__init__(timeout=game.timeout)
-        self.game = game
+        super().__init__(game)
         self._add_column_buttons()
 
     def _add_column_buttons(self) -> None:
@@ -51,10 +50,6 @@ class Connect4View(discord.ui.View):
                     self.game.is_column_full(item.col) or self.game.is_game_over()
                 )
 
-    async def on_timeout(self) -> None:
-        """Handle view timeout."""
-        await self.game.handle_timeout()
-
 
 class Connect4(Game):
     """Connect 4 game implementation."""
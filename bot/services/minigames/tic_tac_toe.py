@@ -5,7 +5,7 @@ import discord
 if TYPE_CHECKING:
     from bot.cogs.minigames import MinigamesCog
 
-from . import EMBED_COLOR, Game
+from . import EMBED_COLOR, Game, GameView
 
 EMPTY_CELL = "⬜"
 SYMBOLS = ("❌", "⭕")
@@ -30,12 +30,11 @@ class TicTacToeButton(discord.ui.Button["TicTacToeView"]):
         await self.view.game.make_move(interaction, self.row, self.col)
 
 
-class TicTacToeView(discord.ui.View):
+class TicTacToeView(GameView):
     """The interactive view for the Tic-Tac-Toe board."""
 
     def __init__(self, game: "TicTacToe") -> None:
-        super().__init__(timeout=game.timeout)
-        self.game = game
+        super().__init__(game)
         self.update_board()
 
     def update_board(self) -> None:
@@ -46,10 +45,6 @@ class TicTacToeView(discord.ui.View):
                 button = TicTacToeButton(row, col, self.game.board[row][col])
                 self.add_item(button)
 
-    async def on_timeout(self) -> None:
-        """Handle view timeout."""
-        await self.game.handle_timeout()
-
 
 class TicTacToe(Game):
     """Tic-Tac-Toe game implementation."""
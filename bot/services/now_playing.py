@@ -0,0 +1,84 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import discord
+
+from bot.utils.logger import setup_logger
+
+EDIT_INTERVAL = 5.0  # seconds, Discord allows ~5 message edits per 5s per channel
+
+logger = setup_logger(name="now_playing")
+
+
+@dataclass
+class PanelStats:
+    """Counters shared by every guild's panel."""
+
+    requested: int = 0  # Panel updates asked for
+    edits: int = 0  # Messages edited in place
+    posts: int = 0  # Messages sent (first post or repost)
+
+    def snapshot(self) -> Dict[str, int]:
+        return {"requested": self.requested, "edits": self.edits, "posts": self.posts}
+
+
+class NowPlayingPanel:
+    """A single "now playing" message per guild, edited in place.
+
+    Updates only replace the pending embed; one task applies the latest one
+    at most once per EDIT_INTERVAL, so a burst of skips costs a single edit.
+    The message is reposted only if it was deleted (or the channel changed).
+    """
+
+    def __init__(self, stats: PanelStats) -> None:
+        self.stats = stats
+        self.message: Optional[discord.Message] = None
+        self._channel: Optional[discord.abc.Messageable] = None
+        self._pending: Optional[discord.Embed] = None
+        self._last_write = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def update(self, channel: discord.abc.Messageable, embed: discord.Embed) -> None:
+        """Show `embed` in the panel as soon as the rate limit allows."""
+        self.stats.requested += 1
+        self._channel = channel
+        self._pending = embed
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        while self._pending is not None:
+            delay = self._last_write + EDIT_INTERVAL - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            embed, self._pending = self._pending, None
+            channel = self._channel
+            try:
+                await self._write(channel, embed)
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to update now playing panel: {e}")
+            self._last_write = time.monotonic()
+
+    async def _write(self, channel: discord.abc.Messageable, embed: discord.Embed) -> None:
+        message = self.message
+        if message is not None and message.channel.id == getattr(channel, "id", None):
+            try:
+                await message.edit(embed=embed)
+                self.stats.edits += 1
+                return
+            except discord.NotFound:
+                logger.debug("Now playing message was deleted, reposting")
+
+        self.message = await channel.send(embed=embed)
+        self.stats.posts += 1
+
+    def close(self) -> None:
+        """Stop pending updates and forget the message."""
+        if self._task:
+            self._task.cancel()
+        self._task = None
+        self._pending = None
+        self.message = None
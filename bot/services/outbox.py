@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import discord
+
+from bot.utils.logger import setup_logger
+
+BATCH_WINDOW = 1.5  # seconds notices are collected before a send
+SEND_INTERVAL = 1.0  # seconds between sends per channel (Discord allows 5 per 5s)
+MAX_MESSAGE_LENGTH = 2000
+
+logger = setup_logger(name="outbox")
+
+
+class _ChannelOutbox:
+    """Pending notices for one channel and the task that sends them."""
+
+    def __init__(self, channel: discord.abc.Messageable) -> None:
+        self.channel = channel
+        self.pending: List[str] = []
+        self.last_send = 0.0
+        self.task: Optional[asyncio.Task] = None
+
+
+class Outbox:
+    """Per-channel batcher that merges short notices into as few messages as possible.
+
+    Notices posted within BATCH_WINDOW of each other are joined line by line
+    (split at Discord's length limit), and a channel is never sent to more
+    than once per SEND_INTERVAL, keeping well inside its rate-limit bucket.
+    """
+
+    def __init__(self) -> None:
+        self._channels: Dict[int, _ChannelOutbox] = {}
+        self.notices = 0
+        self.messages = 0
+        self.saved = 0  # Notices that shared a message instead of taking their own send
+        self.failed = 0  # Notices lost to a failed send
+
+    def post(self, channel: discord.abc.Messageable, text: str) -> None:
+        """Queue a notice for `channel`; it is sent with any others within the window."""
+        outbox = self._channels.get(channel.id)
+        if outbox is None:
+            outbox = self._channels[channel.id] = _ChannelOutbox(channel)
+        outbox.channel = channel
+        outbox.pending.append(text[:MAX_MESSAGE_LENGTH])
+        self.notices += 1
+        if outbox.task is None or outbox.task.done():
+            outbox.task = asyncio.create_task(self._drain(channel.id, outbox))
+
+    @staticmethod
+    def _take_batch(pending: List[str]) -> List[str]:
+        """Pop as many notices as fit in one message."""
+        lines = [pending.pop(0)]
+        length = len(lines[0])
+        while pending and length + 1 + len(pending[0]) <= MAX_MESSAGE_LENGTH:
+            length += 1 + len(pending[0])
+            lines.append(pending.pop(0))
+        return lines
+
+    async def _drain(self, channel_id: int, outbox: _ChannelOutbox) -> None:
+        await asyncio.sleep(BATCH_WINDOW)
+        while outbox.pending:
+            delay = outbox.last_send + SEND_INTERVAL - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            lines = self._take_batch(outbox.pending)
+            try:
+                await outbox.channel.send("\n".join(lines))
+                self.messages += 1
+                self.saved += len(lines) - 1
+            except discord.HTTPException as e:
+                self.failed += len(lines)
+                logger.warning(f"Failed to send notices to channel {channel_id}: {e}")
+            outbox.last_send = time.monotonic()
+
+        if self._channels.get(channel_id) is outbox and not outbox.pending:
+            del self._channels[channel_id]
+
+    def close(self) -> None:
+        """Drop pending notices and stop all send tasks."""
+        for outbox in self._channels.values():
+            if outbox.task:
+                outbox.task.cancel()
+        self._channels.clear()
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current counters for diagnostics."""
+        return {
+            "notices": self.notices,
+            "messages": self.messages,
+            "saved": self.saved,
+            "failed": self.failed,
+        }
@@ -0,0 +1,244 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from bot.services.track_cache import STATIC_FIELDS
+from bot.services.yt_source import Track
+from bot.utils.executors import run_blocking
+from bot.utils.logger import setup_logger
+
+FLUSH_INTERVAL = 1.0  # seconds journal writes are batched for
+COMPACT_EVERY = 5000  # Journal rows that trigger folding into snapshots
+
+logger = setup_logger(name="player_store")
+
+
+@dataclass
+class SavedPlayer:
+    """A guild's player state as last persisted."""
+
+    channel_id: Optional[int] = None  # Voice channel
+    text_channel_id: Optional[int] = None  # Where now-playing messages go
+    loop: bool = False
+    current: Optional[Dict[str, Any]] = None
+    position: float = 0.0  # Seconds into the current track (or queue head, if none)
+    queue: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def tracks(self) -> List[Track]:
+        """The queue as unresolved tracks."""
+        return [Track(audio_url="", **fields) for fields in self.queue]
+
+    @property
+    def current_track(self) -> Optional[Track]:
+        return Track(audio_url="", **self.current) if self.current else None
+
+
+def _encode(value: Any) -> Any:
+    """Reduce tracks to their static fields so journal entries are JSON."""
+    if isinstance(value, Track):
+        return {name: getattr(value, name) for name in STATIC_FIELDS}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _apply(state: Optional[SavedPlayer], op: str, args: List[Any]) -> Optional[SavedPlayer]:
+    """Replay one journal entry onto a saved player, returning the new state."""
+    if op == "remove":
+        return None
+    state = state or SavedPlayer()
+    queue = state.queue
+
+    if op == "extend":
+        queue.extend(args[0])
+    elif op == "appendleft":
+        queue.insert(0, args[0])
+    elif op == "insert":
+        queue.insert(args[0], args[1])
+    elif op == "pop":
+        if -len(queue) <= args[0] < len(queue):
+            queue.pop(args[0])
+    elif op == "pop_range":
+        del queue[args[0] : args[1]]
+    elif op == "clear":
+        queue.clear()
+    elif op == "replace":
+        state.queue = args[0]
+    elif op == "current":
+        state.current, state.position = args[0], 0.0
+    elif op == "position":
+        state.position = args[0]
+    elif op == "loop":
+        state.loop = args[0]
+    elif op == "voice":
+        state.channel_id, state.text_channel_id = args
+    else:
+        logger.warning(f"Ignoring unknown journal op '{op}'")
+    return state
+
+
+class PlayerStore:
+    """Append-only journal of player mutations, compacted into per-guild snapshots.
+
+    Mutations are buffered in memory and written in one transaction every
+    FLUSH_INTERVAL, so a crash loses at most that much. Once the journal
+    grows past COMPACT_EVERY rows it is folded into the snapshot table.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[int, str, str]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._journal_rows = 0
+        self.closed = True
+        self.written = 0
+        self.compactions = 0
+
+    # ========== SYNC API ==========
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots "
+                "(guild_id INTEGER PRIMARY KEY, state TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS journal (seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "guild_id INTEGER NOT NULL, op TEXT NOT NULL, args TEXT NOT NULL)"
+            )
+            self._journal_rows = self._conn.execute("SELECT COUNT(*) FROM journal").fetchone()[0]
+
+    def _append(self, rows: List[Tuple[int, str, str]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO journal (guild_id, op, args) VALUES (?, ?, ?)", rows
+            )
+
+    def _guild_ids(self) -> List[int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT guild_id FROM snapshots UNION SELECT guild_id FROM journal"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _load(self, guild_id: int) -> Optional[SavedPlayer]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM snapshots WHERE guild_id = ?", (guild_id,)
+            ).fetchone()
+            entries = self._conn.execute(
+                "SELECT op, args FROM journal WHERE guild_id = ? ORDER BY seq", (guild_id,)
+            ).fetchall()
+
+        state = SavedPlayer(**json.loads(row[0])) if row else None
+        for op, args in entries:
+            state = _apply(state, op, json.loads(args))
+        return state
+
+    def _compact(self) -> None:
+        """Fold every journal entry into the snapshots and truncate the journal."""
+        with self._lock, self._conn:
+            entries = self._conn.execute(
+                "SELECT seq, guild_id, op, args FROM journal ORDER BY seq"
+            ).fetchall()
+            if not entries:
+                return
+
+            states: Dict[int, Optional[SavedPlayer]] = {}
+            for _, guild_id, op, args in entries:
+                if guild_id not in states:
+                    row = self._conn.execute(
+                        "SELECT state FROM snapshots WHERE guild_id = ?", (guild_id,)
+                    ).fetchone()
+                    states[guild_id] = SavedPlayer(**json.loads(row[0])) if row else None
+                states[guild_id] = _apply(states[guild_id], op, json.loads(args))
+
+            for guild_id, state in states.items():
+                if state is None:
+                    self._conn.execute("DELETE FROM snapshots WHERE guild_id = ?", (guild_id,))
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO snapshots VALUES (?, ?)",
+                        (guild_id, json.dumps(asdict(state))),
+                    )
+            self._conn.execute("DELETE FROM journal WHERE seq <= ?", (entries[-1][0],))
+        logger.info(f"Compacted {len(entries)} journal entries for {len(states)} guilds")
+
+    # ========== ASYNC API ==========
+    async def open(self) -> None:
+        """Open the database and start batching journal writes."""
+        await run_blocking("storage", self._open)
+        self.closed = False
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def record(self, guild_id: int, op: str, *args: Any) -> None:
+        """Queue a mutation for the journal; written on the next flush."""
+        if not self.closed:
+            self._pending.append((guild_id, op, json.dumps(_encode(list(args)))))
+
+    async def flush(self) -> None:
+        """Write buffered mutations, compacting if the journal has grown large."""
+        rows, self._pending = self._pending, []
+        if rows:
+            try:
+                await run_blocking("storage", self._append, rows)
+            except Exception:
+                # Nothing was written (one transaction); ops are index-based, so
+                # dropping any would corrupt every later replay for their guild
+                self._pending[:0] = rows
+                raise
+            self.written += len(rows)
+            self._journal_rows += len(rows)
+        if self._journal_rows >= COMPACT_EVERY:
+            await self.compact()
+
+    async def compact(self) -> None:
+        await run_blocking("storage", self._compact)
+        self._journal_rows = 0
+        self.compactions += 1
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to write player journal: {e}", exc_info=True)
+
+    async def guild_ids(self) -> List[int]:
+        """Guilds with saved state (some may turn out empty once replayed)."""
+        return await run_blocking("storage", self._guild_ids)
+
+    async def load(self, guild_id: int) -> Optional[SavedPlayer]:
+        """Replay a guild's snapshot and journal into its saved state."""
+        return await run_blocking("storage", self._load, guild_id)
+
+    async def close(self) -> None:
+        """Stop recording, flush what is buffered and compact for a fast next start."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._flush_task:
+            self._flush_task.cancel()
+        await self.flush()
+        await self.compact()
+        with self._lock:
+            self._conn.close()
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current counters for diagnostics."""
+        return {
+            "journal_rows": self._journal_rows + len(self._pending),
+            "written": self.written,
+            "compactions": self.compactions,
+        }
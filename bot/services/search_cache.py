@@ -0,0 +1,111 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from bot.utils.executors import ExecutorRejected, run_blocking
+from bot.utils.logger import setup_logger
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+logger = setup_logger(name="search_cache", log_file="yt-dlp.log")
+
+
+def normalize_query(query: str) -> str:
+    """Fold case, punctuation and whitespace so equivalent searches share a key."""
+    folded = unicodedata.normalize("NFKC", query).casefold()
+    stripped = "".join(
+        " " if unicodedata.category(char).startswith("P") else char for char in folded
+    )
+    return _WHITESPACE_RE.sub(" ", stripped).strip()
+
+
+class SearchCache:
+    """LRU + TTL cache of search results, optionally persisted to SQLite.
+
+    The in-memory LRU answers hot queries without touching disk; when a path
+    is given, entries are written through so they survive restarts.
+    """
+
+    def __init__(self, max_size: int, ttl: int, path: Optional[Path] = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, str]]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS searches "
+                    "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, results TEXT NOT NULL)"
+                )
+                self._conn.execute(
+                    "DELETE FROM searches WHERE stored_at < ?", (time.time() - ttl,)
+                )
+            logger.debug(f"Search cache persisted at {path}")
+
+    # ========== SYNC API ==========
+    def _load(self, key: str) -> Optional[Tuple[float, Dict[str, str]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, results FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def _store(self, key: str, stored_at: float, results: Dict[str, str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                (key, stored_at, json.dumps(results)),
+            )
+
+    def _remember(self, key: str, stored_at: float, results: Dict[str, str]) -> None:
+        self._entries[key] = (stored_at, results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    # ========== ASYNC API ==========
+    async def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Return cached results for a normalized key, if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None and self._conn is not None:
+            try:
+                entry = await run_blocking("storage", self._load, key)
+            except ExecutorRejected:
+                logger.warning("Storage pool saturated, treating search lookup as a miss")
+            if entry:
+                self._remember(key, *entry)
+
+        if entry is None or time.time() - entry[0] > self.ttl:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(entry[1])
+
+    async def put(self, key: str, results: Dict[str, str]) -> None:
+        """Store results for a normalized key."""
+        stored_at = time.time()
+        self._remember(key, stored_at, dict(results))
+        if self._conn is not None:
+            try:
+                await run_blocking("storage", self._store, key, stored_at, results)
+            except ExecutorRejected:
+                logger.warning("Storage pool saturated, search kept in memory only")
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current counters for diagnostics."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
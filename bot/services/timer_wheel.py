@@ -0,0 +1,150 @@
+import asyncio
+import inspect
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from bot.utils.logger import setup_logger
+
+TICK = 1.0  # seconds per wheel slot; timers fire on the first tick past their deadline
+SLOTS = 1024  # one rotation covers ~17 minutes; longer timers wait extra rotations
+LATE_SAMPLES = 200  # Number of recent firing delays kept for metrics
+
+logger = setup_logger(name="timer_wheel")
+
+
+class Timer:
+    """Handle for a scheduled callback; `cancel()` it to keep it from firing."""
+
+    __slots__ = ("deadline", "tick", "callback", "args", "_wheel")
+
+    def __init__(
+        self,
+        wheel: "TimerWheel",
+        deadline: float,
+        tick: int,
+        callback: Callable[..., Any],
+        args: tuple,
+    ) -> None:
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self._wheel: Optional["TimerWheel"] = wheel
+
+    @property
+    def active(self) -> bool:
+        return self._wheel is not None
+
+    def cancel(self) -> None:
+        if self._wheel is not None:
+            self._wheel._remove(self, cancelled=True)
+
+
+class TimerWheel:
+    """Hashed timing wheel shared by every delayed callback in the bot.
+
+    A timer lands in the slot of the tick it is due on, so scheduling and
+    cancelling are O(1) set operations. One task advances the wheel a slot
+    per TICK while anything is pending, instead of one sleeping task per
+    timer. Coroutine callbacks run as their own tasks so a slow one never
+    holds up the wheel.
+    """
+
+    def __init__(self, tick: float = TICK, slots: int = SLOTS) -> None:
+        self.tick_length = tick
+        self._slots: List[Set[Timer]] = [set() for _ in range(slots)]
+        self._origin: Optional[float] = None
+        self._tick = 0  # Last tick processed
+        self._runner: Optional[asyncio.Task] = None
+        self._callbacks: Set[asyncio.Task] = set()
+        self._late: Deque[float] = deque(maxlen=LATE_SAMPLES)
+        self.pending = 0
+        self.fired = 0
+        self.cancelled = 0
+
+    # ========== SCHEDULING ==========
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any) -> Timer:
+        """Call `callback(*args)` after `delay` seconds; awaitable results are awaited."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._origin is None or not self.pending:
+            self._origin, self._tick = now, 0  # Restart the clock when idle
+
+        deadline = now + max(delay, 0.0)
+        tick = max(math.ceil((deadline - self._origin) / self.tick_length), self._tick + 1)
+        timer = Timer(self, deadline, tick, callback, args)
+        self._slots[tick % len(self._slots)].add(timer)
+        self.pending += 1
+
+        if self._runner is None or self._runner.done():
+            self._runner = loop.create_task(self._run())
+        return timer
+
+    def _remove(self, timer: Timer, cancelled: bool = False) -> None:
+        self._slots[timer.tick % len(self._slots)].discard(timer)
+        timer._wheel = None
+        self.pending -= 1
+        if cancelled:
+            self.cancelled += 1
+
+    # ========== WHEEL ==========
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self.pending:
+            delay = self._origin + (self._tick + 1) * self.tick_length - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            now = loop.time()
+            self._advance(int((now - self._origin) // self.tick_length), now)
+
+    def _advance(self, now_tick: int, now: float) -> None:
+        """Fire everything due up to `now_tick`, visiting each slot at most once."""
+        for tick in range(self._tick + 1, min(now_tick, self._tick + len(self._slots)) + 1):
+            slot = self._slots[tick % len(self._slots)]
+            due = [timer for timer in slot if timer.tick <= now_tick]
+            for timer in due:
+                self._remove(timer)
+                self._fire(timer, now)
+        self._tick = max(self._tick, now_tick)
+
+    def _fire(self, timer: Timer, now: float) -> None:
+        self.fired += 1
+        self._late.append(now - timer.deadline)
+        try:
+            result = timer.callback(*timer.args)
+        except Exception as e:
+            logger.error(f"Timer callback {timer.callback!r} failed: {e}", exc_info=True)
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._callbacks.add(task)
+            task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task) -> None:
+        self._callbacks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Timer callback failed: {task.exception()}", exc_info=task.exception())
+
+    # ========== LIFECYCLE ==========
+    def close(self) -> None:
+        """Drop every pending timer and stop the wheel."""
+        for slot in self._slots:
+            for timer in slot:
+                timer._wheel = None
+            slot.clear()
+        self.pending = 0
+        if self._runner:
+            self._runner.cancel()
+
+    def snapshot(self) -> Dict[str, float]:
+        """Pending timers and how late recent ones fired."""
+        late = list(self._late)
+        return {
+            "pending": self.pending,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+            "running": len(self._callbacks),
+            "avg_late_ms": round(sum(late) / len(late) * 1000, 1) if late else 0.0,
+            "max_late_ms": round(max(late) * 1000, 1) if late else 0.0,
+        }
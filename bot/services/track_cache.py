@@ -0,0 +1,172 @@
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from bot.utils.config import TRACK_CACHE_PATH
+from bot.utils.executors import ExecutorRejected, run_blocking
+from bot.utils.logger import setup_logger
+
+STREAM_EXPIRY_MARGIN = 5 * 60  # Treat stream URLs as stale this long before expiry
+
+STATIC_FIELDS = ("title", "url", "duration", "thumbnail", "author", "author_url")
+STREAM_FIELDS = ("audio_url", "acodec", "abr", "container")  # Change on re-resolve
+_ADDED_COLUMNS = {"acodec": "TEXT", "abr": "REAL", "container": "TEXT"}
+
+_VIDEO_ID_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?(?:.*&)?v=|shorts/|embed/|live/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})"
+)
+_EXPIRE_RE = re.compile(r"[?&/]expire[=/](\d+)")
+
+logger = setup_logger(name="track_cache", log_file="yt-dlp.log")
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Return the canonical YouTube video ID for a URL, if it has one."""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def parse_stream_expiry(audio_url: str) -> Optional[int]:
+    """Return the unix `expire=` timestamp embedded in a googlevideo URL."""
+    match = _EXPIRE_RE.search(audio_url)
+    return int(match.group(1)) if match else None
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how many extractions the cache saved."""
+
+    hits: int = 0  # Served entirely from cache
+    refreshes: int = 0  # Static fields cached, stream URL re-resolved
+    misses: int = 0  # Cold yt-dlp lookup
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.refreshes + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that avoided a cold extraction."""
+        return (self.hits + self.refreshes) / self.lookups if self.lookups else 0.0
+
+
+class TrackCache:
+    """SQLite-backed store of resolved tracks keyed by YouTube video ID.
+
+    Static metadata (title, duration, author, thumbnail) never expires; the
+    signed stream URL and its format are stored alongside the `expire=`
+    timestamp so a stale entry only needs its stream re-resolved.
+    """
+
+    def __init__(self, path: Path = TRACK_CACHE_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tracks (
+                    video_id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    duration INTEGER,
+                    thumbnail TEXT,
+                    author TEXT,
+                    author_url TEXT,
+                    audio_url TEXT NOT NULL,
+                    expires_at INTEGER,
+                    updated_at INTEGER NOT NULL
+                )
+                """
+            )
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(tracks)")}
+            for column, sql_type in _ADDED_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE tracks ADD COLUMN {column} {sql_type}")
+        logger.debug(f"Track cache opened at {path}")
+
+    # ========== SYNC API ==========
+    def _get(self, video_id: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        columns = STATIC_FIELDS + STREAM_FIELDS
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(columns)}, expires_at FROM tracks WHERE video_id = ?",
+                (video_id,),
+            ).fetchone()
+        if not row:
+            return None
+
+        *values, expires_at = row
+        fields = dict(zip(columns, values))
+        fresh = expires_at is None or expires_at - time.time() > STREAM_EXPIRY_MARGIN
+        return fields, fresh
+
+    def _put(self, video_id: str, fields: Dict[str, Any]) -> None:
+        columns = ("video_id",) + STATIC_FIELDS + STREAM_FIELDS + ("expires_at", "updated_at")
+        values = (
+            video_id,
+            *(fields.get(name) for name in STATIC_FIELDS + STREAM_FIELDS),
+            parse_stream_expiry(fields["audio_url"]),
+            int(time.time()),
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO tracks ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                values,
+            )
+
+    def _update_stream(self, video_id: str, stream: Dict[str, Any]) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in STREAM_FIELDS)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE tracks SET {assignments}, expires_at = ?, updated_at = ? "
+                "WHERE video_id = ?",
+                (
+                    *(stream.get(name) for name in STREAM_FIELDS),
+                    parse_stream_expiry(stream["audio_url"]),
+                    int(time.time()),
+                    video_id,
+                ),
+            )
+
+    # ========== ASYNC API ==========
+    # A saturated storage pool makes lookups misses and drops writes; the cache
+    # is an optimization and must not fail the extraction around it
+    async def get(self, video_id: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """Return the cached track fields and whether the stream URL is still fresh."""
+        try:
+            return await run_blocking("storage", self._get, video_id)
+        except ExecutorRejected:
+            self.stats.misses += 1
+            logger.warning("Storage pool saturated, treating track lookup as a miss")
+            return None
+
+    async def put(self, video_id: str, fields: Dict[str, Any]) -> None:
+        """Store the fields of a freshly extracted track."""
+        try:
+            await run_blocking("storage", self._put, video_id, fields)
+        except ExecutorRejected:
+            logger.warning(f"Storage pool saturated, not caching track {video_id}")
+
+    async def update_stream(self, video_id: str, stream: Dict[str, Any]) -> None:
+        """Replace only the stream fields (URL, format, expiry) of a cached track."""
+        try:
+            await run_blocking("storage", self._update_stream, video_id, stream)
+        except ExecutorRejected:
+            logger.warning(f"Storage pool saturated, not caching stream of {video_id}")
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current counters for diagnostics."""
+        return {
+            "hits": self.stats.hits,
+            "refreshes": self.stats.refreshes,
+            "misses": self.stats.misses,
+            "hit_rate": round(self.stats.hit_rate, 3),
+        }
@@ -0,0 +1,159 @@
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+from random import shuffle
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from bot.services.yt_source import Track
+
+_track = itemgetter(0)
+
+
+class TrackQueue:
+    """Deque of tracks with O(1) head/tail operations and a running duration.
+
+    Head pushes and pops, which every played track and loop mode do, stay
+    O(1) at any length. Positional removal (/skip) walks the deque and costs
+    a few microseconds at the per-guild limit. Durations are captured on
+    insert; call `refresh_duration` after a queued track is resolved.
+
+    If set, `listener` is called as `listener(op, *args)` after every
+    mutation, with the same op names and arguments, for journaling.
+    """
+
+    def __init__(self, tracks: Iterable[Track] = ()) -> None:
+        # (track, duration when queued); the stored duration keeps the total
+        # exact when a track resolves in place before `refresh_duration` runs
+        self._entries: Deque[Tuple[Track, int]] = deque()
+        self.total_duration = 0  # Seconds of every queued track with a known duration
+        self.listener: Optional[Callable[..., Any]] = None
+        self._extend(tracks)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[Track]:
+        return map(_track, self._entries)
+
+    @overload
+    def __getitem__(self, index: int) -> Track: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Track]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Track, List[Track]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._entries))
+            return list(map(_track, islice(self._entries, start, max(start, stop), step)))
+        return self._entries[index][0]
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    # ========== HELPERS ==========
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += len(self._entries)
+        if not 0 <= index < len(self._entries):
+            raise IndexError("TrackQueue index out of range")
+        return index
+
+    def _notify(self, op: str, *args: Any) -> None:
+        if self.listener:
+            self.listener(op, *args)
+
+    def _extend(self, tracks: Iterable[Track]) -> List[Track]:
+        added = list(tracks)
+        entries = [(track, track.duration or 0) for track in added]
+        self._entries.extend(entries)
+        self.total_duration += sum(duration for _, duration in entries)
+        return added
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self.total_duration = 0
+
+    # ========== DEQUE API ==========
+    def append(self, track: Track) -> None:
+        self._extend([track])
+        self._notify("extend", [track])
+
+    def appendleft(self, track: Track) -> None:
+        duration = track.duration or 0
+        self._entries.appendleft((track, duration))
+        self.total_duration += duration
+        self._notify("appendleft", track)
+
+    def extend(self, tracks: Iterable[Track]) -> None:
+        added = self._extend(tracks)
+        if added:
+            self._notify("extend", added)
+
+    def popleft(self) -> Track:
+        if not self._entries:
+            raise IndexError("pop from an empty TrackQueue")
+        track, duration = self._entries.popleft()
+        self.total_duration -= duration
+        self._notify("pop", 0)
+        return track
+
+    def clear(self) -> None:
+        self._clear()
+        self._notify("clear")
+
+    # ========== POSITIONAL API ==========
+    def insert(self, index: int, track: Track) -> None:
+        """Insert a track before `index` (clamped to the queue bounds)."""
+        index = max(0, min(index, len(self._entries)))
+        duration = track.duration or 0
+        self._entries.insert(index, (track, duration))
+        self.total_duration += duration
+        self._notify("insert", index, track)
+
+    def pop(self, index: int = -1) -> Track:
+        """Remove and return the track at `index`."""
+        index = self._normalize(index)
+        track, duration = self._entries[index]
+        del self._entries[index]
+        self.total_duration -= duration
+        self._notify("pop", index)
+        return track
+
+    def pop_range(self, start: int, stop: int) -> List[Track]:
+        """Remove and return the tracks in positions [start, stop)."""
+        start, stop, _ = slice(start, stop).indices(len(self._entries))
+        if stop <= start:
+            return []
+
+        self._entries.rotate(-start)
+        entries = [self._entries.popleft() for _ in range(stop - start)]
+        self._entries.rotate(start)
+        self.total_duration -= sum(duration for _, duration in entries)
+        self._notify("pop_range", start, stop)
+        return list(map(_track, entries))
+
+    def shuffle(self) -> None:
+        tracks = list(self)
+        shuffle(tracks)
+        self._clear()
+        self._extend(tracks)
+        self._notify("replace", tracks)
+
+    # ========== DURATIONS ==========
+    def refresh_duration(self, track: Track, within: Optional[int] = None) -> bool:
+        """Re-read a queued track's duration after it was resolved in place.
+
+        Only the first `within` positions are searched when given, which is
+        where prefetched tracks live.
+        """
+        for index, (queued, queued_duration) in enumerate(islice(self._entries, within)):
+            if queued is not track:
+                continue
+            duration = track.duration or 0
+            self.total_duration += duration - queued_duration
+            self._entries[index] = (track, duration)
+            return True
+        return False
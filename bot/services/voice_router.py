@@ -0,0 +1,141 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+import discord
+
+from bot.utils.logger import setup_logger
+
+RATE_WINDOW = 60  # seconds of per-second event counts kept for the rate
+
+VoiceHandler = Callable[
+    [discord.Member, discord.VoiceState, discord.VoiceState], Awaitable[None]
+]
+
+logger = setup_logger(name="voice_router")
+
+
+class _HandlerStats:
+    """Call count and timing of one handler."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class VoiceRouter:
+    """Single entry point for voice state updates, routed by channel ID.
+
+    Subsystems register a handler under a name and `watch` the channels they
+    care about. An update is passed only to handlers watching the channel a
+    member left or joined, so joins and leaves elsewhere, and mute or deafen
+    changes anywhere, cost one dictionary lookup.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, VoiceHandler] = {}
+        self._watchers: Dict[int, Set[str]] = {}  # channel_id -> handler names
+        self._stats: Dict[str, _HandlerStats] = {}
+        self._seconds: Deque[List[int]] = deque()  # [second, events]
+        self.events = 0
+        self.routed = 0
+
+    # ========== REGISTRATION ==========
+    def add_handler(self, name: str, handler: VoiceHandler) -> None:
+        self._handlers[name] = handler
+        self._stats.setdefault(name, _HandlerStats())
+
+    def remove_handler(self, name: str) -> None:
+        """Drop a handler along with every channel it watches."""
+        self._handlers.pop(name, None)
+        for channel_id in list(self._watchers):
+            self.unwatch(name, channel_id)
+
+    def watch(self, name: str, channel_id: int) -> None:
+        self._watchers.setdefault(channel_id, set()).add(name)
+
+    def unwatch(self, name: str, channel_id: Optional[int]) -> None:
+        names = self._watchers.get(channel_id)
+        if names is None:
+            return
+        names.discard(name)
+        if not names:
+            del self._watchers[channel_id]
+
+    # ========== DISPATCH ==========
+    def _count_event(self) -> None:
+        self.events += 1
+        second = int(time.monotonic())
+        if self._seconds and self._seconds[-1][0] == second:
+            self._seconds[-1][1] += 1
+        else:
+            self._seconds.append([second, 1])
+        while self._seconds[0][0] <= second - RATE_WINDOW:
+            self._seconds.popleft()
+
+    async def _call(
+        self,
+        name: str,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ) -> None:
+        stats = self._stats[name]
+        start = time.perf_counter()
+        try:
+            await self._handlers[name](member, before, after)
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"Voice handler '{name}' failed: {e}", exc_info=True)
+        finally:
+            stats.record(time.perf_counter() - start)
+
+    async def dispatch(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ) -> None:
+        """Pass a voice state update to the handlers watching either channel."""
+        self._count_event()
+        before_id = before.channel.id if before.channel else None
+        after_id = after.channel.id if after.channel else None
+        if before_id == after_id:
+            return  # Mute, deafen, stream or video change; nobody tracks those
+
+        names = self._watchers.get(before_id, set()) | self._watchers.get(after_id, set())
+        names &= self._handlers.keys()
+        if not names:
+            return
+
+        self.routed += 1
+        await asyncio.gather(*(self._call(name, member, before, after) for name in names))
+
+    # ========== DIAGNOSTICS ==========
+    def snapshot(self) -> Dict[str, object]:
+        """Event rate, routing counts and per-handler timings."""
+        now = int(time.monotonic())
+        recent = sum(count for second, count in self._seconds if second > now - RATE_WINDOW)
+        return {
+            "events": self.events,
+            "routed": self.routed,
+            "per_second": round(recent / RATE_WINDOW, 2),
+            "watched": len(self._watchers),
+            "handlers": {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "avg_ms": round(stats.total / stats.calls * 1000, 1) if stats.calls else 0.0,
+                    "max_ms": round(stats.max * 1000, 1),
+                }
+                for name, stats in self._stats.items()
+            },
+        }
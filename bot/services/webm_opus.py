@@ -0,0 +1,309 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import aiohttp
+import discord
+
+from bot.utils.logger import setup_logger
+
+CHUNK_SIZE = 1024 * 1024  # Bytes per HTTP range request
+BUFFER_PACKETS = 500  # Opus packets (20ms each) buffered ahead of the voice client
+READ_TIMEOUT = 10  # seconds the voice thread waits for data before ending playback
+MAX_RETRIES = 5  # Consecutive failed range requests before giving up
+RETRY_DELAY_MAX = 5  # seconds, matches FFmpeg's -reconnect_delay_max
+FRAME_SAMPLES = 960  # 20ms at 48kHz, the only frame size Discord accepts as is
+
+# EBML / Matroska element IDs
+_EBML = 0x1A45DFA3
+_SEGMENT = 0x18538067
+_CLUSTER = 0x1F43B675
+_TRACKS = 0x1654AE6B
+_TRACK_ENTRY = 0xAE
+_TRACK_NUMBER = 0xD7
+_CODEC_ID = 0x86
+_BLOCK_GROUP = 0xA0
+_BLOCK = 0xA1
+_SIMPLE_BLOCK = 0xA3
+
+_MASTERS = {_SEGMENT, _CLUSTER, _TRACKS, _TRACK_ENTRY, _BLOCK_GROUP}  # Descended into
+_LEAVES = {_TRACK_NUMBER, _CODEC_ID, _BLOCK, _SIMPLE_BLOCK}  # Read whole
+_UNKNOWN_SIZE = -1
+
+logger = setup_logger(name="webm_opus", log_file="yt-dlp.log")
+
+
+class DemuxError(ValueError):
+    """Raised when a stream is not WebM with a usable Opus track."""
+
+
+def _read_vint(data: bytearray, pos: int, keep_marker: bool) -> Optional[Tuple[int, int]]:
+    """Read an EBML variable-length integer, returning (value, length)."""
+    if pos >= len(data):
+        return None
+    first = data[pos]
+    length = 1
+    while length <= 8 and not first & (0x80 >> (length - 1)):
+        length += 1
+    if length > 8:
+        raise DemuxError("Invalid EBML variable-length integer")
+    if pos + length > len(data):
+        return None
+
+    value = first if keep_marker else first & (0xFF >> length)
+    for byte in data[pos + 1 : pos + length]:
+        value = (value << 8) | byte
+    if not keep_marker and value == (1 << (7 * length)) - 1:
+        value = _UNKNOWN_SIZE
+    return value, length
+
+
+def opus_packet_samples(packet: bytes) -> int:
+    """Number of 48kHz samples encoded in an Opus packet, from its TOC byte."""
+    toc = packet[0]
+    config = toc >> 3
+    if config < 12:
+        frame = (480, 960, 1920, 2880)[config % 4]
+    elif config < 16:
+        frame = (480, 960)[config % 2]
+    else:
+        frame = (120, 240, 480, 960)[config % 4]
+
+    code = toc & 0x03
+    if code == 0:
+        count = 1
+    elif code in (1, 2):
+        count = 2
+    else:
+        count = packet[1] & 0x3F if len(packet) > 1 else 0
+    return frame * count
+
+
+class WebMDemuxer:
+    """Incremental Matroska parser that yields the Opus packets of a WebM stream.
+
+    Bytes are fed in arbitrary chunks; only elements needed to find the Opus
+    track and its blocks are buffered, everything else is skipped in place.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._skip = 0
+        self._entry: Dict[int, object] = {}
+        self.track_number: Optional[int] = None
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Consume more of the stream and return the packets completed by it."""
+        self._buffer += data
+        buffer = self._buffer
+        packets: List[bytes] = []
+        pos = 0
+
+        while True:
+            if self._skip:
+                skipped = min(self._skip, len(buffer) - pos)
+                pos += skipped
+                self._skip -= skipped
+                if self._skip:
+                    break
+
+            element_id = _read_vint(buffer, pos, keep_marker=True)
+            if element_id is None:
+                break
+            size = _read_vint(buffer, pos + element_id[1], keep_marker=False)
+            if size is None:
+                break
+            (element, id_length), (size, size_length) = element_id, size
+            header = id_length + size_length
+
+            if element in _MASTERS:
+                # Children follow the header directly, so a flat walk suffices
+                if element == _TRACK_ENTRY:
+                    self._entry = {}
+                elif element == _CLUSTER and self.track_number is None:
+                    raise DemuxError("No Opus track found before the first cluster")
+                pos += header
+                continue
+
+            if size == _UNKNOWN_SIZE:
+                raise DemuxError(f"Unknown-size element {element:#x}")
+            if element == _EBML or element not in _LEAVES:
+                pos += header
+                self._skip = size
+                continue
+            if pos + header + size > len(buffer):
+                break
+
+            payload = bytes(buffer[pos + header : pos + header + size])
+            pos += header + size
+            if element in (_SIMPLE_BLOCK, _BLOCK):
+                packets.extend(self._block_frames(payload))
+            else:
+                self._entry[element] = payload
+                self._check_entry()
+
+        del buffer[:pos]
+        return packets
+
+    def _check_entry(self) -> None:
+        number, codec = self._entry.get(_TRACK_NUMBER), self._entry.get(_CODEC_ID)
+        if number is not None and codec is not None and self.track_number is None:
+            if codec.rstrip(b"\0") == b"A_OPUS":
+                self.track_number = int.from_bytes(number, "big")
+
+    def _block_frames(self, block: bytes) -> List[bytes]:
+        """Split a (Simple)Block of the Opus track into its laced frames."""
+        data = bytearray(block)
+        track = _read_vint(data, 0, keep_marker=False)
+        if track is None or track[0] != self.track_number:
+            return []
+        pos = track[1] + 3  # Track number, int16 timecode, flags
+        lacing = (data[pos - 1] >> 1) & 0x03
+        if lacing == 0:
+            return [block[pos:]]
+
+        count = data[pos] + 1
+        pos += 1
+        sizes: List[int] = []
+        if lacing == 1:  # Xiph
+            for _ in range(count - 1):
+                size = 0
+                while data[pos] == 255:
+                    size += 255
+                    pos += 1
+                size += data[pos]
+                pos += 1
+                sizes.append(size)
+        elif lacing == 3:  # EBML
+            first, length = _read_vint(data, pos, keep_marker=False)
+            pos += length
+            sizes.append(first)
+            for _ in range(count - 2):
+                delta, length = _read_vint(data, pos, keep_marker=False)
+                pos += length
+                sizes.append(sizes[-1] + delta - ((1 << (7 * length - 1)) - 1))
+        else:  # Fixed
+            sizes = [(len(block) - pos) // count] * (count - 1)
+
+        frames = []
+        for size in sizes:
+            frames.append(block[pos : pos + size])
+            pos += size
+        frames.append(block[pos:])
+        return frames
+
+
+class WebMOpusSource(discord.AudioSource):
+    """Audio source that demuxes Opus packets from a WebM URL without FFmpeg.
+
+    A task on the bot's event loop downloads the stream with HTTP range
+    requests and buffers packets; the voice thread pops one per `read()`.
+    """
+
+    def __init__(self, url: str, session: aiohttp.ClientSession) -> None:
+        self.url = url
+        self._session = session
+        self._demuxer = WebMDemuxer()
+        self._packets: Deque[bytes] = deque()
+        self._ready = threading.Condition()
+        self._room = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._offset = 0
+        self._length: Optional[int] = None
+        self._finished = False
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def open(cls, url: str, session: aiohttp.ClientSession) -> "WebMOpusSource":
+        """Start streaming, raising DemuxError if the URL is not 20ms-framed WebM/Opus."""
+        source = cls(url, session)
+        while not source._packets:
+            if source._finished:
+                raise DemuxError("Stream ended before the first Opus packet")
+            await source._fetch_range()
+
+        samples = opus_packet_samples(source._packets[0])
+        if samples != FRAME_SAMPLES:
+            raise DemuxError(f"Opus frames are {samples} samples, expected {FRAME_SAMPLES}")
+        source._task = asyncio.create_task(source._pump())
+        return source
+
+    async def _fetch_range(self) -> None:
+        """Download and demux the next chunk of the stream."""
+        end = self._offset + CHUNK_SIZE - 1
+        if self._length is not None:
+            end = min(end, self._length - 1)
+        async with self._session.get(
+            self.url, headers={"Range": f"bytes={self._offset}-{end}"}
+        ) as response:
+            if response.status == 416:
+                self._finish()
+                return
+            response.raise_for_status()
+            content_range = response.headers.get("Content-Range", "")
+            if "/" in content_range and not content_range.endswith("*"):
+                self._length = int(content_range.rsplit("/", 1)[1])
+
+            async for data in response.content.iter_chunked(64 * 1024):
+                self._offset += len(data)
+                self._push(self._demuxer.feed(data))
+
+        # A 200 means the server ignored the range and sent the whole body
+        if response.status == 200 or (
+            self._length is not None and self._offset >= self._length
+        ):
+            self._finish()
+
+    async def _pump(self) -> None:
+        """Keep the packet buffer filled until the stream ends."""
+        failures = 0
+        try:
+            while not self._finished:
+                while len(self._packets) >= BUFFER_PACKETS:
+                    self._room.clear()
+                    await self._room.wait()
+                try:
+                    await self._fetch_range()
+                    failures = 0
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    failures += 1
+                    if failures > MAX_RETRIES:
+                        raise
+                    logger.warning(f"Range request at {self._offset} failed, retrying: {e}")
+                    await asyncio.sleep(min(2 ** (failures - 1), RETRY_DELAY_MAX))
+        except Exception as e:
+            logger.error(f"WebM stream failed at byte {self._offset}: {e}")
+        finally:
+            self._finish()
+
+    def _push(self, packets: List[bytes]) -> None:
+        if packets:
+            with self._ready:
+                self._packets.extend(packets)
+                self._ready.notify()
+
+    def _finish(self) -> None:
+        with self._ready:
+            self._finished = True
+            self._ready.notify()
+
+    def read(self) -> bytes:
+        """Return the next 20ms Opus packet, or b"" once the stream is over."""
+        with self._ready:
+            if not self._packets and not self._finished:
+                self._ready.wait(READ_TIMEOUT)
+            if not self._packets:
+                return b""
+            packet = self._packets.popleft()
+            low = len(self._packets) < BUFFER_PACKETS // 2
+        if low and not self._room.is_set():
+            self._loop.call_soon_threadsafe(self._room.set)
+        return packet
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        if self._task and not self._task.done():
+            self._loop.call_soon_threadsafe(self._task.cancel)
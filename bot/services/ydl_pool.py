@@ -0,0 +1,108 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+from yt_dlp import YoutubeDL
+
+from bot.utils.logger import setup_logger
+
+MAX_USES_PER_INSTANCE = 200  # Recycle warm instances to bound cookie/cache growth
+
+logger = setup_logger(name="ydl_pool", log_file="yt-dlp.log")
+
+
+@dataclass
+class _PooledYDL:
+    ydl: YoutubeDL
+    uses: int = 0
+    in_use: bool = False
+
+
+class YDLPool:
+    """Per-thread pool of warm `YoutubeDL` instances, one per option profile.
+
+    Each worker thread keeps its own instances, so a checkout never contends
+    with another thread. Instances are discarded after an error or after
+    `MAX_USES_PER_INSTANCE` extractions and rebuilt lazily.
+    """
+
+    def __init__(
+        self,
+        profiles: Dict[str, Dict[str, Any]],
+        max_uses: int = MAX_USES_PER_INSTANCE,
+    ) -> None:
+        self.profiles = profiles
+        self.max_uses = max_uses
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def _slots(self) -> Dict[str, _PooledYDL]:
+        slots = getattr(self._local, "slots", None)
+        if slots is None:
+            slots = self._local.slots = {}
+        return slots
+
+    def _create(self, profile: str) -> YoutubeDL:
+        with self._stats_lock:
+            self.created += 1
+        logger.debug(
+            f"Creating YoutubeDL for profile '{profile}' in {threading.current_thread().name}"
+        )
+        return YoutubeDL(dict(self.profiles[profile]))
+
+    @contextmanager
+    def checkout(self, profile: str) -> Iterator[YoutubeDL]:
+        """Borrow this thread's warm instance for `profile` for one extraction."""
+        slots = self._slots()
+        slot: Optional[_PooledYDL] = slots.get(profile)
+
+        if slot and slot.in_use:
+            # Re-entrant use on the same thread: fall back to a throwaway instance
+            with YoutubeDL(dict(self.profiles[profile])) as ydl:
+                yield ydl
+            return
+
+        if slot is None:
+            slot = slots[profile] = _PooledYDL(self._create(profile))
+        else:
+            with self._stats_lock:
+                self.reused += 1
+
+        slot.in_use = True
+        try:
+            yield slot.ydl
+        except Exception:
+            self._discard(profile)
+            raise
+        else:
+            slot.uses += 1
+            if slot.uses >= self.max_uses:
+                self._discard(profile)
+            else:
+                self._reset(slot.ydl)
+        finally:
+            slot.in_use = False
+
+    @staticmethod
+    def _reset(ydl: YoutubeDL) -> None:
+        """Clear per-run counters so the next request starts from a clean state."""
+        ydl._download_retcode = 0
+        ydl._num_downloads = 0
+        ydl._num_videos = 0
+        ydl._playlist_urls.clear()
+        ydl._printed_messages.clear()
+
+    def _discard(self, profile: str) -> None:
+        slot = self._slots().pop(profile, None)
+        if slot:
+            try:
+                slot.ydl.close()
+            except Exception as e:
+                logger.warning(f"Failed to close YoutubeDL for '{profile}': {e}")
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current counters for diagnostics."""
+        return {"created": self.created, "reused": self.reused}
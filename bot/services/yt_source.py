@@ -1,44 +1,83 @@
 import asyncio
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from itertools import islice
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from yt_dlp import YoutubeDL
-
-from bot.utils.config import MAX_PLAYLIST_FETCH, MAX_QUEUE_LENGTH
+from bot.services.search_cache import SearchCache, normalize_query
+from bot.services.track_cache import (
+    STREAM_FIELDS,
+    TrackCache,
+    extract_video_id,
+    parse_stream_expiry,
+)
+from bot.services.ydl_pool import YDLPool
+from bot.utils.config import (
+    MAX_PLAYLIST_FETCH,
+    MAX_QUEUE_LENGTH,
+    SEARCH_CACHE_PATH,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+)
+from bot.utils.executors import ExecutorRejected, run_blocking
 from bot.utils.logger import setup_logger
+from bot.utils.single_flight import SingleFlight
 
 MAX_SEARCH_RESULTS = 5
+PLAYLIST_CHUNK_SIZE = 50  # Playlist entries handed to consumers at a time
+PLAYLIST_MAX_REDIRECTS = 3  # "url" results followed to reach the actual playlist
 DEFAULT_REQUEST_TIMEOUT = 10
 
 logger = setup_logger(name="yt_source", log_file="yt-dlp.log")
 
 
+def format_duration(total_seconds: float) -> str:
+    """Format seconds as HH:MM:SS or MM:SS."""
+    minutes, seconds = divmod(int(total_seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes}:{seconds:02}"
+
+
 @dataclass
 class Track:
     """Represents an audio track with metadata."""
 
     title: str
     url: str  # Audio page URL
-    audio_url: str  # Direct audio stream
+    audio_url: str  # Direct audio stream, empty until resolved
     duration: Optional[int] = None  # In seconds
     thumbnail: Optional[str] = None
     author: Optional[str] = None
     author_url: Optional[str] = None
+    acodec: Optional[str] = None  # Codec of the selected audio format, e.g. "opus"
+    abr: Optional[float] = None  # Audio bitrate in kbps
+    container: Optional[str] = None  # Container extension, e.g. "webm"
 
     @property
     def formatted_duration(self) -> Optional[str]:
         """Return duration in HH:MM:SS or MM:SS format."""
-        if self.duration:
-            minutes, seconds = divmod(self.duration, 60)
-            hours, minutes = divmod(minutes, 60)
-            return (
-                f"{hours}:{minutes:02}:{seconds:02}"
-                if hours
-                else f"{minutes}:{seconds:02}"
-            )
-        else:
-            return None
+        return format_duration(self.duration) if self.duration else None
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the direct audio stream URL is known."""
+        return bool(self.audio_url)
+
+    @property
+    def stream_fields(self) -> Dict[str, Any]:
+        """The fields that change whenever the stream is re-resolved."""
+        return {name: getattr(self, name) for name in STREAM_FIELDS}
+
+    @property
+    def stream_expires_at(self) -> Optional[int]:
+        """Unix time at which the signed stream URL stops working, if known."""
+        return parse_stream_expiry(self.audio_url) if self.audio_url else None
+
+    def update_from(self, other: "Track") -> None:
+        """Fill this track in place with the fields of a resolved copy."""
+        for name, value in asdict(other).items():
+            if value is not None:
+                setattr(self, name, value)
 
 
 _COOKIES_PATH = Path(__file__).parent.parent.parent / "cookies.txt"
@@ -61,42 +100,78 @@ class TrackFetcher:
         },
     }
 
+    # Option profiles, each backed by its own warm YoutubeDL per worker thread
+    _ydl_profiles: Dict[str, Dict[str, Any]] = {
+        "search": {**_ydl_options, "extract_flat": True},
+        "track": _ydl_options,
+        # Skips the watch page download; only the player API is queried for formats
+        "stream": {
+            **_ydl_options,
+            "extractor_args": {"youtube": {"player_skip": ["webpage"]}},
+        },
+        "playlist": {
+            **_ydl_options,
+            "noplaylist": False,
+            "playlistend": MAX_PLAYLIST_FETCH,
+            "extract_flat": True,
+        },
+    }
+    _ydl_pool = YDLPool(_ydl_profiles)
+
+    _cache: Optional[TrackCache] = None
+    _search_cache: Optional[SearchCache] = None
+    _inflight = SingleFlight()  # Coalesces identical concurrent lookups
+    _playlists: Dict[str, "_PlaylistEnumeration"] = {}  # Enumerations in progress
+
     @classmethod
-    async def __fetch_metadata(
-        cls, query: str, is_playlist: bool = False, full_metadata: bool = True
-    ) -> List[Dict[str, Any]]:
-        """Fetch metadata from YouTube using yt-dlp."""
-        logger.debug(
-            f"Fetching metadata for query: {query}, playlist={is_playlist}, full={full_metadata}"
-        )
-        options = cls._ydl_options.copy()
+    def get_cache(cls) -> TrackCache:
+        """Return the shared on-disk track cache, opening it on first use."""
+        if cls._cache is None:
+            cls._cache = TrackCache()
+        return cls._cache
 
-        if is_playlist:
-            options["noplaylist"] = False
-            options["playlistend"] = MAX_PLAYLIST_FETCH
-            if not full_metadata:
-                options["extract_flat"] = True
+    @classmethod
+    def get_search_cache(cls) -> SearchCache:
+        """Return the shared search result cache, opening it on first use."""
+        if cls._search_cache is None:
+            cls._search_cache = SearchCache(
+                SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL, SEARCH_CACHE_PATH
+            )
+        return cls._search_cache
 
-        if not full_metadata:
-            options["extract_flat"] = True
+    @classmethod
+    def pool_stats(cls) -> Dict[str, int]:
+        """Counters of created vs reused pooled YoutubeDL instances."""
+        return cls._ydl_pool.snapshot()
+
+    @classmethod
+    def coalescing_stats(cls) -> Dict[str, int]:
+        """Counters of lookups performed vs joined while already in flight."""
+        return cls._inflight.snapshot()
+
+    @classmethod
+    async def __fetch_metadata(cls, query: str, profile: str) -> List[Dict[str, Any]]:
+        """Fetch metadata from YouTube using a pooled yt-dlp instance."""
+        logger.debug(f"Fetching metadata for query: {query}, profile={profile}")
 
         def _run() -> List[Dict[str, Any]]:
             try:
-                with YoutubeDL(options) as ydl:
+                with cls._ydl_pool.checkout(profile) as ydl:
                     info = ydl.extract_info(query, download=False)
-                    logger.debug(f"Metadata fetched successfully for: {query}")
-
-                    if is_playlist and "entries" in info:
-                        return [entry for entry in info["entries"] if entry is not None]
-                    elif "entries" in info:
-                        return [entry for entry in info["entries"] if entry is not None]
-                    else:
-                        return [info] if info else []
+                logger.debug(f"Metadata fetched successfully for: {query}")
+
+                if info and "entries" in info:
+                    return [entry for entry in info["entries"] if entry is not None]
+                return [info] if info else []
             except Exception as e:
                 logger.error(f"yt-dlp failed for '{query}': {e}", exc_info=True)
                 return []
 
-        return await asyncio.to_thread(_run)
+        try:
+            return await run_blocking("extract", _run)
+        except ExecutorRejected:
+            logger.warning(f"Extraction pool saturated, dropping query: {query}")
+            return []
 
     @classmethod
     def __create_track_from_data(cls, data: Dict[str, Any]) -> Track:
@@ -120,13 +195,15 @@ class TrackFetcher:
             except (ValueError, TypeError):
                 pass
 
-        # Get the best audio URL
-        audio_url = data.get("url", "")
-        if not audio_url and data.get("formats"):
+        # Get the best audio URL and the format it belongs to
+        audio_format = data
+        if not data.get("url") and data.get("formats"):
             # Find best audio format
             audio_formats = [f for f in data["formats"] if f.get("acodec") != "none"]
             if audio_formats:
-                audio_url = audio_formats[0].get("url", "")
+                audio_format = audio_formats[0]
+        audio_url = audio_format.get("url", "")
+        acodec = audio_format.get("acodec")
 
         track = Track(
             title=data.get("title", "Unknown Title"),
@@ -136,6 +213,9 @@ class TrackFetcher:
             thumbnail=data.get("thumbnail"),
             author=data.get("uploader", data.get("channel")),
             author_url=author_url,
+            acodec=acodec if acodec and acodec != "none" else None,
+            abr=audio_format.get("abr"),
+            container=audio_format.get("ext"),
         )
         logger.debug(f"Track created: {track.title} [{track.formatted_duration}]")
         return track
@@ -145,9 +225,25 @@ class TrackFetcher:
         cls, name: str, max_results: int = MAX_SEARCH_RESULTS
     ) -> Dict[str, str]:
         """Search for tracks by name and return a dict of title: url."""
+        cache_key = f"{max_results}:{normalize_query(name)}"
+        results = await cls._inflight.do(
+            ("search", cache_key), lambda: cls.__search(name, max_results, cache_key)
+        )
+        return dict(results)
+
+    @classmethod
+    async def __search(
+        cls, name: str, max_results: int, cache_key: str
+    ) -> Dict[str, str]:
+        """Run a search through the search cache and yt-dlp."""
+        search_cache = cls.get_search_cache()
+        if (cached := await search_cache.get(cache_key)) is not None:
+            logger.debug(f"Search cache hit for '{name}'")
+            return cached
+
         logger.debug(f"Searching for track by name: '{name}' (max {max_results})")
         query = f"ytsearch{max_results}:{name}"
-        results = await cls.__fetch_metadata(query, full_metadata=False)
+        results = await cls.__fetch_metadata(query, "search")
         if not results:
             logger.warning(f"No matches for search: {name}")
             return {}
@@ -161,13 +257,41 @@ class TrackFetcher:
                     valid_results[title] = url
 
         logger.debug(f"Found {len(valid_results)} result(s) for '{name}'")
+        if valid_results:
+            await search_cache.put(cache_key, valid_results)
         return valid_results
 
     @classmethod
     async def fetch_track_by_url(cls, url: str) -> Optional[Track]:
-        """Fetch full track metadata by URL."""
+        """Fetch full track metadata by URL, served from the track cache when possible."""
+        key = ("track", extract_video_id(url) or url)
+        track = await cls._inflight.do(key, lambda: cls.__load_track(url))
+        # Every caller gets its own copy since tracks are updated in place
+        return replace(track) if track else None
+
+    @classmethod
+    async def __load_track(cls, url: str) -> Optional[Track]:
+        """Load a track from the track cache or a full extraction."""
+        cache = cls.get_cache()
+        video_id = extract_video_id(url)
+
+        if video_id and (cached := await cache.get(video_id)):
+            fields, fresh = cached
+            if fresh:
+                cache.stats.hits += 1
+                logger.debug(f"Track cache hit for {video_id}")
+                return Track(**fields)
+
+            logger.debug(f"Stream URL expired for {video_id}, re-resolving")
+            if fresh_track := await cls.__resolve_stream(url):
+                cache.stats.refreshes += 1
+                stream = fresh_track.stream_fields
+                await cache.update_stream(video_id, stream)
+                return Track(**{**fields, **stream})
+
+        cache.stats.misses += 1
         logger.debug(f"Fetching track metadata from URL: {url}")
-        results = await cls.__fetch_metadata(url, full_metadata=True)
+        results = await cls.__fetch_metadata(url, "track")
         if not results:
             logger.warning(f"No metadata returned for URL: {url}")
             return None
@@ -178,25 +302,203 @@ class TrackFetcher:
             return None
 
         logger.debug(f"Metadata received for URL: {url}, creating Track")
-        return cls.__create_track_from_data(entry)
+        track = cls.__create_track_from_data(entry)
+
+        video_id = video_id or (
+            entry.get("id") if entry.get("extractor_key") == "Youtube" else None
+        )
+        if video_id and track.audio_url:
+            await cache.put(video_id, asdict(track))
+        return track
 
     @classmethod
-    async def fetch_playlist(cls, playlist_url: str) -> AsyncGenerator[str, None]:
-        """Async generator yielding track URLs from a playlist as soon as they're fetched."""
-        logger.debug(f"Fetching playlist from URL: {playlist_url}")
-        entries = await cls.__fetch_metadata(
-            playlist_url, is_playlist=True, full_metadata=False
+    async def __resolve_stream(cls, url: str) -> Optional[Track]:
+        """Re-resolve an already known track for its direct audio URL and format."""
+        results = await cls._inflight.do(
+            ("stream", extract_video_id(url) or url),
+            lambda: cls.__fetch_metadata(url, "stream"),
         )
+        if not results or results[0].get("is_unavailable"):
+            return None
+        track = cls.__create_track_from_data(results[0])
+        return track if track.audio_url else None
+
+    @classmethod
+    def __create_stub_from_entry(cls, entry: Dict[str, Any]) -> Track:
+        """Create an unresolved Track from a flat playlist entry."""
+        url = entry["url"]
+        if not url.startswith("http"):
+            url = f"https://www.youtube.com/watch?v={entry.get('id', entry['url'])}"
+
+        duration = None
+        if entry.get("duration"):
+            try:
+                duration = int(float(entry["duration"]))
+            except (ValueError, TypeError):
+                pass
+
+        thumbnails = entry.get("thumbnails") or []
+        return Track(
+            title=entry.get("title") or url,
+            url=url,
+            audio_url="",
+            duration=duration,
+            thumbnail=thumbnails[-1].get("url") if thumbnails else None,
+            author=entry.get("channel", entry.get("uploader")),
+            author_url=entry.get("channel_url", entry.get("uploader_url")),
+        )
+
+    @classmethod
+    async def resolve_track(cls, track: Track) -> bool:
+        """Resolve full metadata and the audio URL of a stub in place."""
+        if track.is_resolved:
+            return True
+        resolved = await cls.fetch_track_by_url(track.url)
+        if not resolved:
+            return False
+        track.update_from(resolved)
+        return True
+
+    @classmethod
+    async def refresh_stream(cls, track: Track) -> bool:
+        """Re-resolve the stream URL of a resolved track in place."""
+        logger.debug(f"Refreshing stream URL for: {track.title}")
+        fresh_track = await cls.__resolve_stream(track.url)
+        if not fresh_track:
+            logger.warning(f"Failed to refresh stream URL for: {track.url}")
+            return False
+
+        stream = fresh_track.stream_fields
+        for name, value in stream.items():
+            setattr(track, name, value)
+        if video_id := extract_video_id(track.url):
+            await cls.get_cache().update_stream(video_id, stream)
+        return True
+
+    @classmethod
+    def __start_playlist_enumeration(cls, playlist_url: str) -> "_PlaylistEnumeration":
+        """Enumerate a playlist lazily in the extract pool, publishing chunks as they load."""
+        enumeration = _PlaylistEnumeration()
+        loop = asyncio.get_running_loop()
 
-        if not entries:
+        def _run() -> None:
+            try:
+                with cls._ydl_pool.checkout("playlist") as ydl:
+                    # process=False keeps "entries" a lazy generator over playlist pages,
+                    # but leaves redirects (youtu.be/ID?list=, watch?list=) to follow by hand
+                    info = ydl.extract_info(playlist_url, download=False, process=False)
+                    for _ in range(PLAYLIST_MAX_REDIRECTS):
+                        if not info or info.get("_type") not in ("url", "url_transparent"):
+                            break
+                        info = ydl.extract_info(
+                            info["url"], ie_key=info.get("ie_key"), download=False, process=False
+                        )
+                    chunk: List[Dict[str, Any]] = []
+                    for entry in islice((info or {}).get("entries") or [], MAX_PLAYLIST_FETCH):
+                        if enumeration.stopped:
+                            logger.debug(f"Playlist abandoned, stopping: {playlist_url}")
+                            return
+                        if entry and "url" in entry:
+                            chunk.append(entry)
+                        if len(chunk) >= PLAYLIST_CHUNK_SIZE:
+                            loop.call_soon_threadsafe(enumeration.publish, chunk)
+                            chunk = []
+                    if chunk:
+                        loop.call_soon_threadsafe(enumeration.publish, chunk)
+            except Exception as e:
+                logger.error(f"yt-dlp failed for '{playlist_url}': {e}", exc_info=True)
+            finally:
+                loop.call_soon_threadsafe(enumeration.finish)
+
+        async def _produce() -> None:
+            try:
+                await run_blocking("extract", _run)
+            except ExecutorRejected:
+                logger.warning(f"Extraction pool saturated, dropping playlist: {playlist_url}")
+                enumeration.finish()
+            except asyncio.CancelledError:
+                enumeration.stop()
+                raise
+            finally:
+                if cls._playlists.get(playlist_url) is enumeration:
+                    del cls._playlists[playlist_url]
+
+        enumeration.task = asyncio.create_task(_produce())
+        return enumeration
+
+    @classmethod
+    async def fetch_playlist(
+        cls, playlist_url: str
+    ) -> AsyncGenerator[List[Track], None]:
+        """Async generator yielding chunks of unresolved Track stubs as pages load.
+
+        Concurrent requests for the same playlist share one enumeration.
+        """
+        logger.debug(f"Fetching playlist from URL: {playlist_url}")
+        enumeration = cls._playlists.get(playlist_url)
+        if enumeration is None or enumeration.stopped:
+            cls._inflight.calls += 1
+            enumeration = cls._playlists[playlist_url] = (
+                cls.__start_playlist_enumeration(playlist_url)
+            )
+        else:
+            cls._inflight.coalesced += 1
+
+        yielded = 0
+        async for chunk in enumeration.chunks():
+            yielded += len(chunk)
+            logger.debug(f"Yielding {len(chunk)} track stub(s) from: {playlist_url}")
+            yield [cls.__create_stub_from_entry(entry) for entry in chunk]
+
+        if not yielded:
             logger.warning(f"Empty or invalid playlist: {playlist_url}")
-            return
-
-        logger.debug(f"Yielding {len(entries)} track(s) from playlist: {playlist_url}")
-        for entry in entries:
-            if entry and "url" in entry:
-                url = entry["url"]
-                if not url.startswith("http"):
-                    url = f"https://www.youtube.com/watch?v={entry.get('id', entry['url'])}"
-                logger.debug(f"Yielding track URL: {url}")
-                yield url
+
+
+class _PlaylistEnumeration:
+    """Entries of a playlist being enumerated, readable by any number of consumers."""
+
+    def __init__(self) -> None:
+        self.entries: List[Dict[str, Any]] = []
+        self.done = False
+        self.stopped = False  # Read by the enumerating thread between entries
+        self.readers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def _notify(self) -> None:
+        self._changed.set_result(None)
+        self._changed = asyncio.get_running_loop().create_future()
+
+    def publish(self, chunk: List[Dict[str, Any]]) -> None:
+        self.entries.extend(chunk)
+        self._notify()
+
+    def finish(self) -> None:
+        if not self.done:
+            self.done = True
+            self._notify()
+
+    def stop(self) -> None:
+        """Ask the enumerating thread to stop walking playlist pages."""
+        self.stopped = True
+        self.finish()
+
+    async def chunks(self) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Yield entries published so far, then each new chunk until finished."""
+        position = 0
+        self.readers += 1
+        try:
+            while True:
+                if position < len(self.entries):
+                    chunk = self.entries[position:]
+                    position += len(chunk)
+                    yield chunk
+                elif self.done:
+                    return
+                else:
+                    # Shield so a cancelled consumer does not cancel the shared future
+                    await asyncio.shield(self._changed)
+        finally:
+            self.readers -= 1
+            if not self.readers and not self.done:
+                self.stop()  # Every consumer left; don't keep fetching pages for nobody
@@ -1,6 +1,7 @@
 """Configuration settings loaded from environment variables."""
 
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -12,5 +13,45 @@ if not DISCORD_TOKEN:
 
 GENIUS_API_KEY: str | None = os.environ.get("GENIUS_API_KEY")
 
-MAX_QUEUE_LENGTH: int = 50  # Limit for Discord bot queue
+MAX_QUEUE_LENGTH: int = int(os.environ.get("MAX_QUEUE_LENGTH", 5000))  # Per-guild queue limit
 MAX_PLAYLIST_FETCH: int = 500  # Limit for yt-dlp playlist metadata fetching
+PREFETCH_AHEAD: int = int(
+    os.environ.get("PREFETCH_AHEAD", 3)
+)  # Queued tracks resolved ahead of playback
+PLAYLIST_RESOLVE_CONCURRENCY: int = int(
+    os.environ.get("PLAYLIST_RESOLVE_CONCURRENCY", 4)
+)  # Queued tracks resolved in parallel per guild
+
+DATA_DIR: Path = Path(
+    os.environ.get("DATA_DIR", Path(__file__).parent.parent / "data")
+)  # Persistent caches and state
+TRACK_CACHE_PATH: Path = DATA_DIR / "tracks.sqlite3"
+
+SEARCH_CACHE_SIZE: int = int(os.environ.get("SEARCH_CACHE_SIZE", 1024))
+SEARCH_CACHE_TTL: int = int(os.environ.get("SEARCH_CACHE_TTL", 6 * 60 * 60))  # seconds
+SEARCH_CACHE_PATH: Path | None = (
+    DATA_DIR / "searches.sqlite3"
+    if os.environ.get("SEARCH_CACHE_PERSIST", "1") != "0"
+    else None
+)
+
+LYRICS_CACHE_PATH: Path = DATA_DIR / "lyrics.sqlite3"
+LYRICS_CACHE_TTL: int = int(os.environ.get("LYRICS_CACHE_TTL", 30 * 24 * 60 * 60))  # seconds
+LYRICS_MISS_TTL: int = int(
+    os.environ.get("LYRICS_MISS_TTL", 24 * 60 * 60)
+)  # seconds a "not found" is remembered
+
+AUDIO_CACHE_DIR: Path = DATA_DIR / "audio"
+AUDIO_CACHE_MAX_BYTES: int = (
+    int(os.environ.get("AUDIO_CACHE_MAX_MB", 0)) * 1024 * 1024
+)  # Local Ogg/Opus copies of played tracks, 0 disables
+
+WEBM_PASSTHROUGH: bool = (
+    os.environ.get("WEBM_PASSTHROUGH", "1") != "0"
+)  # Demux WebM/Opus in-process instead of spawning FFmpeg
+DISCORD_FFMPEG_OPTIONS: dict[str, str] = {
+    "before_options": "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5",
+    "options": "-vn",
+}
+
+PLAYER_STATE_PATH: Path = DATA_DIR / "players.sqlite3"  # Queues restored after restart
@@ -0,0 +1,120 @@
+"""Named, bounded thread pools for blocking work."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Tuple, TypeVar
+
+from bot.utils.logger import setup_logger
+
+T = TypeVar("T")
+
+# name: (max_workers, max_queued)
+EXECUTOR_SIZES: Dict[str, Tuple[int, int]] = {
+    "extract": (8, 64),  # yt-dlp extraction
+    "http-sync": (4, 32),  # Synchronous HTTP clients
+    "render": (2, 16),  # CPU-bound image rendering (cairosvg)
+    "storage": (2, 256),  # Local SQLite / file access
+}
+WAIT_SAMPLES = 200  # Number of recent queue waits kept for metrics
+
+logger = setup_logger(name="executors")
+
+
+class ExecutorRejected(RuntimeError):
+    """Raised when a pool's queue is full and new work is refused."""
+
+
+class BoundedExecutor:
+    """Thread pool that refuses work beyond a fixed queue depth and tracks its load."""
+
+    def __init__(self, name: str, max_workers: int, max_queued: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-worker"
+        )
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run `func` in this pool, raising ExecutorRejected if it is saturated."""
+        with self._lock:
+            if self.queued >= self.max_queued:
+                self.rejected += 1
+                logger.warning(f"Executor '{self.name}' rejected work: queue full")
+                raise ExecutorRejected(f"Executor '{self.name}' is saturated")
+            self.queued += 1
+
+        submitted = time.monotonic()
+        started = False
+
+        def _call() -> T:
+            nonlocal started
+            with self._lock:
+                started = True
+                self.queued -= 1
+                self.active += 1
+                self._waits.append(time.monotonic() - submitted)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+
+        def _release_if_unstarted(_: Future) -> None:
+            # A caller cancelled while its job still waited never reaches _call
+            with self._lock:
+                if not started:
+                    self.queued -= 1
+
+        try:
+            future = self._executor.submit(_call)
+        except RuntimeError:  # Pool already shut down
+            with self._lock:
+                self.queued -= 1
+            raise
+        future.add_done_callback(_release_if_unstarted)
+        return await asyncio.wrap_future(future)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current load and queue wait statistics."""
+        with self._lock:
+            waits = list(self._waits)
+            return {
+                "workers": self.max_workers,
+                "active": self.active,
+                "queued": self.queued,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "max_wait_ms": round(max(waits) * 1000, 1) if waits else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+EXECUTORS: Dict[str, BoundedExecutor] = {
+    name: BoundedExecutor(name, workers, queued)
+    for name, (workers, queued) in EXECUTOR_SIZES.items()
+}
+
+
+async def run_blocking(pool: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable in the named executor."""
+    return await EXECUTORS[pool].run(func, *args, **kwargs)
+
+
+def shutdown_executors() -> None:
+    """Stop all pools without waiting for queued work."""
+    for executor in EXECUTORS.values():
+        executor.shutdown()
@@ -0,0 +1,41 @@
+"""In-flight deduplication of identical async lookups."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result.
+
+    Results and exceptions are delivered to every waiter but never cached: the
+    key is released as soon as the call finishes.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0  # Calls that did the work
+        self.coalesced = 0  # Calls that joined an in-flight call
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await `func()` or join the in-flight call already running for `key`."""
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        # Shield so one cancelled waiter does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters for diagnostics."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }